@@ -1,3 +1,3 @@
-from . import applications, auth, bounties, webhooks
+from . import applications, auth, bounties, metrics, webhooks
 
-__all__ = ["applications", "auth", "bounties", "webhooks"]
+__all__ = ["applications", "auth", "bounties", "metrics", "webhooks"]
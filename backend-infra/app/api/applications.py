@@ -2,21 +2,26 @@ from __future__ import annotations
 
 import uuid
 
-import asyncio
 import base64
 import binascii
+import logging
 from decimal import Decimal
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Path, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response, status
+from sqlalchemy import or_, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.dependencies import get_db_session
+from app.config import get_settings
+from app.dependencies import get_current_wallet, get_db_session
 from app.models import (
+    Account,
     AccountRole,
     Application,
     ApplicationPrivateVersion,
+    ApplicationStatus,
     Bounty,
     Deposit,
     DepositStatus,
@@ -28,46 +33,45 @@ from app.schemas import (
     ApplicationResponse,
     DepositCreate,
     DepositResponse,
+    PrivateUploadComplete,
+    PrivateUploadCreate,
+    PrivateUploadSession,
+    PrivateUrl,
+    PrivateUrlsRequest,
+    PrivateVersionResponse,
     SampleResumeResponse,
 )
-from app.services.accounts import get_or_create_account
-from app.services.storage import get_private_storage_service
+from app.services.accounts import get_or_create_account_id, get_or_create_account_ids
+from app.services.blobs import (
+    BlobClaim,
+    BlobUpload,
+    claim_blob,
+    find_stored_blob,
+    mark_blob_stored,
+    read_private_payload,
+    release_blob,
+)
+from app.services.compression import (
+    IDENTITY,
+    RawTally,
+    compress_stream,
+    configured_encoding,
+    encode_payload,
+    http_content_encoding,
+)
+from app.services.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.services.storage import PayloadTooLarge, PrivateStorage, get_private_storage_service
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
+logger = logging.getLogger(__name__)
+
 
 @router.post("", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
 async def create_application(
     payload: ApplicationCreate, session: AsyncSession = Depends(get_db_session)
 ):
-    bounty = await session.get(Bounty, payload.bounty_id)
-    if bounty is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="bounty not found")
-
-    applicant_account = await get_or_create_account(
-        session=session,
-        wallet=payload.applicant_wallet,
-        role=AccountRole.CANDIDATE,
-    )
-
-    if payload.referrer_wallet:
-        await get_or_create_account(
-            session=session,
-            wallet=payload.referrer_wallet,
-            role=AccountRole.REFERRER,
-        )
-
-    public_profile = payload.public_profile.model_dump()
-
-    application = Application(
-        bounty_id=bounty.id,
-        applicant_wallet=payload.applicant_wallet,
-        referrer_wallet=payload.referrer_wallet,
-        public_profile=public_profile,
-    )
-    session.add(application)
-    await session.flush()
-
+    private_bytes: Optional[bytes] = None
     if payload.private_payload_base64:
         try:
             private_bytes = base64.b64decode(payload.private_payload_base64)
@@ -76,34 +80,183 @@ async def create_application(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="invalid private payload"
             ) from exc
 
-        storage = get_private_storage_service()
-        version_id = uuid.uuid4()
-        key = storage.build_private_key(application.id, version_id)
-        payload_sha256 = storage.compute_sha256(private_bytes)
-        await asyncio.to_thread(storage.put_object, key, private_bytes)
-
-        private_version = ApplicationPrivateVersion(
-            id=version_id,
-            application_id=application.id,
-            s3_key=key,
-            payload_sha256=payload_sha256,
-            uploaded_by_id=applicant_account.id,
+    bounty_id = await session.scalar(select(Bounty.id).where(Bounty.id == payload.bounty_id))
+    if bounty_id is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="bounty not found")
+
+    storage = get_private_storage_service()
+    claim: Optional[BlobClaim] = None
+    if private_bytes is not None:
+        claim = await claim_blob(session, storage.compute_sha256(private_bytes), len(private_bytes))
+
+    # The object store upload happens between two short transactions so a slow
+    # bucket never pins a pooled connection. Ending the first transaction hands
+    # the connection back; the write transaction below checks out a fresh one.
+    await session.commit()
+
+    upload: Optional[BlobUpload] = None
+    if claim is not None and not claim.stored:
+        encoded = encode_payload(private_bytes)
+        upload = BlobUpload(
+            s3_key=storage.build_blob_key(claim.sha256),
+            content_encoding=encoded.encoding,
+            stored_sha256=encoded.sha256,
+            stored_size_bytes=len(encoded.content),
+        )
+        try:
+            await storage.put_object(
+                upload.s3_key,
+                encoded.content,
+                content_encoding=http_content_encoding(encoded.encoding),
+            )
+        except BaseException:
+            await _release_blob_claim(session, claim.sha256)
+            raise
+
+    application_id = uuid.uuid4()
+    try:
+        # Applicant and referrer resolve in one round trip (none when both are cached).
+        wallets = {payload.applicant_wallet: AccountRole.CANDIDATE}
+        if payload.referrer_wallet:
+            wallets.setdefault(payload.referrer_wallet, AccountRole.REFERRER)
+        account_ids = await get_or_create_account_ids(session, wallets)
+        applicant_account_id = account_ids[payload.applicant_wallet.strip()]
+
+        application = Application(
+            id=application_id,
+            bounty_id=bounty_id,
+            applicant_wallet=payload.applicant_wallet,
+            referrer_wallet=payload.referrer_wallet,
+            public_profile=payload.public_profile.model_dump(),
         )
-        session.add(private_version)
+        session.add(application)
         await session.flush()
-        application.private_current_version_id = private_version.id
 
-    await session.commit()
+        canonical_key: Optional[str] = None
+        if claim is not None:
+            version_id = uuid.uuid4()
+            private_version = await _add_private_version(
+                session, application.id, version_id, claim, upload, applicant_account_id
+            )
+            canonical_key = private_version.s3_key
+            application.private_current_version_id = version_id
+
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        if claim is not None:
+            await _release_blob_claim(session, claim.sha256)
+        raise
+
+    if upload is not None and canonical_key != upload.s3_key:
+        await _discard_private_object(storage, upload.s3_key)
     await session.refresh(application)
     return application
 
 
-@router.get("", response_model=list[ApplicationResponse])
-async def list_applications(session: AsyncSession = Depends(get_db_session)):
-    result = await session.execute(
-        select(Application).options(selectinload(Application.bounty))
+async def _add_private_version(
+    session: AsyncSession,
+    application_id: uuid.UUID,
+    version_id: uuid.UUID,
+    claim: BlobClaim,
+    upload: Optional[BlobUpload],
+    uploaded_by_id: Optional[uuid.UUID],
+) -> ApplicationPrivateVersion:
+    """Insert a private version backed by a claimed blob.
+
+    ``upload`` describes what this request wrote when the claim found the blob
+    not yet stored. If another upload finished first, its object is the one the
+    version references and the caller discards ``upload.s3_key``.
+    """
+    if upload is not None:
+        claim = await mark_blob_stored(session, claim.sha256, upload)
+    private_version = ApplicationPrivateVersion(
+        id=version_id,
+        application_id=application_id,
+        s3_key=claim.s3_key,
+        payload_sha256=claim.sha256,
+        size_bytes=claim.size_bytes,
+        content_encoding=claim.content_encoding,
+        stored_sha256=claim.stored_sha256,
+        stored_size_bytes=claim.stored_size_bytes,
+        uploaded_by_id=uploaded_by_id,
     )
-    return result.scalars().unique().all()
+    session.add(private_version)
+    await session.flush()
+    return private_version
+
+
+async def _release_blob_claim(session: AsyncSession, sha256: str) -> None:
+    """Best-effort release of a claim whose version never committed; GC reclaims the blob."""
+    try:
+        await release_blob(session, sha256)
+        await session.commit()
+    except Exception as exc:  # noqa: BLE001 - the original error is what matters
+        await session.rollback()
+        logger.warning("Failed to release blob claim %s: %s", sha256, exc)
+
+
+async def _discard_private_object(storage: PrivateStorage, key: str) -> None:
+    """Best-effort removal of an object no database row references."""
+    try:
+        await storage.delete_object(key)
+    except Exception as exc:  # noqa: BLE001 - the original error is what matters
+        logger.warning("Failed to delete orphaned private object %s: %s", key, exc)
+
+
+# Columns ApplicationResponse needs; listing selects only these so rows never
+# hydrate ORM objects or pull in the joined private version.
+_LIST_COLUMNS = (
+    Application.id,
+    Application.bounty_id,
+    Application.applicant_wallet,
+    Application.referrer_wallet,
+    Application.public_profile,
+    Application.cnft_mint,
+    Application.status,
+    Application.access_granted_at,
+    Application.created_at,
+    Application.updated_at,
+)
+
+
+@router.get("", response_model=list[ApplicationResponse])
+async def list_applications(
+    response: Response,
+    bounty_id: uuid.UUID | None = Query(default=None, description="Filter by bounty"),
+    applicant_wallet: str | None = Query(default=None, description="Filter by applicant wallet"),
+    status_filter: ApplicationStatus | None = Query(
+        default=None, alias="status", description="Filter by application status"
+    ),
+    limit: int = Query(default=50, ge=1, le=200, description="Maximum applications to return"),
+    cursor: str | None = Query(
+        default=None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} response header"
+    ),
+    session: AsyncSession = Depends(get_db_session),
+):
+    stmt = select(*_LIST_COLUMNS).order_by(Application.created_at.desc(), Application.id.desc())
+
+    if bounty_id:
+        stmt = stmt.where(Application.bounty_id == bounty_id)
+    if applicant_wallet:
+        stmt = stmt.where(Application.applicant_wallet == applicant_wallet)
+    if status_filter:
+        stmt = stmt.where(Application.status == status_filter)
+    if cursor:
+        created_at, application_id = decode_cursor(cursor)
+        stmt = stmt.where(
+            tuple_(Application.created_at, Application.id) < tuple_(created_at, application_id)
+        )
+
+    result = await session.execute(stmt.limit(limit + 1))
+    rows = result.all()
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+
+    return [row._mapping for row in rows]
 
 
 @router.get("/sample-resume", response_model=SampleResumeResponse)
@@ -161,6 +314,311 @@ async def get_application(
     return application
 
 
+def _private_readers(wallet: str):
+    """Applications whose private payload ``wallet`` may read: its own and those on its bounties."""
+    own_bounties = (
+        select(Bounty.id).join(Account, Bounty.recruiter_id == Account.id).where(Account.wallet == wallet)
+    )
+    return or_(Application.applicant_wallet == wallet, Application.bounty_id.in_(own_bounties))
+
+
+async def _own_application(session: AsyncSession, application_id: uuid.UUID, wallet: str) -> str:
+    """Applicant wallet of an application ``wallet`` applied with; 404 for anyone else.
+
+    Only the applicant may write private versions, and others cannot tell
+    a foreign application from a missing one.
+    """
+    applicant_wallet = await session.scalar(
+        select(Application.applicant_wallet).where(Application.id == application_id)
+    )
+    if applicant_wallet is None or applicant_wallet != wallet:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="application not found")
+    return applicant_wallet
+
+
+@router.get("/{application_id}/private")
+async def read_private_profile(
+    application_id: uuid.UUID,
+    wallet: str = Depends(get_current_wallet),
+    session: AsyncSession = Depends(get_db_session),
+) -> Response:
+    """Current private payload, decompressed whatever encoding it is stored with."""
+    version = await session.scalar(
+        select(ApplicationPrivateVersion)
+        .join(Application, Application.private_current_version_id == ApplicationPrivateVersion.id)
+        .where(Application.id == application_id, _private_readers(wallet))
+    )
+    # The connection goes back to the pool before the bucket read.
+    await session.rollback()
+    if version is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="private profile not found")
+    try:
+        content = await read_private_payload(get_private_storage_service(), version)
+    except ValueError as exc:
+        logger.error("Unreadable private payload for application %s: %s", application_id, exc)
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY, detail="stored private payload is unreadable"
+        ) from exc
+    return Response(content=content, media_type="application/json")
+
+
+@router.post("/private-urls", response_model=list[PrivateUrl])
+async def presign_private_profiles(
+    payload: PrivateUrlsRequest,
+    wallet: str = Depends(get_current_wallet),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Presigned GETs for the current private payload of many applications in one call.
+
+    Applications the caller may not read, or without a private payload, are
+    left out. Objects a browser cannot decode on its own get no URL.
+    """
+    rows = (
+        await session.execute(
+            select(
+                Application.id,
+                ApplicationPrivateVersion.id,
+                ApplicationPrivateVersion.s3_key,
+                ApplicationPrivateVersion.content_encoding,
+            )
+            .join(
+                ApplicationPrivateVersion,
+                Application.private_current_version_id == ApplicationPrivateVersion.id,
+            )
+            .where(Application.id.in_(payload.application_ids), _private_readers(wallet))
+        )
+    ).all()
+    await session.rollback()
+    presignable = [
+        row.s3_key
+        for row in rows
+        if row.content_encoding == IDENTITY or http_content_encoding(row.content_encoding)
+    ]
+    urls = get_private_storage_service().generate_get_urls(presignable)
+    items = []
+    for application_id, version_id, s3_key, content_encoding in rows:
+        presigned = urls.get(s3_key)
+        items.append(
+            PrivateUrl(
+                application_id=application_id,
+                version_id=version_id,
+                content_encoding=content_encoding,
+                url=presigned.url if presigned else None,
+                expires_in=presigned.expires_in if presigned else None,
+            )
+        )
+    return items
+
+
+@router.post(
+    "/{application_id}/private-uploads",
+    response_model=PrivateUploadSession,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_private_upload(
+    application_id: uuid.UUID,
+    payload: PrivateUploadCreate,
+    wallet: str = Depends(get_current_wallet),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Hand out a presigned PUT so the private profile goes straight to the bucket.
+
+    The PUT targets a key of its own for this upload session, never the shared
+    blob key, so a URL that is still valid cannot overwrite stored content.
+    Content the same applicant already stored under that sha256 needs no upload
+    at all; the client goes straight to the completion call. Anyone else's
+    identical content is not revealed, and the client uploads as usual.
+    """
+    if payload.size_bytes > get_settings().S3_PRIVATE_UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="private payload too large"
+        )
+    await _own_application(session, application_id, wallet)
+    stored_key = await find_stored_blob(session, payload.sha256, wallet)
+    await session.rollback()
+
+    version_id = uuid.uuid4()
+    if stored_key is not None:
+        return PrivateUploadSession(version_id=version_id, s3_key=stored_key, upload_required=False)
+
+    storage = get_private_storage_service()
+    key = storage.build_private_key(application_id, version_id)
+    presigned = storage.generate_put_url(key, payload.content_type, sha256=payload.sha256)
+    return PrivateUploadSession(
+        version_id=version_id,
+        s3_key=key,
+        upload_required=True,
+        upload_url=presigned.url,
+        expires_in=presigned.expires_in,
+        headers=presigned.headers or {},
+    )
+
+
+@router.post(
+    "/{application_id}/private-uploads/{version_id}/complete",
+    response_model=PrivateVersionResponse,
+)
+async def complete_private_upload(
+    application_id: uuid.UUID,
+    version_id: uuid.UUID,
+    payload: PrivateUploadComplete,
+    wallet: str = Depends(get_current_wallet),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Verify the staged upload with a HEAD and make it the current private version.
+
+    The staged object becomes the blob if the digest is new; otherwise the
+    stored blob is referenced and the staged copy is deleted.
+    """
+    applicant_wallet = await _own_application(session, application_id, wallet)
+    existing = await session.get(ApplicationPrivateVersion, version_id)
+    if existing is not None:
+        if existing.application_id != application_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="upload not found")
+        return existing
+    await session.rollback()
+
+    storage = get_private_storage_service()
+    staged_key = storage.build_private_key(application_id, version_id)
+    head = await storage.head_object(staged_key)
+    if head is not None and (head.size != payload.size_bytes or head.sha256 != payload.sha256):
+        # The presigned PUT pinned x-amz-checksum-sha256, so only a mismatched
+        # declaration gets here; the staged object is useless either way.
+        await _discard_private_object(storage, staged_key)
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="uploaded object does not match declared size or sha256",
+        )
+
+    if head is None and await find_stored_blob(session, payload.sha256, applicant_wallet) is None:
+        # Without an upload only content this applicant already stored may be linked.
+        await session.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="upload not found")
+    claim = await claim_blob(session, payload.sha256, payload.size_bytes, s3_key=staged_key)
+    await session.commit()
+
+    upload: Optional[BlobUpload] = None
+    if head is not None:
+        # Direct uploads are stored as sent, so raw and stored digests coincide.
+        upload = BlobUpload(
+            s3_key=staged_key,
+            content_encoding=IDENTITY,
+            stored_sha256=head.sha256,
+            stored_size_bytes=head.size,
+        )
+    elif not claim.stored:
+        # Collected between the lookup and the claim.
+        await _release_blob_claim(session, claim.sha256)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="upload not found")
+
+    return await _record_private_version(
+        session, storage, application_id, version_id, claim, upload, applicant_wallet
+    )
+
+
+@router.put(
+    "/{application_id}/private",
+    response_model=PrivateVersionResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def stream_private_upload(
+    application_id: uuid.UUID,
+    request: Request,
+    wallet: str = Depends(get_current_wallet),
+    session: AsyncSession = Depends(get_db_session),
+):
+    """Stream the raw request body to the bucket as a new private version.
+
+    The body is never held in memory as a whole: it is hashed and forwarded
+    in multipart chunks as it arrives. The digest is only known at the end, so
+    the upload is staged under a version key and dropped if the blob exists.
+    Only the applicant may stream, and nothing reaches the bucket before that is checked.
+    """
+    applicant_wallet = await _own_application(session, application_id, wallet)
+    await session.rollback()
+
+    storage = get_private_storage_service()
+    version_id = uuid.uuid4()
+    staged_key = storage.build_private_key(application_id, version_id)
+    encoding = configured_encoding()
+    # The size limit applies to the payload as submitted, before compression.
+    raw = RawTally(max_bytes=get_settings().S3_PRIVATE_UPLOAD_MAX_BYTES)
+    try:
+        stored = await storage.put_stream(
+            staged_key,
+            compress_stream(request.stream(), encoding, raw),
+            content_type=request.headers.get("content-type", "application/json"),
+            content_encoding=http_content_encoding(encoding),
+        )
+    except PayloadTooLarge as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="private payload too large"
+        ) from exc
+    if raw.size == 0:
+        await _discard_private_object(storage, staged_key)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="empty private payload")
+
+    upload = BlobUpload(
+        s3_key=staged_key,
+        content_encoding=encoding,
+        stored_sha256=stored.sha256,
+        stored_size_bytes=stored.size,
+    )
+    try:
+        claim = await claim_blob(session, raw.sha256, raw.size, s3_key=staged_key)
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        await _discard_private_object(storage, staged_key)
+        raise
+    return await _record_private_version(
+        session, storage, application_id, version_id, claim, upload, applicant_wallet
+    )
+
+
+async def _record_private_version(
+    session: AsyncSession,
+    storage: PrivateStorage,
+    application_id: uuid.UUID,
+    version_id: uuid.UUID,
+    claim: BlobClaim,
+    upload: Optional[BlobUpload],
+    applicant_wallet: str,
+) -> ApplicationPrivateVersion:
+    """Make a claimed blob the application's current private version."""
+    try:
+        applicant_account_id = await get_or_create_account_id(
+            session=session,
+            wallet=applicant_wallet,
+            role=AccountRole.CANDIDATE,
+        )
+        private_version = await _add_private_version(
+            session, application_id, version_id, claim, upload, applicant_account_id
+        )
+        await session.execute(
+            update(Application)
+            .where(Application.id == application_id)
+            .values(private_current_version_id=version_id)
+        )
+        await session.commit()
+    except IntegrityError as exc:
+        await session.rollback()
+        await _release_blob_claim(session, claim.sha256)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="this payload is already stored for the application",
+        ) from exc
+    except BaseException:
+        await session.rollback()
+        await _release_blob_claim(session, claim.sha256)
+        raise
+
+    if upload is not None and private_version.s3_key != upload.s3_key:
+        await _discard_private_object(storage, upload.s3_key)
+    await session.refresh(private_version)
+    return private_version
+
+
 @router.post(
     "/{application_id}/deposit",
     response_model=DepositResponse,
@@ -180,13 +638,13 @@ async def record_deposit(
     if application is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="application not found")
 
-    recruiter_account = await get_or_create_account(
+    recruiter_account_id = await get_or_create_account_id(
         session=session,
         wallet=payload.recruiter_wallet,
         role=AccountRole.RECRUITER,
     )
 
-    if application.bounty.recruiter_id != recruiter_account.id:
+    if application.bounty.recruiter_id != recruiter_account_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="recruiter does not own the bounty for this application",
@@ -194,7 +652,7 @@ async def record_deposit(
 
     deposit = Deposit(
         application_id=application.id,
-        recruiter_id=recruiter_account.id,
+        recruiter_id=recruiter_account_id,
         amount=Decimal(str(payload.amount)),
         tx_signature=payload.tx_signature,
         status=DepositStatus.PENDING,
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
 import secrets
-import threading
-import time
 from datetime import timedelta
-from typing import Dict
 
 from fastapi import APIRouter, Body, HTTPException, Request, Response, status
 
@@ -26,6 +23,7 @@ from app.schemas.auth import (
     VerifyResponse,
 )
 from app.config import get_settings
+from app.services.challenges import get_challenge_store
 
 settings = get_settings()
 
@@ -49,25 +47,9 @@ JWT_COOKIE_PARTITIONED = settings.JWT_COOKIE_PARTITIONED
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-_challenges: Dict[str, ChallengeRecord] = {}
-_lock = threading.Lock()
-
-
-def _sweep_expired() -> None:
-    while True:
-        now = now_utc()
-        with _lock:
-            for key, value in list(_challenges.items()):
-                if value.expires_at < now:
-                    _challenges.pop(key, None)
-        time.sleep(60)
-
-
-threading.Thread(target=_sweep_expired, daemon=True).start()
-
 
 @router.post("/challenge", response_model=ChallengeResponse)
-def create_challenge(payload: ChallengeRequest = Body(...)):
+async def create_challenge(payload: ChallengeRequest = Body(...)):
     domain = payload.domain or DEFAULT_DOMAIN
     if not payload.wallet or len(payload.wallet) < 20:
         raise HTTPException(status_code=400, detail="invalid wallet")
@@ -88,8 +70,7 @@ def create_challenge(payload: ChallengeRequest = Body(...)):
         domain=domain,
         message=message,
     )
-    with _lock:
-        _challenges[nonce] = rec
+    await get_challenge_store().put(rec)
 
     return ChallengeResponse(
         wallet=payload.wallet,
@@ -101,18 +82,14 @@ def create_challenge(payload: ChallengeRequest = Body(...)):
 
 
 @router.post("/verify", response_model=VerifyResponse)
-def verify_challenge(response: Response, payload: VerifyRequest = Body(...)):
-    with _lock:
-        rec = _challenges.get(payload.nonce)
-        if rec is None:
-            raise HTTPException(400, "unknown or expired nonce")
-        if rec.used:
-            raise HTTPException(400, "nonce already used")
-        if now_utc() > rec.expires_at:
-            _challenges.pop(payload.nonce, None)
-            raise HTTPException(400, "nonce expired")
-        rec.used = True
-        _challenges.pop(payload.nonce, None)
+async def verify_challenge(response: Response, payload: VerifyRequest = Body(...)):
+    # consume() removes the challenge atomically, so a nonce can only be tried once.
+    rec = await get_challenge_store().consume(payload.nonce)
+    if rec is None:
+        raise HTTPException(400, "unknown or expired nonce")
+    if now_utc() > rec.expires_at:
+        raise HTTPException(400, "nonce expired")
+    rec.used = True
 
     ok = verify_signature_solana_base58_pubkey_message_signature(
         rec.wallet, rec.message, payload.signature, payload.signature_encoding
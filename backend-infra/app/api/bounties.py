@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import json
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import Text, cast, exists, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_db_session
 from app.models import AccountRole, Bounty
 from app.schemas import BountyCreate, BountyResponse, BountyUpdate
-from app.services.accounts import get_or_create_account
+from app.services.accounts import get_or_create_account_id
+from app.services.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/bounties", tags=["bounties"])
 
@@ -19,14 +21,14 @@ router = APIRouter(prefix="/bounties", tags=["bounties"])
 async def create_bounty(
     payload: BountyCreate, session: AsyncSession = Depends(get_db_session)
 ):
-    recruiter = await get_or_create_account(
+    recruiter_id = await get_or_create_account_id(
         session=session,
         wallet=payload.recruiter_wallet,
         role=AccountRole.RECRUITER,
     )
 
     bounty = Bounty(
-        recruiter_id=recruiter.id,
+        recruiter_id=recruiter_id,
         title=payload.title,
         description=payload.description,
         reward_amount=payload.reward_amount,
@@ -43,8 +45,18 @@ async def create_bounty(
     return bounty
 
 
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _json_text(value: str) -> str:
+    """``value`` as written inside a ``jsonb::text`` string, with ``"``, ``\\`` and controls escaped."""
+    return json.dumps(value, ensure_ascii=False)[1:-1]
+
+
 @router.get("", response_model=list[BountyResponse])
 async def list_bounties(
+    response: Response,
     company: str | None = Query(default=None, description="Filter by company name"),
     region: str | None = Query(default=None, description="Filter by region"),
     employment_type: str | None = Query(
@@ -53,9 +65,13 @@ async def list_bounties(
     skill: str | None = Query(
         default=None, description="Filter by required skill (case-insensitive)"
     ),
+    limit: int = Query(default=50, ge=1, le=200, description="Maximum bounties to return"),
+    cursor: str | None = Query(
+        default=None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} response header"
+    ),
     session: AsyncSession = Depends(get_db_session),
 ):
-    stmt = select(Bounty).order_by(Bounty.created_at.desc())
+    stmt = select(Bounty).order_by(Bounty.created_at.desc(), Bounty.id.desc())
 
     if company:
         stmt = stmt.where(Bounty.company.ilike(f"%{company}%"))
@@ -63,17 +79,33 @@ async def list_bounties(
         stmt = stmt.where(Bounty.region.ilike(f"%{region}%"))
     if employment_type:
         stmt = stmt.where(Bounty.employment_type.ilike(f"%{employment_type}%"))
-
-    result = await session.execute(stmt)
-    bounties: List[Bounty] = result.scalars().all()
-
     if skill:
-        skill_lower = skill.lower()
-        bounties = [
-            bounty
-            for bounty in bounties
-            if any(s.lower() == skill_lower or skill_lower in s.lower() for s in bounty.skills or [])
-        ]
+        pattern = f"%{_escape_like(skill.lower())}%"
+        # The trigram index on lower(skills::text) narrows candidates against the
+        # JSON-escaped term; the EXISTS recheck on the decoded elements keeps
+        # matches from spanning two array elements.
+        element = func.jsonb_array_elements_text(Bounty.skills).table_valued("value")
+        stmt = stmt.where(
+            func.lower(cast(Bounty.skills, Text)).like(
+                f"%{_escape_like(_json_text(skill.lower()))}%", escape="\\"
+            ),
+            exists(
+                select(1)
+                .select_from(element)
+                .where(func.lower(element.c.value).like(pattern, escape="\\"))
+            ),
+        )
+    if cursor:
+        created_at, bounty_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(Bounty.created_at, Bounty.id) < tuple_(created_at, bounty_id))
+
+    result = await session.execute(stmt.limit(limit + 1))
+    bounties: List[Bounty] = list(result.scalars().all())
+
+    if len(bounties) > limit:
+        bounties = bounties[:limit]
+        last = bounties[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
 
     return bounties
 
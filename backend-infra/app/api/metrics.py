@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Request
+
+from app.db import pool_stats
+from app.dependencies import require_admin_token
+from app.services.storage import get_private_storage_service
+
+router = APIRouter(prefix="/metrics", tags=["metrics"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/db-pool")
+async def db_pool_metrics() -> Dict[str, Any]:
+    """Pool saturation, checkout latency and connection churn for the API engine."""
+    return pool_stats()
+
+
+@router.get("/presign-cache")
+async def presign_cache_metrics() -> Dict[str, Any]:
+    """Presigned URL cache occupancy and hit rate for the private storage engine."""
+    return get_private_storage_service().presign_stats()
+
+
+@router.get("/jobs")
+async def job_metrics(request: Request) -> Dict[str, Any]:
+    """Run counts, duration and rows touched by each background job in this worker."""
+    scheduler = getattr(request.app.state, "scheduler", None)
+    return scheduler.stats() if scheduler is not None else {}
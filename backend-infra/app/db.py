@@ -6,18 +6,47 @@ from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.services.pool_metrics import PoolMetrics, instrument_engine, instrumented_pool_class
 
 
 class Base(DeclarativeBase):
     """Declarative base for SQLAlchemy models."""
 
 
+def _connect_args(settings: Settings) -> dict:
+    """asyncpg-only connection options; other drivers reject these keywords."""
+    if not settings.DATABASE_URL.startswith("postgresql+asyncpg"):
+        return {}
+    connect_args: dict = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if settings.DB_STATEMENT_TIMEOUT_MS is not None:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+    return connect_args
+
+
 _settings = get_settings()
-_engine = create_async_engine(_settings.DATABASE_URL, echo=False, future=True)
+pool_metrics = PoolMetrics()
+_engine = create_async_engine(
+    _settings.DATABASE_URL,
+    echo=False,
+    future=True,
+    poolclass=instrumented_pool_class(pool_metrics),
+    pool_size=_settings.DB_POOL_SIZE,
+    max_overflow=_settings.DB_MAX_OVERFLOW,
+    pool_timeout=_settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=_settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=_settings.DB_POOL_PRE_PING,
+    connect_args=_connect_args(_settings),
+)
+instrument_engine(_engine, pool_metrics)
 SessionLocal = async_sessionmaker(_engine, expire_on_commit=False, class_=AsyncSession)
 
 
+def pool_stats() -> dict:
+    """Current pool occupancy plus cumulative checkout and connection counters."""
+    return pool_metrics.snapshot(_engine)
+
+
 @asynccontextmanager
 async def get_session() -> AsyncIterator[AsyncSession]:
     """Provide a transactional scope around a series of operations."""
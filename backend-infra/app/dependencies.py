@@ -1,12 +1,41 @@
 from __future__ import annotations
 
+import hmac
 from typing import AsyncGenerator
 
+from fastapi import HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.auth import decode_jwt, get_token_from_request
+from app.config import get_settings
 from app.db import get_session
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with get_session() as session:
         yield session
+
+
+def get_current_wallet(request: Request) -> str:
+    """Wallet of the caller's session token (bearer header or auth cookie)."""
+    token = get_token_from_request(request)
+    if not token:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="missing token")
+    try:
+        payload = decode_jwt(token)
+    except Exception as exc:  # noqa: BLE001 - any decode failure is an invalid token
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token") from exc
+    wallet = payload.get("sub")
+    if not wallet:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid token")
+    return wallet
+
+
+def require_admin_token(request: Request) -> None:
+    """Guard operational endpoints with the static ``ADMIN_TOKEN``; hidden while it is unset."""
+    expected = get_settings().ADMIN_TOKEN
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="not found")
+    provided = request.headers.get("x-admin-token")
+    if not provided or not hmac.compare_digest(provided, expected):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid admin token")
@@ -1,18 +1,67 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI, Request, Response
 from starlette.middleware.cors import CORSMiddleware
 
-from app.api import applications, auth, bounties, webhooks
+from app.api import applications, auth, bounties, metrics, webhooks
+from app.config import get_settings
 from app.db import get_session
+from app.services.blobs import run_blob_gc
 from app.services.bootstrap import seed_poc_data
-
-app = FastAPI(title="Headhunt Bounty API", version="0.1.0")
+from app.services.bounty_expiry import run_bounty_expiry
+from app.services.deposit_confirmations import DepositConfirmer
+from app.services.pagination import NEXT_CURSOR_HEADER
+from app.services.partitions import run_event_partition_maintenance
+from app.services.scheduler import Scheduler
+from app.services.solana import close_solana_rpc_client, get_solana_rpc_client
+from app.services.storage import close_private_storage_service
 
 logger = logging.getLogger(__name__)
 
+
+async def _bootstrap_seed_data() -> None:
+    try:
+        async with get_session() as session:
+            await seed_poc_data(session)
+    except Exception as exc:  # noqa: BLE001 - best effort seed for POC
+        logger.warning("Skipping seed bootstrap due to error: %s", exc)
+
+
+def _build_scheduler() -> Scheduler:
+    settings = get_settings()
+    scheduler = Scheduler()
+    scheduler.add_job("blob_gc", settings.BLOB_GC_INTERVAL_SECONDS, run_blob_gc)
+    scheduler.add_job("bounty_expiry", settings.BOUNTY_EXPIRY_INTERVAL_SECONDS, run_bounty_expiry)
+    scheduler.add_job(
+        "event_partitions", settings.EVENT_PARTITION_INTERVAL_SECONDS, run_event_partition_maintenance
+    )
+    if settings.DEPOSIT_CONFIRMATION_INTERVAL_SECONDS > 0:
+        confirmer = DepositConfirmer(get_solana_rpc_client(), settings)
+        scheduler.add_job(
+            "deposit_confirmation", settings.DEPOSIT_CONFIRMATION_INTERVAL_SECONDS, confirmer.run
+        )
+    return scheduler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await _bootstrap_seed_data()
+    app.state.scheduler = _build_scheduler()
+    app.state.scheduler.start()
+    try:
+        yield
+    finally:
+        await app.state.scheduler.stop()
+        await close_solana_rpc_client()
+        await close_private_storage_service()
+
+
+app = FastAPI(title="Headhunt Bounty API", version="0.1.0", lifespan=lifespan)
+
 ALLOWED_ORIGINS = [
     # frontend addr. here
     "https://cardpass.lidarbtc.workers.dev",
@@ -26,6 +75,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -40,12 +90,5 @@ app.include_router(auth.router)
 app.include_router(bounties.router)
 app.include_router(applications.router)
 app.include_router(webhooks.router)
+app.include_router(metrics.router)
 
-
-@app.on_event("startup")
-async def _bootstrap_seed_data() -> None:
-    try:
-        async with get_session() as session:
-            await seed_poc_data(session)
-    except Exception as exc:  # noqa: BLE001 - best effort seed for POC
-        logger.warning("Skipping seed bootstrap due to error: %s", exc)
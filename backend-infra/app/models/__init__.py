@@ -1,6 +1,7 @@
 from .entities import (
     Account,
     AccountRole,
+    AuthChallenge,
     Application,
     ApplicationPrivateVersion,
     ApplicationStatus,
@@ -11,11 +12,13 @@ from .entities import (
     Event,
     EventEntity,
     Payout,
+    PrivateBlob,
 )
 
 __all__ = [
     "Account",
     "AccountRole",
+    "AuthChallenge",
     "Application",
     "ApplicationPrivateVersion",
     "ApplicationStatus",
@@ -26,4 +29,5 @@ __all__ = [
     "Event",
     "EventEntity",
     "Payout",
+    "PrivateBlob",
 ]
@@ -7,13 +7,18 @@ from decimal import Decimal
 from typing import List, Optional
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     DateTime,
     Enum,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
+    Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.mutable import MutableList
@@ -50,6 +55,7 @@ class DepositStatus(str, enum.Enum):
     PENDING = "pending"
     CLEARED = "cleared"
     REFUNDED = "refunded"
+    FAILED = "failed"
 
 
 class EventEntity(str, enum.Enum):
@@ -122,6 +128,18 @@ class Bounty(Base):
         Index("ix_bounty_company", "company"),
         Index("ix_bounty_region", "region"),
         Index("ix_bounty_employment_type", "employment_type"),
+        Index("ix_bounty_created_at_id", "created_at", "id"),
+        # The non-native enum persists member names, hence 'OPEN'.
+        Index(
+            "ix_bounty_open_expires_at",
+            "expires_at",
+            postgresql_where=text("status = 'OPEN'"),
+        ),
+        Index(
+            "ix_bounty_skills_trgm",
+            text("lower(skills::text) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
     )
 
 
@@ -134,7 +152,7 @@ class Application(Base):
     bounty_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("bounties.id", ondelete="CASCADE"), nullable=False
     )
-    applicant_wallet: Mapped[str] = mapped_column(String(128), nullable=False, index=True)
+    applicant_wallet: Mapped[str] = mapped_column(String(128), nullable=False)
     referrer_wallet: Mapped[Optional[str]] = mapped_column(String(128), index=True)
     public_profile: Mapped[dict] = mapped_column(JSONB, nullable=False)
     cnft_mint: Mapped[Optional[str]] = mapped_column(String(128), unique=True)
@@ -165,7 +183,8 @@ class Application(Base):
         "ApplicationPrivateVersion",
         foreign_keys=[private_current_version_id],
         post_update=True,
-        lazy="joined",
+        # Load explicitly when needed; a joined default taxed every application query.
+        lazy="raise",
     )
     deposits: Mapped[List["Deposit"]] = relationship(
         back_populates="application", cascade="all, delete-orphan", passive_deletes=True
@@ -174,9 +193,13 @@ class Application(Base):
         back_populates="application", cascade="all, delete-orphan", uselist=False
     )
 
+    # Listing pages newest-first by (created_at, id); each filter gets a
+    # composite index so a page is an index range scan at any table size.
     __table_args__ = (
-        Index("ix_application_status", "status"),
-        Index("ix_application_bounty_id", "bounty_id"),
+        Index("ix_application_created_at_id", "created_at", "id"),
+        Index("ix_application_bounty_created", "bounty_id", "created_at", "id"),
+        Index("ix_application_applicant_created", "applicant_wallet", "created_at", "id"),
+        Index("ix_application_status_created", "status", "created_at", "id"),
     )
 
 
@@ -190,7 +213,16 @@ class ApplicationPrivateVersion(Base):
         UUID(as_uuid=True), ForeignKey("applications.id", ondelete="CASCADE"), nullable=False
     )
     s3_key: Mapped[str] = mapped_column(String(512), nullable=False)
+    # sha256/size of the payload as submitted; the stored_* columns describe the
+    # bytes at rest, which differ only when content_encoding is not "identity".
+    # Dictionary-compressed zstd is "zstd:<dict_id>" (at most 15 characters).
     payload_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    size_bytes: Mapped[Optional[int]] = mapped_column(BigInteger)
+    content_encoding: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="identity", server_default="identity"
+    )
+    stored_sha256: Mapped[Optional[str]] = mapped_column(String(64))
+    stored_size_bytes: Mapped[Optional[int]] = mapped_column(BigInteger)
     uploaded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -209,6 +241,40 @@ class ApplicationPrivateVersion(Base):
     )
 
 
+class PrivateBlob(Base):
+    """Content-addressed private payload shared by every version with the same sha256.
+
+    ``ref_count`` counts claims held by private versions (and by uploads still in
+    progress). Once it drops to zero ``released_at`` is stamped and the blob becomes
+    eligible for garbage collection after a grace period.
+    """
+
+    __tablename__ = "private_blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    s3_key: Mapped[str] = mapped_column(String(512), nullable=False)
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_encoding: Mapped[str] = mapped_column(
+        String(16), nullable=False, default="identity", server_default="identity"
+    )
+    stored_sha256: Mapped[Optional[str]] = mapped_column(String(64))
+    stored_size_bytes: Mapped[Optional[int]] = mapped_column(BigInteger)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    stored: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    released_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index(
+            "ix_private_blobs_released_at",
+            "released_at",
+            postgresql_where=text("ref_count <= 0"),
+        ),
+    )
+
+
 class Deposit(Base):
     __tablename__ = "deposits"
 
@@ -229,6 +295,12 @@ class Deposit(Base):
         default=DepositStatus.PENDING,
     )
     cleared_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    confirmation_attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+    next_check_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
@@ -238,6 +310,11 @@ class Deposit(Base):
 
     __table_args__ = (
         Index("ix_deposits_application", "application_id"),
+        Index(
+            "ix_deposits_pending_next_check",
+            "next_check_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
     )
 
 
@@ -264,15 +341,16 @@ class Payout(Base):
 class Event(Base):
     __tablename__ = "events"
 
-    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     entity_type: Mapped[EventEntity] = mapped_column(
         Enum(EventEntity, name="hh_event_entity", native_enum=False), nullable=False
     )
     entity_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
     event_type: Mapped[str] = mapped_column(String(64), nullable=False)
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Part of the key because the table is range-partitioned by month on it.
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
     created_by_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True), ForeignKey("accounts.id", ondelete="SET NULL")
@@ -282,4 +360,22 @@ class Event(Base):
 
     __table_args__ = (
         Index("ix_events_entity", "entity_type", "entity_id"),
+        Index("ix_events_created_at_brin", "created_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+class AuthChallenge(Base):
+    __tablename__ = "auth_challenges"
+
+    nonce: Mapped[str] = mapped_column(String(64), primary_key=True)
+    wallet: Mapped[str] = mapped_column(String(128), nullable=False)
+    issued_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    purpose: Mapped[str] = mapped_column(String(255), nullable=False)
+    domain: Mapped[str] = mapped_column(String(255), nullable=False)
+    message: Mapped[str] = mapped_column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("ix_auth_challenges_expires_at", "expires_at"),
     )
@@ -6,6 +6,11 @@ from .applications import (
     DepositCreate,
     DepositResponse,
     SampleResumeResponse,
+    PrivateUploadComplete,
+    PrivateUploadCreate,
+    PrivateUploadSession,
+    PrivateUrl,
+    PrivateUrlsRequest,
     PrivateVersionResponse,
 )
 from .bounties import BountyCreate, BountyResponse, BountyUpdate
@@ -26,6 +31,11 @@ __all__ = [
     "DepositCreate",
     "DepositResponse",
     "SampleResumeResponse",
+    "PrivateUploadComplete",
+    "PrivateUploadCreate",
+    "PrivateUploadSession",
+    "PrivateUrl",
+    "PrivateUrlsRequest",
     "PrivateVersionResponse",
     "BountyCreate",
     "BountyResponse",
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -77,9 +77,54 @@ class ApplicationResponse(BaseModel):
 class PrivateVersionResponse(BaseModel):
     id: uuid.UUID
     s3_key: str
-    payload_sha256: str
+    payload_sha256: str = Field(..., description="sha256 of the payload as submitted.")
+    size_bytes: Optional[int] = None
+    content_encoding: str = Field("identity", description="Compression applied at rest; zstd:<dict_id> names the dictionary used.")
+    stored_sha256: Optional[str] = Field(None, description="sha256 of the bytes at rest.")
+    stored_size_bytes: Optional[int] = None
     uploaded_at: datetime
 
+    class Config:
+        from_attributes = True
+
+
+class PrivateUploadCreate(BaseModel):
+    size_bytes: int = Field(..., gt=0)
+    sha256: str = Field(..., pattern=r"^[0-9a-f]{64}$", description="Lowercase hex digest of the payload.")
+    content_type: str = "application/json"
+
+
+class PrivateUploadSession(BaseModel):
+    version_id: uuid.UUID
+    s3_key: str
+    upload_required: bool = Field(
+        True, description="False when the caller already stored identical content; skip the PUT."
+    )
+    upload_url: Optional[str] = None
+    expires_in: Optional[int] = None
+    headers: Dict[str, str] = Field(
+        default_factory=dict, description="Headers the PUT must carry exactly as given."
+    )
+
+
+class PrivateUploadComplete(BaseModel):
+    size_bytes: int = Field(..., gt=0)
+    sha256: str = Field(..., pattern=r"^[0-9a-f]{64}$")
+
+
+class PrivateUrlsRequest(BaseModel):
+    application_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=200)
+
+
+class PrivateUrl(BaseModel):
+    application_id: uuid.UUID
+    version_id: uuid.UUID
+    content_encoding: str = "identity"
+    url: Optional[str] = Field(
+        None, description="Presigned GET; None when only GET /applications/{id}/private can decode it."
+    )
+    expires_in: Optional[int] = None
+
 
 class DepositCreate(BaseModel):
     amount: float = Field(..., gt=0)
@@ -1,39 +1,177 @@
 from __future__ import annotations
 
-from typing import Optional
+import uuid
+from collections import OrderedDict
+from typing import Dict, Iterable, Mapping, Optional, Set
 
-from sqlalchemy import select
+from sqlalchemy import event, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.models import Account, AccountRole
 
+_PENDING_KEY = "account_ids_pending"
+_INSERTED_KEY = "account_wallets_inserted"
 
-async def get_or_create_account(
-    session: AsyncSession,
-    wallet: str,
-    role: AccountRole,
-    display_name: Optional[str] = None,
-) -> Account:
-    """Fetch an account by wallet or create it with the provided role."""
+
+class AccountIdCache:
+    """Bounded LRU of wallet -> account id.
+
+    Only ids of committed rows are admitted: ids minted inside a transaction
+    are parked on the session and published by the ``after_commit`` hook below,
+    so a rolled-back insert can never leak into the cache.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, uuid.UUID]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, wallet: str) -> Optional[uuid.UUID]:
+        account_id = self._entries.get(wallet)
+        if account_id is not None:
+            self._entries.move_to_end(wallet)
+        return account_id
+
+    def update(self, ids: Mapping[str, uuid.UUID]) -> None:
+        if self._maxsize <= 0:
+            return
+        for wallet, account_id in ids.items():
+            self._entries[wallet] = account_id
+            self._entries.move_to_end(wallet)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+account_id_cache = AccountIdCache(get_settings().ACCOUNT_ID_CACHE_SIZE)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_account_ids(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_INSERTED_KEY, None)
+    if pending:
+        account_id_cache.update(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_uncommitted_account_ids(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_INSERTED_KEY, None)
+
+
+def _normalize(wallet: str) -> str:
     normalized_wallet = wallet.strip()
     if not normalized_wallet:
         raise ValueError("wallet must be provided")
+    return normalized_wallet
+
+
+async def _upsert_accounts(session: AsyncSession, rows: Iterable[dict]) -> Dict[str, uuid.UUID]:
+    """Insert missing accounts and read existing ones in a single statement.
 
+    The INSERT ... ON CONFLICT DO NOTHING returns the rows it created; the
+    SELECT arm returns rows that already existed (it cannot see the CTE's own
+    inserts, so nothing is reported twice). A row committed by a concurrent
+    transaction after our snapshot is invisible to both, hence the re-read.
+    """
+    rows = list(rows)
+    wallets = [row["wallet"] for row in rows]
+    inserted = (
+        pg_insert(Account)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Account.wallet])
+        .returning(Account.id, Account.wallet, literal_column("true").label("created"))
+        .cte("inserted")
+    )
+    existing = select(Account.id, Account.wallet, literal_column("false").label("created")).where(
+        Account.wallet.in_(wallets)
+    )
     result = await session.execute(
-        select(Account).where(Account.wallet == normalized_wallet)
+        union_all(select(inserted.c.id, inserted.c.wallet, inserted.c.created), existing)
     )
-    account = result.scalar_one_or_none()
-    if account:
-        return account
-
-    account = Account(
-        wallet=normalized_wallet,
-        role=role,
-        display_name=display_name,
+
+    ids: Dict[str, uuid.UUID] = {}
+    created: Set[str] = set()
+    for account_id, wallet, was_created in result:
+        ids[wallet] = account_id
+        if was_created:
+            created.add(wallet)
+
+    missing = [wallet for wallet in wallets if wallet not in ids]
+    if missing:
+        result = await session.execute(
+            select(Account.id, Account.wallet).where(Account.wallet.in_(missing))
+        )
+        ids.update({wallet: account_id for account_id, wallet in result})
+
+    inserted_in_tx = session.info.setdefault(_INSERTED_KEY, set())
+    inserted_in_tx.update(created)
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    committed = {}
+    for wallet, account_id in ids.items():
+        if wallet in inserted_in_tx:
+            pending[wallet] = account_id
+        else:
+            committed[wallet] = account_id
+    account_id_cache.update(committed)
+    return ids
+
+
+async def get_or_create_account_ids(
+    session: AsyncSession, wallets: Mapping[str, AccountRole]
+) -> Dict[str, uuid.UUID]:
+    """Resolve several wallets to account ids, creating missing accounts.
+
+    Cached wallets cost nothing; the rest are resolved together in one round trip.
+    """
+    normalized = {_normalize(wallet): role for wallet, role in wallets.items()}
+    ids: Dict[str, uuid.UUID] = {}
+    misses = []
+    for wallet, role in normalized.items():
+        account_id = account_id_cache.get(wallet)
+        if account_id is None:
+            misses.append({"id": uuid.uuid4(), "wallet": wallet, "role": role})
+        else:
+            ids[wallet] = account_id
+    if misses:
+        ids.update(await _upsert_accounts(session, misses))
+    return ids
+
+
+async def get_or_create_account_id(
+    session: AsyncSession,
+    wallet: str,
+    role: AccountRole,
+    display_name: Optional[str] = None,
+) -> uuid.UUID:
+    normalized_wallet = _normalize(wallet)
+    account_id = account_id_cache.get(normalized_wallet)
+    if account_id is not None:
+        return account_id
+    ids = await _upsert_accounts(
+        session,
+        [{"id": uuid.uuid4(), "wallet": normalized_wallet, "role": role, "display_name": display_name}],
     )
-    session.add(account)
-    await session.flush()
-    return account
+    return ids[normalized_wallet]
+
+
+async def get_or_create_account(
+    session: AsyncSession,
+    wallet: str,
+    role: AccountRole,
+    display_name: Optional[str] = None,
+) -> Account:
+    """Fetch an account by wallet or create it with the provided role."""
+    account_id = await get_or_create_account_id(session, wallet, role, display_name)
+    return await session.get(Account, account_id)
 
 
 async def get_account_by_wallet(
@@ -41,4 +179,3 @@ async def get_account_by_wallet(
 ) -> Optional[Account]:
     result = await session.execute(select(Account).where(Account.wallet == wallet))
     return result.scalar_one_or_none()
-
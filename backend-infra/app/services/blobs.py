@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import case, delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.db import get_session
+from app.models import Application, ApplicationPrivateVersion, PrivateBlob
+from app.services.compression import decompress
+from app.services.storage import PrivateStorage, get_private_storage_service
+
+
+@dataclass
+class BlobClaim:
+    sha256: str
+    s3_key: str
+    stored: bool  # False means the caller must upload before recording a version
+    size_bytes: int = 0
+    content_encoding: str = "identity"
+    stored_sha256: Optional[str] = None
+    stored_size_bytes: Optional[int] = None
+
+
+@dataclass
+class BlobUpload:
+    """What a request wrote to the bucket for a claim that was not yet stored."""
+
+    s3_key: str
+    content_encoding: str
+    stored_sha256: str
+    stored_size_bytes: int
+
+
+_CLAIM_COLUMNS = (
+    PrivateBlob.s3_key,
+    PrivateBlob.stored,
+    PrivateBlob.size_bytes,
+    PrivateBlob.content_encoding,
+    PrivateBlob.stored_sha256,
+    PrivateBlob.stored_size_bytes,
+)
+
+
+def _claim_from_row(sha256: str, row) -> BlobClaim:
+    return BlobClaim(
+        sha256=sha256,
+        s3_key=row.s3_key,
+        stored=row.stored,
+        size_bytes=row.size_bytes,
+        content_encoding=row.content_encoding,
+        stored_sha256=row.stored_sha256,
+        stored_size_bytes=row.stored_size_bytes,
+    )
+
+
+async def find_stored_blob(session: AsyncSession, sha256: str, applicant_wallet: str) -> Optional[str]:
+    """Key of a stored blob with this digest that one of the applicant's own versions references.
+
+    Knowing a digest must not be enough to attach, or even detect, someone
+    else's content, so blobs only other applicants reference are not found.
+    """
+    return await session.scalar(
+        select(PrivateBlob.s3_key)
+        .join(ApplicationPrivateVersion, ApplicationPrivateVersion.payload_sha256 == PrivateBlob.sha256)
+        .join(Application, Application.id == ApplicationPrivateVersion.application_id)
+        .where(
+            PrivateBlob.sha256 == sha256,
+            PrivateBlob.stored,
+            Application.applicant_wallet == applicant_wallet,
+        )
+        .limit(1)
+    )
+
+
+async def claim_blob(
+    session: AsyncSession, sha256: str, size_bytes: int, s3_key: Optional[str] = None
+) -> BlobClaim:
+    """Take a reference on the blob for ``sha256``, registering it if it is new.
+
+    A held claim keeps the garbage collector away, so callers claim before
+    uploading and release if the version they were creating never commits.
+    """
+    stmt = pg_insert(PrivateBlob).values(
+        sha256=sha256,
+        s3_key=s3_key or PrivateStorage.build_blob_key(sha256),
+        size_bytes=size_bytes,
+        ref_count=1,
+        stored=False,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PrivateBlob.sha256],
+        set_={"ref_count": PrivateBlob.ref_count + 1, "released_at": None},
+    ).returning(*_CLAIM_COLUMNS)
+    row = (await session.execute(stmt)).one()
+    return _claim_from_row(sha256, row)
+
+
+async def mark_blob_stored(session: AsyncSession, sha256: str, upload: BlobUpload) -> BlobClaim:
+    """Record that ``upload.s3_key`` now holds the content and return the canonical blob.
+
+    If another upload already completed for this digest its key and encoding
+    win; the caller should then delete the object it wrote.
+    """
+
+    def keep_existing(column, value):
+        return case((PrivateBlob.stored, column), else_=value)
+
+    row = (
+        await session.execute(
+            update(PrivateBlob)
+            .where(PrivateBlob.sha256 == sha256)
+            .values(
+                s3_key=keep_existing(PrivateBlob.s3_key, upload.s3_key),
+                content_encoding=keep_existing(PrivateBlob.content_encoding, upload.content_encoding),
+                stored_sha256=keep_existing(PrivateBlob.stored_sha256, upload.stored_sha256),
+                stored_size_bytes=keep_existing(
+                    PrivateBlob.stored_size_bytes, upload.stored_size_bytes
+                ),
+                stored=True,
+            )
+            .returning(*_CLAIM_COLUMNS)
+        )
+    ).one()
+    return _claim_from_row(sha256, row)
+
+
+async def release_blob(session: AsyncSession, sha256: str) -> None:
+    await session.execute(
+        update(PrivateBlob)
+        .where(PrivateBlob.sha256 == sha256)
+        .values(
+            ref_count=PrivateBlob.ref_count - 1,
+            released_at=case(
+                (PrivateBlob.ref_count <= 1, datetime.now(timezone.utc)),
+                else_=PrivateBlob.released_at,
+            ),
+        )
+    )
+
+
+async def collect_orphan_blobs(
+    session: AsyncSession,
+    storage: PrivateStorage,
+    batch_size: int,
+    grace_seconds: int,
+) -> int:
+    """Delete one batch of unreferenced blobs past their grace period.
+
+    Rows stay locked until their objects are gone, so a concurrent claim on the
+    same digest waits and then re-registers the blob as not yet stored instead
+    of pointing at an object that is about to disappear.
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=grace_seconds)
+    rows = (
+        await session.execute(
+            select(PrivateBlob.sha256, PrivateBlob.s3_key)
+            .where(PrivateBlob.ref_count <= 0, PrivateBlob.released_at < cutoff)
+            .order_by(PrivateBlob.released_at)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+    ).all()
+    if not rows:
+        await session.rollback()
+        return 0
+
+    await asyncio.gather(*(storage.delete_object(row.s3_key) for row in rows))
+    await session.execute(
+        delete(PrivateBlob).where(PrivateBlob.sha256.in_([row.sha256 for row in rows]))
+    )
+    await session.commit()
+    return len(rows)
+
+
+async def run_blob_gc() -> int:
+    """Collect orphans batch by batch until a short batch signals the backlog is drained."""
+    settings = get_settings()
+    storage = get_private_storage_service()
+    total = 0
+    async with get_session() as session:
+        while True:
+            collected = await collect_orphan_blobs(
+                session, storage, settings.BLOB_GC_BATCH_SIZE, settings.BLOB_GC_GRACE_SECONDS
+            )
+            total += collected
+            if collected < settings.BLOB_GC_BATCH_SIZE:
+                return total
+
+
+async def read_private_payload(storage: PrivateStorage, version: ApplicationPrivateVersion) -> bytes:
+    """Fetch a private version's payload, undoing any compression applied at rest."""
+    content = await storage.get_object(version.s3_key)
+    if version.stored_sha256 and storage.compute_sha256(content) != version.stored_sha256:
+        raise ValueError(f"stored payload for version {version.id} failed its checksum")
+    return decompress(content, version.content_encoding)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.db import get_session
+from app.models import Bounty, BountyStatus
+
+# Arbitrary but fixed key for pg_try_advisory_xact_lock; every API worker
+# schedules the job, the lock makes all but one stand down each round.
+BOUNTY_EXPIRY_LOCK_KEY = 0x68685F6578706972  # "hh_expir"
+
+
+async def close_expired_bounties(session: AsyncSession, batch_size: int) -> Optional[int]:
+    """Close one batch of open bounties whose ``expires_at`` has passed.
+
+    Returns the number of bounties closed, or None if another worker holds the
+    expiry lock. The candidate scan walks ``ix_bounty_open_expires_at``.
+    """
+    locked = await session.scalar(select(func.pg_try_advisory_xact_lock(BOUNTY_EXPIRY_LOCK_KEY)))
+    if not locked:
+        await session.rollback()
+        return None
+
+    expired = (
+        select(Bounty.id)
+        .where(Bounty.status == BountyStatus.OPEN, Bounty.expires_at <= func.now())
+        .order_by(Bounty.expires_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        update(Bounty)
+        .where(Bounty.id.in_(expired))
+        .values(status=BountyStatus.CLOSED)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def run_bounty_expiry() -> Optional[int]:
+    """Close expired bounties batch by batch, one transaction per batch.
+
+    Stops on a short batch or after BOUNTY_EXPIRY_MAX_BATCHES so a large
+    backlog is worked off across runs instead of in one long sweep.
+    """
+    settings = get_settings()
+    total = 0
+    async with get_session() as session:
+        for _ in range(settings.BOUNTY_EXPIRY_MAX_BATCHES):
+            closed = await close_expired_bounties(session, settings.BOUNTY_EXPIRY_BATCH_SIZE)
+            if closed is None:
+                return None if total == 0 else total
+            total += closed
+            if closed < settings.BOUNTY_EXPIRY_BATCH_SIZE:
+                break
+    return total
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import heapq
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete
+
+from app.config import get_settings
+from app.db import get_session
+from app.models import AuthChallenge
+from app.schemas.auth import ChallengeRecord
+
+
+class ChallengeStore(ABC):
+    """Single-use storage for issued sign-in challenges, keyed by nonce."""
+
+    @abstractmethod
+    async def put(self, record: ChallengeRecord) -> None:
+        ...
+
+    @abstractmethod
+    async def consume(self, nonce: str) -> Optional[ChallengeRecord]:
+        """Atomically remove and return the challenge, or None if unknown."""
+
+
+class InMemoryChallengeStore(ChallengeStore):
+    """Process-local store; expiry is driven by a min-heap so each op is O(log n).
+
+    Operations never await, so they are atomic on the event loop without a lock.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[str, ChallengeRecord] = {}
+        self._expiry: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        while self._expiry and self._expiry[0][0] < now:
+            _, nonce = heapq.heappop(self._expiry)
+            record = self._records.get(nonce)
+            if record is not None and record.expires_at.timestamp() < now:
+                del self._records[nonce]
+
+    async def put(self, record: ChallengeRecord) -> None:
+        self._purge_expired()
+        self._records[record.nonce] = record
+        heapq.heappush(self._expiry, (record.expires_at.timestamp(), record.nonce))
+
+    async def consume(self, nonce: str) -> Optional[ChallengeRecord]:
+        self._purge_expired()
+        return self._records.pop(nonce, None)
+
+
+class SqlChallengeStore(ChallengeStore):
+    """Postgres-backed store shared by every worker; DELETE ... RETURNING enforces single use."""
+
+    def __init__(self, sweep_interval_seconds: int = 60) -> None:
+        self._sweep_interval = sweep_interval_seconds
+        self._next_sweep = 0.0
+
+    async def put(self, record: ChallengeRecord) -> None:
+        async with get_session() as session:
+            session.add(
+                AuthChallenge(
+                    nonce=record.nonce,
+                    wallet=record.wallet,
+                    issued_at=record.issued_at,
+                    expires_at=record.expires_at,
+                    purpose=record.purpose,
+                    domain=record.domain,
+                    message=record.message,
+                )
+            )
+            if time.monotonic() >= self._next_sweep:
+                self._next_sweep = time.monotonic() + self._sweep_interval
+                await session.execute(
+                    delete(AuthChallenge).where(
+                        AuthChallenge.expires_at < datetime.now(timezone.utc)
+                    )
+                )
+            await session.commit()
+
+    async def consume(self, nonce: str) -> Optional[ChallengeRecord]:
+        async with get_session() as session:
+            result = await session.execute(
+                delete(AuthChallenge)
+                .where(AuthChallenge.nonce == nonce)
+                .returning(
+                    AuthChallenge.wallet,
+                    AuthChallenge.nonce,
+                    AuthChallenge.issued_at,
+                    AuthChallenge.expires_at,
+                    AuthChallenge.purpose,
+                    AuthChallenge.domain,
+                    AuthChallenge.message,
+                )
+            )
+            row = result.mappings().one_or_none()
+            await session.commit()
+        if row is None:
+            return None
+        return ChallengeRecord(**row)
+
+
+_challenge_store: Optional[ChallengeStore] = None
+
+
+def get_challenge_store() -> ChallengeStore:
+    global _challenge_store
+    if _challenge_store is None:
+        backend = get_settings().AUTH_CHALLENGE_STORE
+        if backend == "sql":
+            _challenge_store = SqlChallengeStore()
+        elif backend == "memory":
+            _challenge_store = InMemoryChallengeStore()
+        else:
+            raise ValueError(f"unknown AUTH_CHALLENGE_STORE: {backend}")
+    return _challenge_store
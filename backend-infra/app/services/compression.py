@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Tuple
+
+import zstandard
+
+from app.config import get_settings
+from app.services.storage import PayloadTooLarge
+
+IDENTITY = "identity"
+GZIP = "gzip"
+ZSTD = "zstd"
+ENCODINGS = (IDENTITY, GZIP, ZSTD)
+
+
+@lru_cache(maxsize=1)
+def _zstd_dictionary():
+    """The dictionary new zstd payloads are compressed with, if one is configured."""
+    path = get_settings().PRIVATE_PAYLOAD_ZSTD_DICT_PATH
+    if not path:
+        return None
+    with open(path, "rb") as handle:
+        return zstandard.ZstdCompressionDict(handle.read())
+
+
+def zstd_dictionary_path(dict_id: int) -> str:
+    return os.path.join(get_settings().PRIVATE_PAYLOAD_ZSTD_DICT_DIR, f"{dict_id}.zdict")
+
+
+@lru_cache(maxsize=16)
+def _zstd_dictionary_by_id(dict_id: int):
+    current = _zstd_dictionary()
+    if current is not None and current.dict_id() == dict_id:
+        return current
+    path = zstd_dictionary_path(dict_id)
+    if not os.path.exists(path):
+        raise ValueError(f"zstd dictionary {dict_id} not found at {path}")
+    with open(path, "rb") as handle:
+        return zstandard.ZstdCompressionDict(handle.read())
+
+
+def _split(encoding: str) -> Tuple[str, Optional[int]]:
+    """``zstd:<dict_id>`` -> (``zstd``, dict_id); any other encoding has no dictionary."""
+    base, _, dict_id = encoding.partition(":")
+    return base, int(dict_id) if dict_id else None
+
+
+def configured_encoding() -> str:
+    """Encoding for new payloads; zstd with a dictionary records its id as ``zstd:<dict_id>``."""
+    encoding = get_settings().PRIVATE_PAYLOAD_COMPRESSION
+    if encoding == "none":
+        return IDENTITY
+    if encoding not in ENCODINGS:
+        raise ValueError(f"unknown PRIVATE_PAYLOAD_COMPRESSION: {encoding}")
+    if encoding == ZSTD and _zstd_dictionary() is not None:
+        return f"{ZSTD}:{_zstd_dictionary().dict_id()}"
+    return encoding
+
+
+def http_content_encoding(encoding: str) -> Optional[str]:
+    """``Content-Encoding`` to store on the object so presigned GETs decode on the client.
+
+    Dictionary-compressed zstd frames cannot be decoded without our dictionary,
+    so those objects are served as opaque bytes and only ``decompress`` reads them.
+    """
+    if encoding in (GZIP, ZSTD):
+        return encoding
+    return None
+
+
+def _zstd_compressor(dict_id: Optional[int]):
+    dictionary = _zstd_dictionary_by_id(dict_id) if dict_id else None
+    return zstandard.ZstdCompressor(level=get_settings().PRIVATE_PAYLOAD_COMPRESSION_LEVEL, dict_data=dictionary)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    base, dict_id = _split(encoding)
+    if base == GZIP:
+        # mtime=0 keeps the output deterministic for identical payloads.
+        return gzip.compress(data, compresslevel=get_settings().PRIVATE_PAYLOAD_COMPRESSION_LEVEL, mtime=0)
+    if base == ZSTD:
+        return _zstd_compressor(dict_id).compress(data)
+    return data
+
+
+@dataclass
+class EncodedPayload:
+    content: bytes
+    encoding: str
+    sha256: str  # of ``content``, i.e. the bytes at rest
+
+
+def encode_payload(raw: bytes) -> EncodedPayload:
+    """Apply the configured compression, keeping the raw bytes when it would not pay off."""
+    encoding = configured_encoding()
+    if encoding != IDENTITY and len(raw) >= get_settings().PRIVATE_PAYLOAD_COMPRESSION_MIN_BYTES:
+        compressed = compress(raw, encoding)
+        if len(compressed) < len(raw):
+            return EncodedPayload(compressed, encoding, hashlib.sha256(compressed).hexdigest())
+    return EncodedPayload(raw, IDENTITY, hashlib.sha256(raw).hexdigest())
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    base, dict_id = _split(encoding)
+    if base == GZIP:
+        return gzip.decompress(data)
+    if base == ZSTD:
+        if dict_id is None:
+            # Plain ``zstd`` rows predate ``zstd:<dict_id>``; the frame header still names the dictionary.
+            dict_id = zstandard.get_frame_parameters(data).dict_id
+        dictionary = _zstd_dictionary_by_id(dict_id) if dict_id else None
+        return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(data)
+    return data
+
+
+class RawTally:
+    """Size and sha256 of the uncompressed bytes that went through ``compress_stream``."""
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self._digest = hashlib.sha256()
+        self._max_bytes = max_bytes
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self._max_bytes is not None and self.size > self._max_bytes:
+            raise PayloadTooLarge(f"payload exceeds {self._max_bytes} bytes")
+        self._digest.update(chunk)
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+
+async def compress_stream(
+    stream: AsyncIterator[bytes], encoding: str, tally: RawTally
+) -> AsyncIterator[bytes]:
+    """Compress an async byte stream chunk by chunk, tallying the raw bytes on the way."""
+    base, dict_id = _split(encoding)
+    if base == GZIP:
+        level = get_settings().PRIVATE_PAYLOAD_COMPRESSION_LEVEL
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    elif base == ZSTD:
+        compressor = _zstd_compressor(dict_id).compressobj()
+    else:
+        compressor = None
+
+    async for chunk in stream:
+        tally.update(chunk)
+        if compressor is None:
+            yield chunk
+            continue
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    if compressor is not None:
+        tail = compressor.flush()
+        if tail:
+            yield tail
+
+
+def train_zstd_dictionary(samples: list[bytes], dict_size: int = 16 * 1024) -> bytes:
+    """Build a zstd dictionary from sample profile payloads.
+
+    Save it as ``zstd_dictionary_path(zstd_dictionary_id(...))`` and keep it
+    there after retraining: payloads record the id they were written with and
+    ``decompress`` loads that dictionary from PRIVATE_PAYLOAD_ZSTD_DICT_DIR.
+    """
+    return zstandard.train_dictionary(dict_size, samples).as_bytes()
+
+
+def zstd_dictionary_id(dictionary: bytes) -> int:
+    return zstandard.ZstdCompressionDict(dictionary).dict_id()
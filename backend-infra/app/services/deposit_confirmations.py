@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+import httpx
+from sqlalchemy import column, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Settings, get_settings
+from app.db import get_session
+from app.models import Deposit, DepositStatus
+from app.services.solana import SignatureStatus, SolanaRpcError
+
+logger = logging.getLogger(__name__)
+
+_COMMITMENT_RANK = {"processed": 0, "confirmed": 1, "finalized": 2}
+# Base58 transaction signatures; anything else would make the RPC reject the whole request.
+_SIGNATURE = re.compile(r"^[1-9A-HJ-NP-Za-km-z]{32,88}$")
+
+
+class SignatureStatusClient(Protocol):
+    async def get_signature_statuses(self, signatures: Sequence[str]) -> List[Optional[SignatureStatus]]:
+        ...
+
+
+@dataclass
+class ClaimedDeposit:
+    id: uuid.UUID
+    tx_signature: str
+    confirmation_attempts: int
+
+
+class AdaptiveBackoff:
+    """Process-wide pause after RPC failures.
+
+    Each consecutive failure doubles the pause up to ``maximum``; a
+    ``Retry-After`` from the node takes precedence, and one success resets it.
+    """
+
+    def __init__(self, base: float, maximum: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._base = base
+        self._maximum = maximum
+        self._clock = clock
+        self.failures = 0
+        self._resume_at = 0.0
+
+    def ready(self) -> bool:
+        return self._clock() >= self._resume_at
+
+    def delay(self) -> float:
+        return max(self._resume_at - self._clock(), 0.0)
+
+    def failure(self, retry_after: Optional[float] = None) -> float:
+        self.failures += 1
+        pause = min(self._base * 2 ** (self.failures - 1), self._maximum)
+        if retry_after is not None:
+            pause = max(pause, retry_after)
+        self._resume_at = self._clock() + pause
+        return pause
+
+    def success(self) -> None:
+        self.failures = 0
+        self._resume_at = 0.0
+
+
+def resolve_deposit(
+    deposit: ClaimedDeposit,
+    status: Optional[SignatureStatus],
+    now: datetime,
+    settings: Settings,
+) -> Dict[str, Any]:
+    """New column values for a claimed deposit given its signature status.
+
+    Unknown signatures are re-checked with exponential backoff and fail after
+    DEPOSIT_CONFIRMATION_MAX_ATTEMPTS lookups; landed transactions below the
+    required commitment are re-checked after the base delay.
+    """
+    row = {
+        "id": deposit.id,
+        "status": DepositStatus.PENDING,
+        "cleared_at": None,
+        "attempts": deposit.confirmation_attempts,
+        "next_check_at": now + timedelta(seconds=settings.DEPOSIT_CONFIRMATION_BACKOFF_SECONDS),
+    }
+    if status is None:
+        attempts = deposit.confirmation_attempts + 1
+        row["attempts"] = attempts
+        if attempts >= settings.DEPOSIT_CONFIRMATION_MAX_ATTEMPTS:
+            row["status"] = DepositStatus.FAILED
+        else:
+            delay = min(
+                settings.DEPOSIT_CONFIRMATION_BACKOFF_SECONDS * 2 ** (attempts - 1),
+                settings.DEPOSIT_CONFIRMATION_MAX_BACKOFF_SECONDS,
+            )
+            row["next_check_at"] = now + timedelta(seconds=delay)
+    elif status.err is not None:
+        row["status"] = DepositStatus.FAILED
+    elif _COMMITMENT_RANK.get(status.confirmation_status or "", -1) >= _COMMITMENT_RANK.get(
+        settings.DEPOSIT_CONFIRMATION_COMMITMENT, 2
+    ):
+        row["status"] = DepositStatus.CLEARED
+        row["cleared_at"] = now
+    return row
+
+
+def apply_statement(rows: List[Dict[str, Any]]):
+    """One UPDATE ... FROM (VALUES ...) for the whole batch.
+
+    Rows that left PENDING in the meantime, e.g. a refund, are not touched.
+    """
+    checked = values(
+        column("id", Deposit.id.type),
+        column("status", Deposit.status.type),
+        column("cleared_at", Deposit.cleared_at.type),
+        column("attempts", Deposit.confirmation_attempts.type),
+        column("next_check_at", Deposit.next_check_at.type),
+        name="checked",
+    ).data(
+        [(row["id"], row["status"], row["cleared_at"], row["attempts"], row["next_check_at"]) for row in rows]
+    )
+    return (
+        update(Deposit)
+        .where(Deposit.id == checked.c.id, Deposit.status == DepositStatus.PENDING)
+        .values(
+            status=checked.c.status,
+            cleared_at=checked.c.cleared_at,
+            confirmation_attempts=checked.c.attempts,
+            next_check_at=checked.c.next_check_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def claim_pending_deposits(
+    session: AsyncSession, batch_size: int, lease_seconds: int
+) -> List[ClaimedDeposit]:
+    """Lease a batch of due pending deposits by pushing their ``next_check_at`` forward.
+
+    SKIP LOCKED lets concurrent workers claim disjoint batches, and the lease
+    keeps a batch from being claimed again while its statuses are fetched.
+    """
+    now = datetime.now(timezone.utc)
+    due = (
+        select(Deposit.id)
+        .where(Deposit.status == DepositStatus.PENDING, Deposit.next_check_at <= now)
+        .order_by(Deposit.next_check_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        update(Deposit)
+        .where(Deposit.id.in_(due))
+        .values(next_check_at=now + timedelta(seconds=lease_seconds))
+        .returning(Deposit.id, Deposit.tx_signature, Deposit.confirmation_attempts)
+        .execution_options(synchronize_session=False)
+    )
+    claimed = [ClaimedDeposit(*row) for row in result.all()]
+    await session.commit()
+    return claimed
+
+
+class DepositConfirmer:
+    """Moves pending deposits to CLEARED or FAILED from bulk signature status lookups.
+
+    Each batch costs one claim statement, one ``getSignatureStatuses`` round
+    and one update statement, however many deposits it holds.
+    """
+
+    def __init__(
+        self,
+        client: SignatureStatusClient,
+        settings: Optional[Settings] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._settings = settings or get_settings()
+        self.backoff = AdaptiveBackoff(
+            self._settings.DEPOSIT_CONFIRMATION_BACKOFF_SECONDS,
+            self._settings.DEPOSIT_CONFIRMATION_MAX_BACKOFF_SECONDS,
+            clock,
+        )
+
+    async def confirm_batch(self, session: AsyncSession) -> Optional[int]:
+        """Check one batch; returns the deposits resolved, or None when there is nothing to do."""
+        settings = self._settings
+        claimed = await claim_pending_deposits(
+            session, settings.DEPOSIT_CONFIRMATION_BATCH_SIZE, settings.DEPOSIT_CONFIRMATION_LEASE_SECONDS
+        )
+        if not claimed:
+            return None
+        now = datetime.now(timezone.utc)
+        statuses: Dict[uuid.UUID, Optional[SignatureStatus]] = {}
+        malformed = [deposit for deposit in claimed if not _SIGNATURE.match(deposit.tx_signature)]
+        for deposit in malformed:
+            statuses[deposit.id] = SignatureStatus(slot=0, confirmation_status=None, err="malformed signature")
+        lookup = [deposit for deposit in claimed if deposit.id not in statuses]
+        if lookup:
+            try:
+                found = await self._client.get_signature_statuses([deposit.tx_signature for deposit in lookup])
+            except (SolanaRpcError, httpx.HTTPError) as exc:
+                pause = self.backoff.failure(getattr(exc, "retry_after", None))
+                logger.warning("Signature status lookup failed, pausing %.1fs: %s", pause, exc)
+                # The lease expires on its own, so the batch is retried once the pause is over.
+                return None
+            self.backoff.success()
+            statuses.update(zip((deposit.id for deposit in lookup), found))
+        rows = [resolve_deposit(deposit, statuses[deposit.id], now, settings) for deposit in claimed]
+        await session.execute(apply_statement(rows))
+        await session.commit()
+        return sum(1 for row in rows if row["status"] is not DepositStatus.PENDING)
+
+    async def run(self) -> Optional[int]:
+        """Work off due deposits with up to DEPOSIT_CONFIRMATION_CONCURRENCY batches in flight.
+
+        Returns None while paused after RPC failures.
+        """
+        if not self.backoff.ready():
+            return None
+        remaining = self._settings.DEPOSIT_CONFIRMATION_MAX_BATCHES
+
+        async def worker() -> int:
+            nonlocal remaining
+            resolved = 0
+            async with get_session() as session:
+                while remaining > 0 and self.backoff.ready():
+                    remaining -= 1
+                    batch = await self.confirm_batch(session)
+                    if batch is None:
+                        break
+                    resolved += batch
+            return resolved
+
+        workers = max(1, min(self._settings.DEPOSIT_CONFIRMATION_CONCURRENCY, remaining))
+        return sum(await asyncio.gather(*(worker() for _ in range(workers))))
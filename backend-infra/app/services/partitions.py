@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.db import get_session
+
+logger = logging.getLogger(__name__)
+
+# The audit ``events`` table is range-partitioned by month on created_at (migration 0009).
+EVENTS_TABLE = "events"
+# Held for the whole maintenance run so only one API worker touches partitions.
+PARTITION_LOCK_KEY = 0x68685F7061727473  # "hh_parts"
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(parent: str, month: date) -> str:
+    return f"{parent}_p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(parent: str, name: str) -> Optional[date]:
+    """Month of a ``partition_name`` partition; None for ``<parent>_default`` and anything else."""
+    suffix = name[len(parent) + 2 :] if name.startswith(f"{parent}_p") else ""
+    if len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+@dataclass
+class PartitionMaintenance:
+    created: List[str] = field(default_factory=list)
+    archived: List[str] = field(default_factory=list)
+    archived_rows: int = 0
+
+
+class _GzipSink:
+    """COPY output target that compresses and writes on a worker thread, off the event loop."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._archive = None
+
+    async def __aenter__(self) -> "_GzipSink":
+        self._archive = await asyncio.to_thread(gzip.open, self.path, "wb")
+        return self
+
+    async def __call__(self, chunk: bytes) -> None:
+        await asyncio.to_thread(self._archive.write, chunk)
+
+    async def __aexit__(self, *exc_info) -> None:
+        await asyncio.to_thread(self._archive.close)
+
+
+async def _event_partitions(session: AsyncSession) -> List[date]:
+    names = await session.scalars(
+        text("SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = CAST(:parent AS regclass)"),
+        {"parent": EVENTS_TABLE},
+    )
+    return sorted(month for month in (partition_month(EVENTS_TABLE, name) for name in names) if month)
+
+
+async def _archive_partition(session: AsyncSession, month: date, directory: str) -> int:
+    """Export one month to gzipped CSV, then detach and drop it; the caller commits."""
+    name = partition_name(EVENTS_TABLE, month)
+    connection = await (await session.connection()).get_raw_connection()
+    async with _GzipSink(os.path.join(directory, f"{name}.csv.gz")) as sink:
+        status = await connection.driver_connection.copy_from_table(name, output=sink, format="csv", header=True)
+    await session.execute(text(f"ALTER TABLE {EVENTS_TABLE} DETACH PARTITION {name}"))
+    await session.execute(text(f"DROP TABLE {name}"))
+    logger.info("Archived %s to %s", name, sink.path)
+    return int(status.split()[-1])
+
+
+async def maintain_event_partitions(session: AsyncSession) -> Optional[PartitionMaintenance]:
+    """Create the next EVENT_PARTITION_MONTHS_AHEAD months of ``events`` partitions and
+    archive months older than EVENT_RETENTION_MONTHS into EVENT_ARCHIVE_DIR.
+
+    Each archived month is its own transaction and is exported while still
+    attached, so a failure leaves it in place for the next run. Returns None
+    when another worker holds the partition lock.
+    """
+    settings = get_settings()
+    lock = select(func.pg_try_advisory_xact_lock(PARTITION_LOCK_KEY))
+    if not await session.scalar(lock):
+        await session.rollback()
+        return None
+    this_month = datetime.now(timezone.utc).date().replace(day=1)
+    existing = set(await _event_partitions(session))
+    result = PartitionMaintenance()
+    for offset in range(settings.EVENT_PARTITION_MONTHS_AHEAD + 1):
+        month = add_months(this_month, offset)
+        if month in existing:
+            continue
+        name = partition_name(EVENTS_TABLE, month)
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {EVENTS_TABLE} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            )
+        )
+        result.created.append(name)
+    await session.commit()
+    if settings.EVENT_RETENTION_MONTHS <= 0:
+        return result
+    cutoff = add_months(this_month, -settings.EVENT_RETENTION_MONTHS)
+    await asyncio.to_thread(os.makedirs, settings.EVENT_ARCHIVE_DIR, exist_ok=True)
+    for month in sorted(existing):
+        # The lock taken above ended with the commit; each archive transaction re-takes it.
+        if add_months(month, 1) > cutoff or not await session.scalar(lock):
+            break
+        result.archived_rows += await _archive_partition(session, month, settings.EVENT_ARCHIVE_DIR)
+        await session.commit()
+        result.archived.append(partition_name(EVENTS_TABLE, month))
+    return result
+
+
+async def run_event_partition_maintenance() -> Optional[int]:
+    async with get_session() as session:
+        result = await maintain_event_partitions(session)
+    if result is None:
+        return None
+    return len(result.created) + result.archived_rows
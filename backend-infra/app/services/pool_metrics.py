@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """Counters for one engine's connection pool, fed by pool events and checkout timing."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkins = 0
+        self.checkout_timeouts = 0
+        self.checkout_wait_total_seconds = 0.0
+        self.checkout_wait_max_seconds = 0.0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.connections_invalidated = 0
+
+    def observe_checkout(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.checkout_wait_total_seconds += seconds
+        self.checkout_wait_max_seconds = max(self.checkout_wait_max_seconds, seconds)
+
+    def snapshot(self, engine: AsyncEngine) -> dict[str, Any]:
+        pool = engine.pool
+        size = pool.size() if hasattr(pool, "size") else 0
+        max_overflow = getattr(pool, "_max_overflow", 0)
+        checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+        capacity = size + max(max_overflow, 0)
+        return {
+            "pool_size": size,
+            "max_overflow": max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin() if hasattr(pool, "checkedin") else 0,
+            "overflow": max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0,
+            "saturation": checked_out / capacity if capacity else 0.0,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "checkout_timeouts": self.checkout_timeouts,
+            "checkout_wait_avg_seconds": self.checkout_wait_total_seconds / self.checkouts if self.checkouts else 0.0,
+            "checkout_wait_max_seconds": self.checkout_wait_max_seconds,
+            "connections_opened": self.connections_opened,
+            "connections_closed": self.connections_closed,
+            "connections_invalidated": self.connections_invalidated,
+        }
+
+
+def instrumented_pool_class(metrics: PoolMetrics) -> type[AsyncAdaptedQueuePool]:
+    """Pool subclass timing each checkout, including queue waits and pre-ping."""
+
+    class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+        def connect(self):
+            started = time.perf_counter()
+            try:
+                connection = super().connect()
+            except exc.TimeoutError:
+                metrics.checkout_timeouts += 1
+                raise
+            metrics.observe_checkout(time.perf_counter() - started)
+            return connection
+
+    return InstrumentedAsyncAdaptedQueuePool
+
+
+def instrument_engine(engine: AsyncEngine, metrics: PoolMetrics) -> None:
+    target = engine.sync_engine
+
+    @event.listens_for(target, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        metrics.connections_opened += 1
+
+    @event.listens_for(target, "checkin")
+    def _on_checkin(dbapi_connection, connection_record) -> None:
+        metrics.checkins += 1
+
+    @event.listens_for(target, "close")
+    def _on_close(dbapi_connection, connection_record) -> None:
+        metrics.connections_closed += 1
+
+    @event.listens_for(target, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+        metrics.connections_invalidated += 1
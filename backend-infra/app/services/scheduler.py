@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# A job returns the number of rows it touched, or None when it stood down
+# because another worker holds its lock.
+JobFunc = Callable[[], Awaitable[Optional[int]]]
+
+
+class PeriodicJob:
+    """Runs ``func`` every ``interval_seconds`` and keeps counters about each run."""
+
+    def __init__(self, name: str, interval_seconds: float, func: JobFunc) -> None:
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self._func = func
+        self.runs = 0
+        self.skipped = 0
+        self.failures = 0
+        self.total_rows = 0
+        self.last_rows: Optional[int] = None
+        self.last_duration_seconds: Optional[float] = None
+        self.last_started_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    async def run_once(self) -> Optional[int]:
+        self.last_started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        try:
+            rows = await self._func()
+        except Exception as exc:  # noqa: BLE001 - keep the loop alive across transient failures
+            self.failures += 1
+            self.last_error = str(exc)
+            logger.warning("Job %s failed: %s", self.name, exc)
+            return None
+        finally:
+            self.runs += 1
+            self.last_duration_seconds = time.perf_counter() - started
+
+        if rows is None:
+            self.skipped += 1
+            return None
+        self.last_rows = rows
+        self.total_rows += rows
+        self.last_error = None
+        if rows:
+            logger.info(
+                "Job %s touched %d rows in %.3fs", self.name, rows, self.last_duration_seconds
+            )
+        return rows
+
+    async def run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.run_once()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "failures": self.failures,
+            "total_rows": self.total_rows,
+            "last_rows": self.last_rows,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_started_at": self.last_started_at.isoformat() if self.last_started_at else None,
+            "last_error": self.last_error,
+        }
+
+
+class Scheduler:
+    """In-process periodic jobs, started and stopped with the application lifespan."""
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, PeriodicJob] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(self, name: str, interval_seconds: float, func: JobFunc) -> Optional[PeriodicJob]:
+        """Register a job; a non-positive interval leaves it disabled."""
+        if interval_seconds <= 0:
+            return None
+        job = PeriodicJob(name, interval_seconds, func)
+        self._jobs[name] = job
+        return job
+
+    def start(self) -> None:
+        for job in self._jobs.values():
+            self._tasks.append(asyncio.create_task(job.run_forever(), name=f"job:{job.name}"))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: job.snapshot() for name, job in self._jobs.items()}
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from app.config import get_settings
+import httpx
+
+from app.config import Settings, get_settings
+
+DEFAULT_RPC_URL = "https://api.devnet.solana.com"
+# getSignatureStatuses rejects larger requests.
+MAX_SIGNATURES_PER_REQUEST = 256
 
 
 @dataclass
@@ -36,7 +43,7 @@ class SolanaProgramClient:
 
     def __init__(self) -> None:
         settings = get_settings()
-        self._rpc_url = settings.SOLANA_RPC_URL or "https://api.devnet.solana.com"
+        self._rpc_url = settings.SOLANA_RPC_URL or DEFAULT_RPC_URL
 
     def init_bounty_escrow(self, bounty_id: uuid.UUID, recruiter_wallet: str, amount: float) -> EscrowRecord:
         escrow_key = f"escrow-{bounty_id}"
@@ -73,7 +80,112 @@ class SolanaProgramClient:
         )
 
 
+@dataclass
+class SignatureStatus:
+    slot: int
+    confirmation_status: Optional[str]  # processed | confirmed | finalized
+    err: Optional[Any] = None
+
+
+class SolanaRpcError(Exception):
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_status(value: Optional[Dict[str, Any]]) -> Optional[SignatureStatus]:
+    if value is None:
+        return None
+    return SignatureStatus(
+        slot=value["slot"], confirmation_status=value.get("confirmationStatus"), err=value.get("err")
+    )
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+class SolanaRpcClient:
+    """Solana JSON-RPC over a pooled httpx client.
+
+    Connections are reused across calls and in-flight requests are capped by a
+    semaphore. Signature lookups are split into requests of at most
+    ``MAX_SIGNATURES_PER_REQUEST`` that run concurrently.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        settings = settings or get_settings()
+        self._url = settings.SOLANA_RPC_URL or DEFAULT_RPC_URL
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            timeout=settings.SOLANA_RPC_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.SOLANA_RPC_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.SOLANA_RPC_MAX_CONNECTIONS,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(settings.SOLANA_RPC_MAX_CONCURRENCY)
+
+    async def _call(self, method: str, params: list) -> Any:
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        async with self._semaphore:
+            response = await self._client.post(self._url, json=payload)
+        if response.status_code != 200:
+            raise SolanaRpcError(
+                f"{method} returned HTTP {response.status_code}", retry_after=_retry_after(response)
+            )
+        body = response.json()
+        if body.get("error"):
+            raise SolanaRpcError(f"{method} failed: {body['error']}")
+        return body["result"]
+
+    async def _statuses(self, signatures: Sequence[str]) -> List[Optional[SignatureStatus]]:
+        result = await self._call(
+            "getSignatureStatuses", [list(signatures), {"searchTransactionHistory": True}]
+        )
+        return [_parse_status(value) for value in result["value"]]
+
+    async def get_signature_statuses(self, signatures: Sequence[str]) -> List[Optional[SignatureStatus]]:
+        """Statuses in the order of ``signatures``; None where the cluster has no record."""
+        chunks = [
+            signatures[start : start + MAX_SIGNATURES_PER_REQUEST]
+            for start in range(0, len(signatures), MAX_SIGNATURES_PER_REQUEST)
+        ]
+        results = await asyncio.gather(*(self._statuses(chunk) for chunk in chunks))
+        return [status for chunk in results for status in chunk]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class FakeSolanaRpcClient:
+    """In-memory stand-in for ``SolanaRpcClient`` used by tests and local runs."""
+
+    def __init__(self, statuses: Optional[Dict[str, SignatureStatus]] = None) -> None:
+        self.statuses: Dict[str, SignatureStatus] = dict(statuses or {})
+        self.requests: List[List[str]] = []
+        self.fail_with: Optional[Exception] = None
+
+    async def get_signature_statuses(self, signatures: Sequence[str]) -> List[Optional[SignatureStatus]]:
+        for start in range(0, len(signatures), MAX_SIGNATURES_PER_REQUEST):
+            self.requests.append(list(signatures[start : start + MAX_SIGNATURES_PER_REQUEST]))
+        if self.fail_with is not None:
+            raise self.fail_with
+        return [self.statuses.get(signature) for signature in signatures]
+
+    async def aclose(self) -> None:
+        return None
+
+
 _solana_client: Optional[SolanaProgramClient] = None
+_rpc_client: Optional[SolanaRpcClient] = None
 
 
 def get_solana_client() -> SolanaProgramClient:
@@ -81,3 +193,17 @@ def get_solana_client() -> SolanaProgramClient:
     if _solana_client is None:
         _solana_client = SolanaProgramClient()
     return _solana_client
+
+
+def get_solana_rpc_client() -> SolanaRpcClient:
+    global _rpc_client
+    if _rpc_client is None:
+        _rpc_client = SolanaRpcClient()
+    return _rpc_client
+
+
+async def close_solana_rpc_client() -> None:
+    global _rpc_client
+    if _rpc_client is not None:
+        await _rpc_client.aclose()
+        _rpc_client = None
@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import binascii
 import hashlib
+import time
 import uuid
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote
+from xml.etree import ElementTree
 
 import boto3
+import httpx
+from botocore.auth import S3SigV4Auth, S3SigV4QueryAuth
+from botocore.awsrequest import AWSRequest
 from botocore.client import BaseClient
 from botocore.config import Config
-from botocore.exceptions import ClientError
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError, NoCredentialsError
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 
 @dataclass
@@ -18,10 +30,287 @@ class PresignedUrl:
     url: str
     expires_in: int
     fields: Optional[dict] = None
+    headers: Optional[dict] = None  # headers the uploader must send verbatim
 
 
-class PrivateStorageService:
-    """Wrapper around S3 (or compatible) for applicant private data."""
+@dataclass
+class ObjectHead:
+    size: int
+    content_type: Optional[str]
+    sha256: Optional[str]  # hex; None when the object was stored without an S3 checksum
+
+
+@dataclass
+class StoredObject:
+    size: int
+    sha256: str
+    parts: int  # 0 when the payload fit in a single PUT
+
+
+class PayloadTooLarge(ValueError):
+    """Raised by ``put_stream`` once the stream exceeds ``max_bytes``."""
+
+
+class PresignCache:
+    """Bounded LRU of presigned URLs, reused while ``margin_seconds`` of validity remain.
+
+    Returned URLs report their remaining lifetime in ``expires_in``, so callers
+    never hand out a link that is closer to expiry than they think.
+    """
+
+    def __init__(self, maxsize: int, margin_seconds: float) -> None:
+        self._maxsize = maxsize
+        self._margin = margin_seconds
+        self._entries: "OrderedDict[tuple, Tuple[PresignedUrl, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cache_key: tuple) -> Optional[PresignedUrl]:
+        entry = self._entries.get(cache_key)
+        now = time.monotonic()
+        if entry is None or entry[1] - now < self._margin:
+            if entry is not None:
+                del self._entries[cache_key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(cache_key)
+        self.hits += 1
+        presigned, expires_at = entry
+        return PresignedUrl(
+            url=presigned.url,
+            expires_in=int(expires_at - now),
+            fields=presigned.fields,
+            headers=presigned.headers,
+        )
+
+    def put(self, cache_key: tuple, presigned: PresignedUrl) -> PresignedUrl:
+        if self._maxsize <= 0 or presigned.expires_in <= self._margin:
+            return presigned
+        self._entries[cache_key] = (presigned, time.monotonic() + presigned.expires_in)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return presigned
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# S3 rejects multipart parts below 5 MiB (except the last one).
+MIN_MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
+
+def sha256_hex_to_checksum(sha256_hex: str) -> str:
+    """Hex digest -> the base64 form S3 uses for ``x-amz-checksum-sha256``."""
+    return base64.b64encode(bytes.fromhex(sha256_hex)).decode("ascii")
+
+
+def checksum_to_sha256_hex(checksum: Optional[str]) -> Optional[str]:
+    # Multipart objects report a checksum-of-checksums suffixed with "-<parts>",
+    # which is not the digest of the content.
+    if not checksum or "-" in checksum:
+        return None
+    try:
+        return base64.b64decode(checksum).hex()
+    except (binascii.Error, ValueError):
+        return None
+
+
+class PrivateStorage(ABC):
+    """Object storage for applicant private data.
+
+    Presigning is pure computation and stays synchronous; anything that talks to
+    the bucket is a coroutine so callers never block the event loop.
+    """
+
+    @staticmethod
+    def build_private_key(application_id: uuid.UUID, version_id: uuid.UUID, filename: str = "profile.json") -> str:
+        return f"applications/{application_id}/private/{version_id}/{filename}"
+
+    @staticmethod
+    def build_attachment_key(
+        application_id: uuid.UUID, version_id: uuid.UUID, filename: str
+    ) -> str:
+        return f"applications/{application_id}/attachments/{version_id}/{filename}"
+
+    @staticmethod
+    def build_blob_key(sha256: str) -> str:
+        """Content-addressed key shared by every version with this digest."""
+        return f"blobs/sha256/{sha256[:2]}/{sha256}"
+
+    @staticmethod
+    def compute_sha256(content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def _init_presign_cache(self, settings: Settings) -> None:
+        self._presign_cache = PresignCache(
+            settings.S3_PRESIGN_CACHE_SIZE,
+            settings.S3_PRESIGN_CACHE_MARGIN_SECONDS,
+        )
+
+    @abstractmethod
+    def _sign_put_url(self, key: str, content_type: str, sha256: Optional[str]) -> PresignedUrl:
+        ...
+
+    @abstractmethod
+    def _sign_get_url(self, key: str) -> PresignedUrl:
+        ...
+
+    def generate_put_url(
+        self,
+        key: str,
+        content_type: str = "application/json",
+        sha256: Optional[str] = None,
+    ) -> PresignedUrl:
+        """Presign a PUT; with ``sha256`` the bucket rejects bodies with a different digest."""
+        cache_key = ("PUT", key, content_type, sha256)
+        presigned = self._presign_cache.get(cache_key)
+        if presigned is None:
+            presigned = self._presign_cache.put(cache_key, self._sign_put_url(key, content_type, sha256))
+        return presigned
+
+    def generate_get_url(self, key: str) -> PresignedUrl:
+        cache_key = ("GET", key, None, None)
+        presigned = self._presign_cache.get(cache_key)
+        if presigned is None:
+            presigned = self._presign_cache.put(cache_key, self._sign_get_url(key))
+        return presigned
+
+    def generate_get_urls(self, keys: Iterable[str]) -> Dict[str, PresignedUrl]:
+        """Presign GETs for many keys at once, e.g. for a dashboard page of applications."""
+        return {key: self.generate_get_url(key) for key in dict.fromkeys(keys)}
+
+    def presign_stats(self) -> Dict[str, float]:
+        return self._presign_cache.stats()
+
+    @abstractmethod
+    async def put_object(
+        self,
+        key: str,
+        content: bytes,
+        content_type: str = "application/json",
+        content_encoding: Optional[str] = None,
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def get_object(self, key: str) -> bytes:
+        """Stored bytes of ``key``, exactly as written (no content decoding)."""
+
+    @abstractmethod
+    async def delete_object(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def head_object(self, key: str) -> Optional[ObjectHead]:
+        """Size, content type and SHA-256 checksum of ``key``, or None if it does not exist."""
+
+    async def aclose(self) -> None:
+        """Release pooled connections; a no-op for engines without their own pool."""
+
+    # Multipart primitives used by ``put_stream``.
+
+    @abstractmethod
+    async def _create_multipart_upload(
+        self, key: str, content_type: str, content_encoding: Optional[str]
+    ) -> str:
+        ...
+
+    @abstractmethod
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        """Upload one part and return its ETag."""
+
+    @abstractmethod
+    async def _complete_multipart_upload(
+        self, key: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> None:
+        ...
+
+    @abstractmethod
+    async def _abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        ...
+
+    async def put_stream(
+        self,
+        key: str,
+        stream: AsyncIterator[bytes],
+        content_type: str = "application/json",
+        max_bytes: Optional[int] = None,
+        content_encoding: Optional[str] = None,
+    ) -> StoredObject:
+        """Upload an async byte stream, hashing it on the way through.
+
+        Payloads smaller than one part go out as a single PUT. Larger ones become
+        a multipart upload with at most ``S3_MULTIPART_CONCURRENCY`` parts in
+        flight, so buffered memory stays below ``(concurrency + 1) * part_size``
+        whatever the payload size. A failed or abandoned upload is aborted.
+        """
+        part_size = self._part_size
+        slots = asyncio.Semaphore(self._part_concurrency)
+        digest = hashlib.sha256()
+        buffer = bytearray()
+        size = 0
+        upload_id: Optional[str] = None
+        tasks: List[asyncio.Task] = []
+
+        async def send(part_number: int, data: bytes) -> Tuple[int, str]:
+            try:
+                return part_number, await self._upload_part(key, upload_id, part_number, data)
+            finally:
+                slots.release()
+
+        async def dispatch(data: bytes) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                upload_id = await self._create_multipart_upload(key, content_type, content_encoding)
+            await slots.acquire()
+            for task in tasks:
+                if task.done() and task.exception() is not None:
+                    slots.release()
+                    raise task.exception()
+            tasks.append(asyncio.create_task(send(len(tasks) + 1, data)))
+
+        try:
+            async for chunk in stream:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise PayloadTooLarge(f"payload exceeds {max_bytes} bytes")
+                digest.update(chunk)
+                buffer += chunk
+                while len(buffer) >= part_size:
+                    part = bytes(buffer[:part_size])
+                    del buffer[:part_size]
+                    await dispatch(part)
+
+            if upload_id is None:
+                await self.put_object(key, bytes(buffer), content_type, content_encoding)
+                return StoredObject(size=size, sha256=digest.hexdigest(), parts=0)
+
+            if buffer:
+                await dispatch(bytes(buffer))
+                buffer.clear()
+            parts = await asyncio.gather(*tasks)
+            await self._complete_multipart_upload(key, upload_id, sorted(parts))
+            return StoredObject(size=size, sha256=digest.hexdigest(), parts=len(parts))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if upload_id is not None:
+                await self._abort_multipart_upload(key, upload_id)
+            raise
+
+
+class PrivateStorageService(PrivateStorage):
+    """boto3-backed engine; blocking calls run on the default executor."""
 
     def __init__(self) -> None:
         settings = get_settings()
@@ -39,6 +328,9 @@ class PrivateStorageService:
         self._expires = settings.S3_PRESIGN_EXPIRES_SECONDS
         self._bucket_ensured = False
         self._region = settings.AWS_REGION
+        self._part_size = max(settings.S3_MULTIPART_PART_SIZE, MIN_MULTIPART_PART_SIZE)
+        self._part_concurrency = settings.S3_MULTIPART_CONCURRENCY
+        self._init_presign_cache(settings)
 
     def _ensure_bucket(self) -> None:
         if self._bucket_ensured:
@@ -58,26 +350,20 @@ class PrivateStorageService:
                 raise
         self._bucket_ensured = True
 
-    @staticmethod
-    def build_private_key(application_id: uuid.UUID, version_id: uuid.UUID, filename: str = "profile.json") -> str:
-        return f"applications/{application_id}/private/{version_id}/{filename}"
-
-    @staticmethod
-    def build_attachment_key(
-        application_id: uuid.UUID, version_id: uuid.UUID, filename: str
-    ) -> str:
-        return f"applications/{application_id}/attachments/{version_id}/{filename}"
-
-    def generate_put_url(self, key: str, content_type: str = "application/json") -> PresignedUrl:
+    def _sign_put_url(self, key: str, content_type: str, sha256: Optional[str]) -> PresignedUrl:
         self._ensure_bucket()
+        params = {"Bucket": self._bucket, "Key": key, "ContentType": content_type}
+        headers = {"Content-Type": content_type}
+        if sha256 is not None:
+            params["ChecksumSHA256"] = headers["x-amz-checksum-sha256"] = sha256_hex_to_checksum(sha256)
         url = self._client.generate_presigned_url(
             ClientMethod="put_object",
-            Params={"Bucket": self._bucket, "Key": key, "ContentType": content_type},
+            Params=params,
             ExpiresIn=self._expires,
         )
-        return PresignedUrl(url=url, expires_in=self._expires)
+        return PresignedUrl(url=url, expires_in=self._expires, headers=headers)
 
-    def generate_get_url(self, key: str) -> PresignedUrl:
+    def _sign_get_url(self, key: str) -> PresignedUrl:
         self._ensure_bucket()
         url = self._client.generate_presigned_url(
             ClientMethod="get_object",
@@ -86,21 +372,347 @@ class PrivateStorageService:
         )
         return PresignedUrl(url=url, expires_in=self._expires)
 
-    def put_object(self, key: str, content: bytes, content_type: str = "application/json") -> None:
+    def _put_object_sync(
+        self, key: str, content: bytes, content_type: str, content_encoding: Optional[str]
+    ) -> None:
+        self._ensure_bucket()
+        params = {"Bucket": self._bucket, "Key": key, "Body": content, "ContentType": content_type}
+        if content_encoding:
+            params["ContentEncoding"] = content_encoding
+        self._client.put_object(**params)
+
+    def _get_object_sync(self, key: str) -> bytes:
         self._ensure_bucket()
-        self._client.put_object(
-            Bucket=self._bucket, Key=key, Body=content, ContentType=content_type
+        return self._client.get_object(Bucket=self._bucket, Key=key)["Body"].read()
+
+    def _delete_object_sync(self, key: str) -> None:
+        self._ensure_bucket()
+        self._client.delete_object(Bucket=self._bucket, Key=key)
+
+    def _head_object_sync(self, key: str) -> Optional[ObjectHead]:
+        self._ensure_bucket()
+        try:
+            head = self._client.head_object(Bucket=self._bucket, Key=key, ChecksumMode="ENABLED")
+        except ClientError as exc:
+            error_code = exc.response.get("Error", {}).get("Code", "") if exc.response else ""
+            if error_code in {"404", "NoSuchKey", "NotFound"}:
+                return None
+            raise
+        return ObjectHead(
+            size=head["ContentLength"],
+            content_type=head.get("ContentType"),
+            sha256=checksum_to_sha256_hex(head.get("ChecksumSHA256")),
         )
 
-    @staticmethod
-    def compute_sha256(content: bytes) -> str:
-        return hashlib.sha256(content).hexdigest()
+    async def put_object(
+        self,
+        key: str,
+        content: bytes,
+        content_type: str = "application/json",
+        content_encoding: Optional[str] = None,
+    ) -> None:
+        await asyncio.to_thread(self._put_object_sync, key, content, content_type, content_encoding)
+
+    async def get_object(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._get_object_sync, key)
+
+    async def delete_object(self, key: str) -> None:
+        await asyncio.to_thread(self._delete_object_sync, key)
+
+    async def head_object(self, key: str) -> Optional[ObjectHead]:
+        return await asyncio.to_thread(self._head_object_sync, key)
+
+    def _create_multipart_upload_sync(
+        self, key: str, content_type: str, content_encoding: Optional[str]
+    ) -> str:
+        self._ensure_bucket()
+        params = {"Bucket": self._bucket, "Key": key, "ContentType": content_type}
+        if content_encoding:
+            params["ContentEncoding"] = content_encoding
+        return self._client.create_multipart_upload(**params)["UploadId"]
+
+    async def _create_multipart_upload(
+        self, key: str, content_type: str, content_encoding: Optional[str]
+    ) -> str:
+        return await asyncio.to_thread(
+            self._create_multipart_upload_sync, key, content_type, content_encoding
+        )
+
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        response = await asyncio.to_thread(
+            self._client.upload_part,
+            Bucket=self._bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return response["ETag"]
+
+    async def _complete_multipart_upload(
+        self, key: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> None:
+        await asyncio.to_thread(
+            self._client.complete_multipart_upload,
+            Bucket=self._bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [{"PartNumber": number, "ETag": etag} for number, etag in parts]
+            },
+        )
+
+    async def _abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        await asyncio.to_thread(
+            self._client.abort_multipart_upload, Bucket=self._bucket, Key=key, UploadId=upload_id
+        )
+
+
+class AsyncPrivateStorageService(PrivateStorage):
+    """Native asyncio engine speaking the S3 REST API over a pooled httpx client.
+
+    Requests are SigV4-signed with botocore's signers, so credentials resolve
+    through the same chain as boto3. In-flight requests are capped by a
+    semaphore rather than by the size of the default thread pool. Errors are
+    raised as ``ClientError`` so callers handle both engines alike.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        settings = settings or get_settings()
+        session = boto3.session.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+        )
+        self._credentials: Optional[Credentials] = session.get_credentials()
+        self._region = settings.AWS_REGION
+        self._bucket = settings.S3_PRIVATE_BUCKET
+        self._expires = settings.S3_PRESIGN_EXPIRES_SECONDS
+        self._endpoint = (
+            settings.AWS_S3_ENDPOINT_URL or f"https://s3.{settings.AWS_REGION}.amazonaws.com"
+        ).rstrip("/")
+        self._client = httpx.AsyncClient(
+            transport=transport,
+            timeout=settings.S3_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=settings.S3_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.S3_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.S3_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(settings.S3_MAX_CONCURRENCY)
+        self._part_size = max(settings.S3_MULTIPART_PART_SIZE, MIN_MULTIPART_PART_SIZE)
+        self._part_concurrency = settings.S3_MULTIPART_CONCURRENCY
+        self._init_presign_cache(settings)
+        self._bucket_ensured = False
+        self._bucket_lock = asyncio.Lock()
+
+    def _url(self, key: Optional[str] = None) -> str:
+        # Path-style addressing works for AWS and for S3-compatible stand-ins alike.
+        url = f"{self._endpoint}/{quote(self._bucket)}"
+        if key is not None:
+            url += "/" + quote(key, safe="/~")
+        return url
+
+    def _frozen_credentials(self):
+        if self._credentials is None:
+            raise NoCredentialsError()
+        return self._credentials.get_frozen_credentials()
+
+    def _sign(self, method: str, url: str, headers: dict, body: bytes) -> dict:
+        request = AWSRequest(method=method, url=url, headers=headers, data=body)
+        S3SigV4Auth(self._frozen_credentials(), "s3", self._region).add_auth(request)
+        return dict(request.headers.items())
+
+    def _presign(self, method: str, key: str, headers: dict) -> PresignedUrl:
+        request = AWSRequest(method=method, url=self._url(key), headers=headers)
+        S3SigV4QueryAuth(
+            self._frozen_credentials(), "s3", self._region, expires=self._expires
+        ).add_auth(request)
+        return PresignedUrl(url=request.url, expires_in=self._expires, headers=headers or None)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        operation: str,
+        body: bytes = b"",
+        headers: Optional[dict] = None,
+        ok: tuple = (200, 204),
+    ) -> httpx.Response:
+        signed = self._sign(method, url, dict(headers or {}), body)
+        async with self._semaphore:
+            response = await self._client.request(method, url, content=body, headers=signed)
+        if response.status_code not in ok:
+            raise ClientError(
+                {
+                    "Error": {"Code": str(response.status_code), "Message": response.text},
+                    "ResponseMetadata": {"HTTPStatusCode": response.status_code},
+                },
+                operation,
+            )
+        return response
+
+    async def _ensure_bucket(self) -> None:
+        if self._bucket_ensured:
+            return
+        async with self._bucket_lock:
+            if self._bucket_ensured:
+                return
+            head = await self._request("HEAD", self._url(), "HeadBucket", ok=(200, 404))
+            if head.status_code == 404:
+                body = b""
+                if self._region and self._region != "us-east-1":
+                    body = (
+                        "<CreateBucketConfiguration><LocationConstraint>"
+                        f"{self._region}"
+                        "</LocationConstraint></CreateBucketConfiguration>"
+                    ).encode()
+                await self._request("PUT", self._url(), "CreateBucket", body=body)
+            self._bucket_ensured = True
+
+    def _sign_put_url(self, key: str, content_type: str, sha256: Optional[str]) -> PresignedUrl:
+        headers = {"Content-Type": content_type}
+        if sha256 is not None:
+            headers["x-amz-checksum-sha256"] = sha256_hex_to_checksum(sha256)
+        return self._presign("PUT", key, headers)
+
+    def _sign_get_url(self, key: str) -> PresignedUrl:
+        return self._presign("GET", key, {})
 
-_storage_service: Optional[PrivateStorageService] = None
+    async def put_object(
+        self,
+        key: str,
+        content: bytes,
+        content_type: str = "application/json",
+        content_encoding: Optional[str] = None,
+    ) -> None:
+        await self._ensure_bucket()
+        await self._request(
+            "PUT",
+            self._url(key),
+            "PutObject",
+            body=content,
+            headers=_object_headers(content_type, content_encoding),
+        )
+
+    async def get_object(self, key: str) -> bytes:
+        await self._ensure_bucket()
+        signed = self._sign("GET", self._url(key), {}, b"")
+        async with self._semaphore:
+            # Stream so httpx does not undo a stored Content-Encoding.
+            async with self._client.stream("GET", self._url(key), headers=signed) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise ClientError(
+                        {
+                            "Error": {"Code": str(response.status_code), "Message": response.text},
+                            "ResponseMetadata": {"HTTPStatusCode": response.status_code},
+                        },
+                        "GetObject",
+                    )
+                return b"".join([chunk async for chunk in response.aiter_raw()])
+
+    async def delete_object(self, key: str) -> None:
+        await self._ensure_bucket()
+        await self._request("DELETE", self._url(key), "DeleteObject")
 
+    async def head_object(self, key: str) -> Optional[ObjectHead]:
+        await self._ensure_bucket()
+        response = await self._request(
+            "HEAD",
+            self._url(key),
+            "HeadObject",
+            headers={"x-amz-checksum-mode": "ENABLED"},
+            ok=(200, 404),
+        )
+        if response.status_code == 404:
+            return None
+        return ObjectHead(
+            size=int(response.headers.get("content-length", 0)),
+            content_type=response.headers.get("content-type"),
+            sha256=checksum_to_sha256_hex(response.headers.get("x-amz-checksum-sha256")),
+        )
 
-def get_private_storage_service() -> PrivateStorageService:
+    async def _create_multipart_upload(
+        self, key: str, content_type: str, content_encoding: Optional[str]
+    ) -> str:
+        await self._ensure_bucket()
+        response = await self._request(
+            "POST",
+            self._url(key) + "?uploads",
+            "CreateMultipartUpload",
+            headers=_object_headers(content_type, content_encoding),
+        )
+        upload_id = ElementTree.fromstring(response.content).findtext("{*}UploadId")
+        if not upload_id:
+            raise ClientError(
+                {"Error": {"Code": "MalformedXML", "Message": "missing UploadId"}},
+                "CreateMultipartUpload",
+            )
+        return upload_id
+
+    async def _upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> str:
+        response = await self._request(
+            "PUT",
+            f"{self._url(key)}?partNumber={part_number}&uploadId={quote(upload_id, safe='')}",
+            "UploadPart",
+            body=data,
+        )
+        return response.headers["etag"]
+
+    async def _complete_multipart_upload(
+        self, key: str, upload_id: str, parts: List[Tuple[int, str]]
+    ) -> None:
+        body = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in parts
+        )
+        await self._request(
+            "POST",
+            f"{self._url(key)}?uploadId={quote(upload_id, safe='')}",
+            "CompleteMultipartUpload",
+            body=f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>".encode(),
+        )
+
+    async def _abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        await self._request(
+            "DELETE", f"{self._url(key)}?uploadId={quote(upload_id, safe='')}", "AbortMultipartUpload"
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _object_headers(content_type: str, content_encoding: Optional[str]) -> dict:
+    headers = {"Content-Type": content_type}
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return headers
+
+
+_storage_service: Optional[PrivateStorage] = None
+
+
+def get_private_storage_service() -> PrivateStorage:
     global _storage_service
     if _storage_service is None:
-        _storage_service = PrivateStorageService()
+        engine = get_settings().STORAGE_ENGINE
+        if engine == "async":
+            _storage_service = AsyncPrivateStorageService()
+        elif engine == "boto3":
+            _storage_service = PrivateStorageService()
+        else:
+            raise ValueError(f"unknown STORAGE_ENGINE: {engine}")
     return _storage_service
+
+
+async def close_private_storage_service() -> None:
+    global _storage_service
+    if _storage_service is not None:
+        await _storage_service.aclose()
+        _storage_service = None
@@ -0,0 +1,79 @@
+"""Train the zstd dictionary used for private payloads.
+
+    python -m app.services.zstd_dictionary
+
+Samples are the most recent private versions, read back through
+``read_private_payload`` so already-compressed payloads contribute their raw
+JSON. The dictionary is written to PRIVATE_PAYLOAD_ZSTD_DICT_DIR as
+``<dict_id>.zdict``; point PRIVATE_PAYLOAD_ZSTD_DICT_PATH at it and restart.
+Leave earlier dictionaries in that directory: versions store the id they were
+compressed with and are decoded with that dictionary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+from typing import List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_session
+from app.models import ApplicationPrivateVersion
+from app.services.blobs import read_private_payload
+from app.services.compression import train_zstd_dictionary, zstd_dictionary_id, zstd_dictionary_path
+from app.services.storage import PrivateStorage, get_private_storage_service
+
+logger = logging.getLogger(__name__)
+
+
+async def collect_samples(session: AsyncSession, storage: PrivateStorage, limit: int) -> List[bytes]:
+    """Raw payloads of the ``limit`` newest private versions, one per distinct blob."""
+    versions = (
+        await session.scalars(
+            select(ApplicationPrivateVersion)
+            .order_by(ApplicationPrivateVersion.uploaded_at.desc())
+            .limit(limit)
+        )
+    ).all()
+    samples = []
+    seen = set()
+    for version in versions:
+        if version.payload_sha256 in seen:
+            continue
+        seen.add(version.payload_sha256)
+        try:
+            samples.append(await read_private_payload(storage, version))
+        except Exception as exc:  # noqa: BLE001 - one unreadable object should not stop training
+            logger.warning("Skipping private version %s: %s", version.id, exc)
+    return samples
+
+
+async def train(limit: int, dict_size: int) -> Tuple[str, int]:
+    """Train and save a dictionary; returns its path and the number of samples."""
+    async with get_session() as session:
+        samples = await collect_samples(session, get_private_storage_service(), limit)
+    if not samples:
+        raise SystemExit("no private payloads to train on")
+    dictionary = train_zstd_dictionary(samples, dict_size)
+    output = zstd_dictionary_path(zstd_dictionary_id(dictionary))
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "wb") as handle:
+        handle.write(dictionary)
+    return output, len(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=2000, help="private versions to sample")
+    parser.add_argument("--dict-size", type=int, default=16 * 1024, help="dictionary size in bytes")
+    args = parser.parse_args()
+    output, count = asyncio.run(train(args.samples, args.dict_size))
+    print(f"trained {output} from {count} payloads")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""trigram skill search and keyset index for bounties
+
+Revision ID: 0003_bounty_skill_search
+Revises: 0002_extend_bounty_fields
+Create Date: 2026-10-17 00:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003_bounty_skill_search"
+down_revision = "0002_extend_bounty_fields"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_bounty_skills_trgm",
+        "bounties",
+        [sa.text("lower(skills::text) gin_trgm_ops")],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_bounty_created_at_id", "bounties", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bounty_created_at_id", table_name="bounties")
+    op.drop_index("ix_bounty_skills_trgm", table_name="bounties")
@@ -0,0 +1,38 @@
+"""shared auth challenge store
+
+Revision ID: 0004_auth_challenges
+Revises: 0003_bounty_skill_search
+Create Date: 2026-10-17 01:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004_auth_challenges"
+down_revision = "0003_bounty_skill_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "auth_challenges",
+        sa.Column("nonce", sa.String(length=64), nullable=False),
+        sa.Column("wallet", sa.String(length=128), nullable=False),
+        sa.Column("issued_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("purpose", sa.String(length=255), nullable=False),
+        sa.Column("domain", sa.String(length=255), nullable=False),
+        sa.Column("message", sa.Text(), nullable=False),
+        sa.PrimaryKeyConstraint("nonce"),
+    )
+    op.create_index(
+        "ix_auth_challenges_expires_at", "auth_challenges", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_auth_challenges_expires_at", table_name="auth_challenges")
+    op.drop_table("auth_challenges")
@@ -0,0 +1,44 @@
+"""content-addressed private blobs
+
+Revision ID: 0005_private_blobs
+Revises: 0004_auth_challenges
+Create Date: 2026-10-17 03:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0005_private_blobs"
+down_revision = "0004_auth_challenges"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "private_blobs",
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column("s3_key", sa.String(length=512), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("stored", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+        sa.Column("released_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("sha256"),
+    )
+    op.create_index(
+        "ix_private_blobs_released_at",
+        "private_blobs",
+        ["released_at"],
+        unique=False,
+        postgresql_where=sa.text("ref_count <= 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_private_blobs_released_at", table_name="private_blobs")
+    op.drop_table("private_blobs")
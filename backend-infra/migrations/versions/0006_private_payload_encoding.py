@@ -0,0 +1,41 @@
+"""private payload compression metadata
+
+Revision ID: 0006_private_payload_encoding
+Revises: 0005_private_blobs
+Create Date: 2026-10-17 04:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0006_private_payload_encoding"
+down_revision = "0005_private_blobs"
+branch_labels = None
+depends_on = None
+
+_TABLES = ("application_private_versions", "private_blobs")
+
+
+def upgrade() -> None:
+    for table in _TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "content_encoding", sa.String(length=16), nullable=False, server_default="identity"
+            ),
+        )
+        op.add_column(table, sa.Column("stored_sha256", sa.String(length=64), nullable=True))
+        op.add_column(table, sa.Column("stored_size_bytes", sa.BigInteger(), nullable=True))
+    op.add_column(
+        "application_private_versions", sa.Column("size_bytes", sa.BigInteger(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("application_private_versions", "size_bytes")
+    for table in _TABLES:
+        op.drop_column(table, "stored_size_bytes")
+        op.drop_column(table, "stored_sha256")
+        op.drop_column(table, "content_encoding")
@@ -0,0 +1,43 @@
+"""keyset indexes for application listing
+
+Revision ID: 0007_application_listing_indexes
+Revises: 0006_private_payload_encoding
+Create Date: 2026-10-17 05:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0007_application_listing_indexes"
+down_revision = "0006_private_payload_encoding"
+branch_labels = None
+depends_on = None
+
+# The composite indexes lead with the same columns as the single-column ones
+# they replace, so equality lookups keep an index.
+_REPLACED = {
+    "ix_application_status": ["status"],
+    "ix_application_bounty_id": ["bounty_id"],
+    "ix_application_applicant_wallet": ["applicant_wallet"],
+}
+_COMPOSITE = {
+    "ix_application_created_at_id": ["created_at", "id"],
+    "ix_application_bounty_created": ["bounty_id", "created_at", "id"],
+    "ix_application_applicant_created": ["applicant_wallet", "created_at", "id"],
+    "ix_application_status_created": ["status", "created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in _COMPOSITE.items():
+        op.create_index(name, "applications", columns, unique=False)
+    for name in _REPLACED:
+        op.drop_index(name, table_name="applications")
+
+
+def downgrade() -> None:
+    for name, columns in _REPLACED.items():
+        op.create_index(name, "applications", columns, unique=False)
+    for name in _COMPOSITE:
+        op.drop_index(name, table_name="applications")
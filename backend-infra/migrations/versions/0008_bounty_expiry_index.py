@@ -0,0 +1,31 @@
+"""partial index for expiring open bounties
+
+Revision ID: 0008_bounty_expiry_index
+Revises: 0007_application_listing_indexes
+Create Date: 2026-10-17 06:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0008_bounty_expiry_index"
+down_revision = "0007_application_listing_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches the member names the ORM writes for the non-native status enum.
+    op.create_index(
+        "ix_bounty_open_expires_at",
+        "bounties",
+        ["expires_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'OPEN'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bounty_open_expires_at", table_name="bounties")
@@ -0,0 +1,77 @@
+"""monthly range partitions and BRIN index for events
+
+Revision ID: 0009_partition_events
+Revises: 0008_bounty_expiry_index
+Create Date: 2026-10-17 07:00:00.000000
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0009_partition_events"
+down_revision = "0008_bounty_expiry_index"
+branch_labels = None
+depends_on = None
+
+# Months created ahead of now; the scheduler keeps extending this window.
+MONTHS_AHEAD = 3
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partitions(first: date, last: date) -> None:
+    month = first
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE events_p{month.year:04d}{month.month:02d} PARTITION OF events "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+
+
+def upgrade() -> None:
+    # A plain table cannot be turned into a partitioned one, so rebuild it and copy the rows.
+    op.drop_index("ix_events_entity", table_name="events")
+    op.rename_table("events", "events_legacy")
+    op.execute("ALTER TABLE events_legacy RENAME CONSTRAINT events_pkey TO events_legacy_pkey")
+
+    # LIKE keeps the column types and the id sequence default.
+    op.execute("CREATE TABLE events (LIKE events_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (created_at)")
+    op.execute("ALTER TABLE events ADD PRIMARY KEY (id, created_at)")
+    op.execute("ALTER SEQUENCE events_id_seq OWNED BY events.id")
+    op.create_foreign_key(
+        "events_created_by_id_fkey", "events", "accounts", ["created_by_id"], ["id"], ondelete="SET NULL"
+    )
+
+    today = datetime.now(timezone.utc).date().replace(day=1)
+    oldest = op.get_bind().execute(sa.text("SELECT min(created_at) FROM events_legacy")).scalar()
+    first = oldest.date().replace(day=1) if oldest else today
+    _create_partitions(min(first, today), _add_months(today, MONTHS_AHEAD))
+    op.execute("CREATE TABLE events_default PARTITION OF events DEFAULT")
+
+    op.create_index("ix_events_entity", "events", ["entity_type", "entity_id"], unique=False)
+    op.create_index("ix_events_created_at_brin", "events", ["created_at"], unique=False, postgresql_using="brin")
+
+    op.execute("INSERT INTO events SELECT * FROM events_legacy ORDER BY created_at")
+    op.drop_table("events_legacy")
+
+
+def downgrade() -> None:
+    op.rename_table("events", "events_partitioned")
+    op.execute("ALTER TABLE events_partitioned RENAME CONSTRAINT events_pkey TO events_partitioned_pkey")
+    op.execute("CREATE TABLE events (LIKE events_partitioned INCLUDING DEFAULTS)")
+    op.execute("ALTER TABLE events ADD PRIMARY KEY (id)")
+    op.execute("ALTER SEQUENCE events_id_seq OWNED BY events.id")
+    op.execute("INSERT INTO events SELECT * FROM events_partitioned ORDER BY id")
+    op.drop_table("events_partitioned")
+    op.create_foreign_key(
+        "events_created_by_id_fkey", "events", "accounts", ["created_by_id"], ["id"], ondelete="SET NULL"
+    )
+    op.create_index("ix_events_entity", "events", ["entity_type", "entity_id"], unique=False)
@@ -0,0 +1,46 @@
+"""deposit confirmation scheduling columns
+
+Revision ID: 0010_deposit_confirmation
+Revises: 0009_partition_events
+Create Date: 2026-10-17 15:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0010_deposit_confirmation"
+down_revision = "0009_partition_events"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "deposits",
+        sa.Column("confirmation_attempts", sa.Integer(), server_default=sa.text("0"), nullable=False),
+    )
+    op.add_column(
+        "deposits",
+        sa.Column(
+            "next_check_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("NOW()"),
+            nullable=False,
+        ),
+    )
+    # Matches the member names the ORM writes for the non-native status enum.
+    op.create_index(
+        "ix_deposits_pending_next_check",
+        "deposits",
+        ["next_check_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deposits_pending_next_check", table_name="deposits")
+    op.drop_column("deposits", "next_check_at")
+    op.drop_column("deposits", "confirmation_attempts")
@@ -0,0 +1,32 @@
+import uuid
+
+from sqlalchemy.orm import Session
+
+from app.services.accounts import AccountIdCache, account_id_cache
+
+
+def test_cache_is_bounded_lru():
+    cache = AccountIdCache(maxsize=2)
+    ids = {name: uuid.uuid4() for name in ("a", "b", "c")}
+    cache.update({"a": ids["a"], "b": ids["b"]})
+    assert cache.get("a") == ids["a"]  # refreshes "a"
+
+    cache.update({"c": ids["c"]})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == ids["a"]
+    assert len(cache) == 2
+
+
+def test_pending_ids_publish_on_commit_only():
+    committed_id, rolled_back_id = uuid.uuid4(), uuid.uuid4()
+    account_id_cache.clear()
+
+    session = Session()
+    session.info["account_ids_pending"] = {"WalletRolledBack": rolled_back_id}
+    session.rollback()
+    session.info["account_ids_pending"] = {"WalletCommitted": committed_id}
+    session.commit()
+
+    assert account_id_cache.get("WalletCommitted") == committed_id
+    assert account_id_cache.get("WalletRolledBack") is None
@@ -0,0 +1,266 @@
+import asyncio
+import dataclasses
+import hashlib
+from urllib.parse import unquote
+
+import httpx
+import pytest
+from botocore.exceptions import ClientError
+
+from app.config import get_settings
+from app.services.storage import (
+    MIN_MULTIPART_PART_SIZE,
+    AsyncPrivateStorageService,
+    PayloadTooLarge,
+    PresignCache,
+    PresignedUrl,
+    checksum_to_sha256_hex,
+    sha256_hex_to_checksum,
+)
+
+
+class FakeS3:
+    """Minimal path-style S3 stand-in served through httpx.MockTransport."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.buckets: set = set()
+        self.objects: dict = {}
+        self.delay = delay
+        self.uploads: dict = {}
+        self.aborted: list = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        assert request.headers["authorization"].startswith("AWS4-HMAC-SHA256")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            return self._handle(request)
+        finally:
+            self.in_flight -= 1
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        bucket, _, key = unquote(request.url.path).lstrip("/").partition("/")
+        if not key:
+            if request.method == "HEAD":
+                return httpx.Response(200 if bucket in self.buckets else 404)
+            self.buckets.add(bucket)
+            return httpx.Response(200)
+        if bucket not in self.buckets:
+            return httpx.Response(404, text="NoSuchBucket")
+        params = request.url.params
+        if "uploads" in params:
+            upload_id = f"upload-{len(self.uploads) + 1}"
+            self.uploads[upload_id] = {}
+            return httpx.Response(
+                200, text=f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>"
+            )
+        if "uploadId" in params:
+            parts = self.uploads[params["uploadId"]]
+            if request.method == "PUT":
+                parts[int(params["partNumber"])] = request.content
+                return httpx.Response(200, headers={"etag": f'"etag-{params["partNumber"]}"'})
+            if request.method == "DELETE":
+                self.aborted.append(params["uploadId"])
+                del self.uploads[params["uploadId"]]
+                return httpx.Response(204)
+            content = b"".join(parts[number] for number in sorted(parts))
+            self.objects[key] = (content, None)
+            return httpx.Response(200, text="<CompleteMultipartUploadResult/>")
+        if request.method == "PUT":
+            self.objects[key] = (request.content, request.headers.get("content-type"))
+            return httpx.Response(200)
+        if request.method == "HEAD":
+            if key not in self.objects:
+                return httpx.Response(404)
+            content, content_type = self.objects[key]
+            headers = {"content-length": str(len(content)), "content-type": content_type}
+            if request.headers.get("x-amz-checksum-mode") == "ENABLED":
+                headers["x-amz-checksum-sha256"] = sha256_hex_to_checksum(
+                    hashlib.sha256(content).hexdigest()
+                )
+            return httpx.Response(200, headers=headers)
+        if request.method == "DELETE":
+            self.objects.pop(key, None)
+            return httpx.Response(204)
+        return httpx.Response(405)
+
+
+def _service(fake: FakeS3, monkeypatch, **overrides) -> AsyncPrivateStorageService:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test-key")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test-secret")
+    settings = dataclasses.replace(
+        get_settings(), AWS_S3_ENDPOINT_URL="http://s3.local", **overrides
+    )
+    return AsyncPrivateStorageService(settings=settings, transport=httpx.MockTransport(fake))
+
+
+def test_put_creates_bucket_and_stores_object(monkeypatch):
+    fake = FakeS3()
+    service = _service(fake, monkeypatch)
+
+    asyncio.run(service.put_object("applications/a/private/v/profile.json", b'{"a": 1}'))
+
+    assert get_settings().S3_PRIVATE_BUCKET in fake.buckets
+    assert fake.objects["applications/a/private/v/profile.json"] == (b'{"a": 1}', "application/json")
+
+
+def test_delete_removes_object(monkeypatch):
+    fake = FakeS3()
+    service = _service(fake, monkeypatch)
+
+    async def scenario():
+        await service.put_object("k", b"x")
+        await service.delete_object("k")
+
+    asyncio.run(scenario())
+    assert fake.objects == {}
+
+
+def test_concurrency_is_bounded(monkeypatch):
+    fake = FakeS3(delay=0.01)
+    service = _service(fake, monkeypatch, S3_MAX_CONCURRENCY=3)
+
+    async def scenario():
+        await asyncio.gather(*(service.put_object(f"k{i}", b"x") for i in range(12)))
+
+    asyncio.run(scenario())
+    assert len(fake.objects) == 12
+    assert fake.max_in_flight <= 3
+
+
+def test_errors_surface_as_client_error(monkeypatch):
+    fake = FakeS3()
+    service = _service(fake, monkeypatch)
+    service._bucket_ensured = True  # skip creation so the bucket is missing
+
+    with pytest.raises(ClientError) as exc_info:
+        asyncio.run(service.put_object("k", b"x"))
+    assert exc_info.value.response["Error"]["Code"] == "404"
+
+
+def test_presigned_put_url_is_signed_without_network(monkeypatch):
+    fake = FakeS3()
+    service = _service(fake, monkeypatch)
+
+    presigned = service.generate_put_url("applications/a/attachments/v/cv.pdf", "application/pdf")
+
+    assert presigned.url.startswith("http://s3.local/")
+    assert "X-Amz-Signature=" in presigned.url
+    assert "content-type" in unquote(presigned.url)
+    assert fake.buckets == set()
+
+
+def test_head_reports_size_and_sha256(monkeypatch):
+    fake = FakeS3()
+    service = _service(fake, monkeypatch)
+
+    async def scenario():
+        await service.put_object("k", b"resume")
+        return await service.head_object("k"), await service.head_object("missing")
+
+    head, missing = asyncio.run(scenario())
+    assert head.size == 6
+    assert head.sha256 == hashlib.sha256(b"resume").hexdigest()
+    assert missing is None
+
+
+def test_presigned_put_pins_checksum_header(monkeypatch):
+    service = _service(FakeS3(), monkeypatch)
+    digest = hashlib.sha256(b"resume").hexdigest()
+
+    presigned = service.generate_put_url("k", sha256=digest)
+
+    assert presigned.headers["x-amz-checksum-sha256"] == sha256_hex_to_checksum(digest)
+    assert "x-amz-checksum-sha256" in unquote(presigned.url)
+
+
+def test_checksum_conversion_ignores_multipart_composites():
+    digest = hashlib.sha256(b"x").hexdigest()
+    assert checksum_to_sha256_hex(sha256_hex_to_checksum(digest)) == digest
+    assert checksum_to_sha256_hex(sha256_hex_to_checksum(digest) + "-3") is None
+    assert checksum_to_sha256_hex(None) is None
+
+
+async def _chunks(data: bytes, size: int = 256 * 1024):
+    for offset in range(0, len(data), size):
+        yield data[offset:offset + size]
+
+
+def test_put_stream_small_payload_uses_single_put(monkeypatch):
+    fake = FakeS3()
+    service = _service(fake, monkeypatch)
+
+    stored = asyncio.run(service.put_stream("k", _chunks(b"x" * 1000)))
+
+    assert stored.parts == 0
+    assert stored.sha256 == hashlib.sha256(b"x" * 1000).hexdigest()
+    assert fake.objects["k"][0] == b"x" * 1000
+    assert fake.uploads == {}
+
+
+def test_put_stream_splits_into_bounded_parallel_parts(monkeypatch):
+    fake = FakeS3(delay=0.01)
+    service = _service(
+        fake, monkeypatch, S3_MULTIPART_PART_SIZE=MIN_MULTIPART_PART_SIZE, S3_MULTIPART_CONCURRENCY=2
+    )
+    data = bytes(range(256)) * (MIN_MULTIPART_PART_SIZE * 3 // 256 + 100)
+
+    stored = asyncio.run(service.put_stream("big", _chunks(data)))
+
+    assert stored.parts == 4
+    assert stored.size == len(data)
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert fake.objects["big"][0] == data
+    assert fake.max_in_flight <= 2
+
+
+def test_put_stream_aborts_when_limit_exceeded(monkeypatch):
+    fake = FakeS3()
+    service = _service(fake, monkeypatch, S3_MULTIPART_PART_SIZE=MIN_MULTIPART_PART_SIZE)
+    data = b"y" * (MIN_MULTIPART_PART_SIZE + 1024)
+
+    with pytest.raises(PayloadTooLarge):
+        asyncio.run(service.put_stream("k", _chunks(data), max_bytes=MIN_MULTIPART_PART_SIZE + 10))
+
+    assert fake.aborted == ["upload-1"]
+    assert "k" not in fake.objects
+
+
+def test_presigned_urls_are_reused_and_batched(monkeypatch):
+    service = _service(FakeS3(), monkeypatch)
+
+    first = service.generate_get_url("k1")
+    batch = service.generate_get_urls(["k1", "k2", "k1"])
+
+    assert set(batch) == {"k1", "k2"}
+    assert batch["k1"].url == first.url
+    stats = service.presign_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_presign_cache_drops_entries_inside_safety_margin(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("app.services.storage.time.monotonic", lambda: clock[0])
+    cache = PresignCache(maxsize=2, margin_seconds=300)
+    cache.put(("GET", "k", None, None), PresignedUrl(url="u", expires_in=900))
+
+    clock[0] += 500
+    reused = cache.get(("GET", "k", None, None))
+    assert reused.url == "u" and reused.expires_in == 400
+
+    clock[0] += 200
+    assert cache.get(("GET", "k", None, None)) is None
+
+
+def test_presign_cache_is_bounded():
+    cache = PresignCache(maxsize=2, margin_seconds=0)
+    for name in ("a", "b", "c"):
+        cache.put(("GET", name, None, None), PresignedUrl(url=name, expires_in=900))
+
+    assert cache.get(("GET", "a", None, None)) is None
+    assert cache.get(("GET", "c", None, None)).url == "c"
@@ -0,0 +1,24 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.blobs import find_stored_blob
+
+
+class RecordingSession:
+    def __init__(self) -> None:
+        self.statements: list = []
+
+    async def scalar(self, statement):
+        self.statements.append(statement)
+        return None
+
+
+def test_stored_blob_lookup_is_scoped_to_the_applicant():
+    session = RecordingSession()
+
+    assert asyncio.run(find_stored_blob(session, "a" * 64, "wallet-1")) is None
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "applications.applicant_wallet = " in sql
+    assert "private_blobs.stored" in sql
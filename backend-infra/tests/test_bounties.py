@@ -0,0 +1,16 @@
+import json
+
+import pytest
+
+from app.api.bounties import _json_text
+
+
+@pytest.mark.parametrize("skill", ['C"++', "back\\slash", "tab\there", "Rust", "Ελληνικά"])
+def test_skill_prefilter_term_matches_jsonb_text(skill):
+    # jsonb::text renders strings the way json.dumps does with ensure_ascii off.
+    stored = json.dumps(["Go", skill], ensure_ascii=False).lower()
+    assert _json_text(skill.lower()) in stored
+
+
+def test_raw_skill_with_quote_misses_jsonb_text():
+    assert 'c"++' not in json.dumps(['C"++']).lower()
@@ -0,0 +1,40 @@
+import asyncio
+from datetime import timedelta
+
+from app.auth.auth import now_utc
+from app.schemas.auth import ChallengeRecord
+from app.services.challenges import InMemoryChallengeStore
+
+
+def _record(nonce: str, ttl_seconds: int) -> ChallengeRecord:
+    issued = now_utc()
+    return ChallengeRecord(
+        wallet="Wallet1111111111111111111111",
+        nonce=nonce,
+        issued_at=issued,
+        expires_at=issued + timedelta(seconds=ttl_seconds),
+        purpose="Login",
+        domain="example.com",
+        message="Sign in",
+    )
+
+
+def test_in_memory_store_is_single_use():
+    store = InMemoryChallengeStore()
+    asyncio.run(store.put(_record("nonce-a", 300)))
+
+    first = asyncio.run(store.consume("nonce-a"))
+    second = asyncio.run(store.consume("nonce-a"))
+
+    assert first is not None and first.nonce == "nonce-a"
+    assert second is None
+
+
+def test_in_memory_store_purges_expired_records():
+    store = InMemoryChallengeStore()
+    asyncio.run(store.put(_record("stale", -1)))
+    asyncio.run(store.put(_record("fresh", 300)))
+
+    assert len(store) == 1
+    assert asyncio.run(store.consume("stale")) is None
+    assert asyncio.run(store.consume("fresh")) is not None
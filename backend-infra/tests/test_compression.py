@@ -0,0 +1,147 @@
+import asyncio
+import dataclasses
+import gzip
+import hashlib
+import json
+import os
+
+import pytest
+
+from app.config import get_settings
+from app.services import compression
+from app.services.compression import (
+    GZIP,
+    IDENTITY,
+    ZSTD,
+    RawTally,
+    compress,
+    compress_stream,
+    decompress,
+    encode_payload,
+    train_zstd_dictionary,
+    zstd_dictionary_id,
+    zstd_dictionary_path,
+)
+from app.services.storage import PayloadTooLarge
+
+PROFILE = json.dumps(
+    {"full_name": "Ava Solana", "contact_email": "ava@example.dev", "skills": ["Rust"] * 200}
+).encode()
+
+
+@pytest.fixture
+def gzip_settings(monkeypatch):
+    settings = dataclasses.replace(get_settings(), PRIVATE_PAYLOAD_COMPRESSION="gzip")
+    monkeypatch.setattr(compression, "get_settings", lambda: settings)
+    return settings
+
+
+def _profile(index):
+    return json.dumps(
+        {"full_name": f"Applicant {index}", "contact_email": f"a{index}@example.dev", "skills": ["Rust", "Go"]}
+    ).encode()
+
+
+@pytest.fixture
+def zstd_settings(monkeypatch, tmp_path):
+    """zstd settings factory; each call may point PRIVATE_PAYLOAD_ZSTD_DICT_PATH elsewhere."""
+
+    def configure(dict_path=None):
+        settings = dataclasses.replace(
+            get_settings(),
+            PRIVATE_PAYLOAD_COMPRESSION="zstd",
+            PRIVATE_PAYLOAD_COMPRESSION_MIN_BYTES=0,
+            PRIVATE_PAYLOAD_ZSTD_DICT_PATH=dict_path,
+            PRIVATE_PAYLOAD_ZSTD_DICT_DIR=str(tmp_path),
+        )
+        monkeypatch.setattr(compression, "get_settings", lambda: settings)
+        compression._zstd_dictionary.cache_clear()
+        compression._zstd_dictionary_by_id.cache_clear()
+
+    yield configure
+    compression._zstd_dictionary.cache_clear()
+    compression._zstd_dictionary_by_id.cache_clear()
+
+
+def _save_dictionary(samples, dict_size=1024):
+    dictionary = train_zstd_dictionary(samples, dict_size)
+    path = zstd_dictionary_path(zstd_dictionary_id(dictionary))
+    with open(path, "wb") as handle:
+        handle.write(dictionary)
+    return path
+
+
+def test_zstd_encoding_records_dictionary_and_survives_retraining(zstd_settings):
+    zstd_settings()
+    first = _save_dictionary([_profile(i) for i in range(200)])
+    zstd_settings(first)
+    old = encode_payload(PROFILE)
+    assert old.encoding == f"{ZSTD}:{os.path.basename(first).split('.')[0]}"
+
+    second = _save_dictionary([_profile(i) + b" " for i in range(300, 500)], dict_size=2048)
+    zstd_settings(second)
+    assert encode_payload(PROFILE).encoding != old.encoding
+    assert decompress(old.content, old.encoding) == PROFILE
+
+
+def test_plain_zstd_reads_dictionary_id_from_frame(zstd_settings):
+    zstd_settings()
+    path = _save_dictionary([_profile(i) for i in range(200)])
+    zstd_settings(path)
+    # Rows written before the id was recorded say only "zstd".
+    legacy = compress(PROFILE, encode_payload(PROFILE).encoding)
+    zstd_settings()
+    assert decompress(legacy, ZSTD) == PROFILE
+
+
+def test_missing_zstd_dictionary_fails_loudly(zstd_settings):
+    zstd_settings()
+    path = _save_dictionary([_profile(i) for i in range(200)])
+    zstd_settings(path)
+    encoded = encode_payload(PROFILE)
+    os.remove(path)
+    zstd_settings()
+    with pytest.raises(ValueError, match="zstd dictionary"):
+        decompress(encoded.content, encoded.encoding)
+
+
+def test_encode_payload_round_trips_and_records_stored_digest(gzip_settings):
+    encoded = encode_payload(PROFILE)
+
+    assert encoded.encoding == GZIP
+    assert len(encoded.content) < len(PROFILE)
+    assert encoded.sha256 == hashlib.sha256(encoded.content).hexdigest()
+    assert decompress(encoded.content, encoded.encoding) == PROFILE
+
+
+def test_encode_payload_is_deterministic(gzip_settings):
+    assert encode_payload(PROFILE).sha256 == encode_payload(PROFILE).sha256
+
+
+def test_small_payloads_stay_uncompressed(gzip_settings):
+    encoded = encode_payload(b"{}")
+    assert encoded.encoding == IDENTITY
+    assert encoded.content == b"{}"
+
+
+def test_compress_stream_tallies_raw_bytes(gzip_settings):
+    async def chunks():
+        for offset in range(0, len(PROFILE), 100):
+            yield PROFILE[offset:offset + 100]
+
+    async def collect(tally):
+        return b"".join([chunk async for chunk in compress_stream(chunks(), GZIP, tally)])
+
+    tally = RawTally()
+    stored = asyncio.run(collect(tally))
+
+    assert gzip.decompress(stored) == PROFILE
+    assert tally.size == len(PROFILE)
+    assert tally.sha256 == hashlib.sha256(PROFILE).hexdigest()
+
+
+def test_raw_tally_enforces_limit():
+    tally = RawTally(max_bytes=4)
+    tally.update(b"abcd")
+    with pytest.raises(PayloadTooLarge):
+        tally.update(b"e")
@@ -0,0 +1,197 @@
+import asyncio
+import dataclasses
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.config import get_settings
+from app.models import DepositStatus
+from app.services import deposit_confirmations
+from app.services.deposit_confirmations import (
+    AdaptiveBackoff,
+    ClaimedDeposit,
+    DepositConfirmer,
+    apply_statement,
+    resolve_deposit,
+)
+from app.services.solana import (
+    MAX_SIGNATURES_PER_REQUEST,
+    FakeSolanaRpcClient,
+    SignatureStatus,
+    SolanaRpcClient,
+    SolanaRpcError,
+)
+
+NOW = datetime(2026, 10, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def _settings(**overrides):
+    return dataclasses.replace(get_settings(), SOLANA_RPC_URL="http://rpc.local", **overrides)
+
+
+def _signature(index: int) -> str:
+    return f"5{index:0>10}".replace("0", "A") + "x" * 76
+
+
+def _deposit(index: int, attempts: int = 0) -> ClaimedDeposit:
+    return ClaimedDeposit(id=uuid.uuid4(), tx_signature=_signature(index), confirmation_attempts=attempts)
+
+
+class FakeRpcNode:
+    """getSignatureStatuses served through httpx.MockTransport."""
+
+    def __init__(self, statuses: dict, delay: float = 0.0, status_code: int = 200) -> None:
+        self.statuses = statuses
+        self.delay = delay
+        self.status_code = status_code
+        self.requests: list = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.status_code != 200:
+                return httpx.Response(self.status_code, headers={"Retry-After": "7"})
+            body = json.loads(request.content)
+            signatures = body["params"][0]
+            self.requests.append(signatures)
+            value = [self.statuses.get(signature) for signature in signatures]
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": 1, "result": {"value": value}})
+        finally:
+            self.in_flight -= 1
+
+
+def test_rpc_client_splits_lookups_and_keeps_order():
+    signatures = [_signature(i) for i in range(600)]
+    node = FakeRpcNode(
+        {signatures[3]: {"slot": 9, "confirmationStatus": "finalized", "err": None}}, delay=0.01
+    )
+    client = SolanaRpcClient(_settings(SOLANA_RPC_MAX_CONCURRENCY=2), transport=httpx.MockTransport(node))
+
+    statuses = asyncio.run(client.get_signature_statuses(signatures))
+
+    assert [len(chunk) for chunk in node.requests] == [256, 256, 88]
+    assert node.max_in_flight <= 2
+    assert len(statuses) == 600
+    assert statuses[3] == SignatureStatus(slot=9, confirmation_status="finalized", err=None)
+    assert statuses[4] is None
+
+
+def test_rpc_client_surfaces_retry_after():
+    node = FakeRpcNode({}, status_code=429)
+    client = SolanaRpcClient(_settings(), transport=httpx.MockTransport(node))
+
+    with pytest.raises(SolanaRpcError) as excinfo:
+        asyncio.run(client.get_signature_statuses([_signature(1)]))
+    assert excinfo.value.retry_after == 7.0
+
+
+def test_resolve_deposit_outcomes():
+    settings = _settings(
+        DEPOSIT_CONFIRMATION_BACKOFF_SECONDS=5.0,
+        DEPOSIT_CONFIRMATION_MAX_BACKOFF_SECONDS=60.0,
+        DEPOSIT_CONFIRMATION_MAX_ATTEMPTS=5,
+        DEPOSIT_CONFIRMATION_COMMITMENT="finalized",
+    )
+    finalized = SignatureStatus(slot=1, confirmation_status="finalized")
+    confirmed = SignatureStatus(slot=1, confirmation_status="confirmed")
+    failed = SignatureStatus(slot=1, confirmation_status="finalized", err={"InstructionError": [0, "Custom"]})
+
+    cleared = resolve_deposit(_deposit(1), finalized, NOW, settings)
+    assert cleared["status"] is DepositStatus.CLEARED and cleared["cleared_at"] == NOW
+
+    waiting = resolve_deposit(_deposit(1, attempts=2), confirmed, NOW, settings)
+    assert waiting["status"] is DepositStatus.PENDING
+    assert waiting["attempts"] == 2
+    assert waiting["next_check_at"] == NOW + timedelta(seconds=5)
+
+    assert resolve_deposit(_deposit(1), failed, NOW, settings)["status"] is DepositStatus.FAILED
+
+    unknown = resolve_deposit(_deposit(1, attempts=3), None, NOW, settings)
+    assert unknown["status"] is DepositStatus.PENDING
+    assert unknown["attempts"] == 4
+    assert unknown["next_check_at"] == NOW + timedelta(seconds=40)
+    assert resolve_deposit(_deposit(1, attempts=4), None, NOW, settings)["status"] is DepositStatus.FAILED
+
+
+def test_adaptive_backoff_doubles_and_resets():
+    now = [100.0]
+    backoff = AdaptiveBackoff(base=2.0, maximum=10.0, clock=lambda: now[0])
+
+    assert [backoff.failure() for _ in range(4)] == [2.0, 4.0, 8.0, 10.0]
+    assert not backoff.ready()
+    assert backoff.failure(retry_after=30.0) == 30.0
+    now[0] += 30.0
+    assert backoff.ready()
+    backoff.success()
+    assert backoff.failure() == 2.0
+
+
+def test_apply_statement_is_a_single_values_update():
+    rows = [resolve_deposit(_deposit(i), None, NOW, _settings()) for i in range(3)]
+    sql = str(apply_statement(rows).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("UPDATE deposits") == 1
+    assert "FROM (VALUES" in sql
+    assert "deposits.status =" in sql
+
+
+class RecordingSession:
+    def __init__(self) -> None:
+        self.statements: list = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_confirm_batch_uses_bulk_lookups_and_one_update(monkeypatch):
+    claimed = [_deposit(i) for i in range(300)] + [
+        ClaimedDeposit(id=uuid.uuid4(), tx_signature="tx-deposit-stub", confirmation_attempts=0)
+    ]
+
+    async def claim(session, batch_size, lease_seconds):
+        return claimed
+
+    monkeypatch.setattr(deposit_confirmations, "claim_pending_deposits", claim)
+    client = FakeSolanaRpcClient(
+        {claimed[i].tx_signature: SignatureStatus(slot=1, confirmation_status="finalized") for i in range(10)}
+    )
+    session = RecordingSession()
+    confirmer = DepositConfirmer(client, _settings())
+
+    resolved = asyncio.run(confirmer.confirm_batch(session))
+
+    # Ten cleared plus the malformed stub signature, which never reaches the RPC.
+    assert resolved == 11
+    assert [len(chunk) for chunk in client.requests] == [MAX_SIGNATURES_PER_REQUEST, 300 - MAX_SIGNATURES_PER_REQUEST]
+    assert len(session.statements) == 1
+
+
+def test_rpc_failure_pauses_the_confirmer(monkeypatch):
+    async def claim(session, batch_size, lease_seconds):
+        return [_deposit(1)]
+
+    monkeypatch.setattr(deposit_confirmations, "claim_pending_deposits", claim)
+    client = FakeSolanaRpcClient()
+    client.fail_with = SolanaRpcError("rate limited", retry_after=15.0)
+    now = [0.0]
+    session = RecordingSession()
+    confirmer = DepositConfirmer(client, _settings(), clock=lambda: now[0])
+
+    assert asyncio.run(confirmer.confirm_batch(session)) is None
+    assert session.statements == []
+    assert asyncio.run(confirmer.run()) is None
+    now[0] += 15.0
+    assert confirmer.backoff.ready()
@@ -170,3 +170,28 @@ def test_auth_me_errors():
     r2 = client3.get("/auth/me", headers={"Authorization": "Bearer not-a-jwt"})
     assert r2.status_code == 401
     assert r2.json().get("detail") == "invalid token"
+
+
+def test_private_profile_requires_session():
+    path = "/applications/00000000-0000-0000-0000-000000000001/private"
+    assert client.get(path).status_code == 401
+    r = client.get(path, headers={"Authorization": "Bearer not-a-jwt"})
+    assert r.status_code == 401
+
+
+def test_private_urls_require_session():
+    body = {"application_ids": ["00000000-0000-0000-0000-000000000001"]}
+    assert client.post("/applications/private-urls", json=body).status_code == 401
+
+
+def test_private_upload_sessions_require_session():
+    base = "/applications/00000000-0000-0000-0000-000000000001/private-uploads"
+    body = {"size_bytes": 10, "sha256": "0" * 64}
+    assert client.post(base, json=body).status_code == 401
+    complete = f"{base}/00000000-0000-0000-0000-000000000002/complete"
+    assert client.post(complete, json=body).status_code == 401
+
+
+def test_streamed_private_upload_requires_session():
+    path = "/applications/00000000-0000-0000-0000-000000000001/private"
+    assert client.put(path, content=b'{"resume": "x"}').status_code == 401
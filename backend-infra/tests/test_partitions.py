@@ -0,0 +1,25 @@
+from datetime import date
+
+from app.models import Event
+from app.services.partitions import add_months, partition_month, partition_name
+
+
+def test_add_months_crosses_year_boundaries():
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 3, 1), -14) == date(2025, 1, 1)
+
+
+def test_partition_names_round_trip():
+    name = partition_name("events", date(2026, 10, 1))
+    assert name == "events_p202610"
+    assert partition_month("events", name) == date(2026, 10, 1)
+    assert partition_month("events", "events_default") is None
+
+
+def test_events_table_is_partitioned_by_created_at():
+    table = Event.__table__
+    assert table.dialect_options["postgresql"]["partition_by"] == "RANGE (created_at)"
+    assert {column.name for column in table.primary_key.columns} == {"id", "created_at"}
+    brin = next(ix for ix in table.indexes if ix.name == "ix_events_created_at_brin")
+    assert brin.dialect_options["postgresql"]["using"] == "brin"
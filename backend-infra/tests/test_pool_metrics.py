@@ -0,0 +1,38 @@
+import dataclasses
+
+from fastapi.testclient import TestClient
+
+from app import config
+from app.config import get_settings
+from app.main import app
+from app.services.pool_metrics import PoolMetrics
+
+
+def test_observe_checkout_tracks_average_and_max():
+    metrics = PoolMetrics()
+    metrics.observe_checkout(0.01)
+    metrics.observe_checkout(0.03)
+    assert metrics.checkouts == 2
+    assert metrics.checkout_wait_max_seconds == 0.03
+    assert abs(metrics.checkout_wait_total_seconds - 0.04) < 1e-9
+
+
+def test_metrics_require_admin_token(monkeypatch):
+    client = TestClient(app)
+    monkeypatch.setattr(config, "_settings", dataclasses.replace(get_settings(), ADMIN_TOKEN=None))
+    assert client.get("/metrics/db-pool").status_code == 404
+    monkeypatch.setattr(config, "_settings", dataclasses.replace(get_settings(), ADMIN_TOKEN="secret"))
+    assert client.get("/metrics/db-pool").status_code == 401
+    assert client.get("/metrics/db-pool", headers={"X-Admin-Token": "wrong"}).status_code == 401
+
+
+def test_db_pool_endpoint_reports_configured_capacity(monkeypatch):
+    monkeypatch.setattr(config, "_settings", dataclasses.replace(get_settings(), ADMIN_TOKEN="secret"))
+    client = TestClient(app)
+    resp = client.get("/metrics/db-pool", headers={"X-Admin-Token": "secret"})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["pool_size"] == get_settings().DB_POOL_SIZE
+    assert body["max_overflow"] == get_settings().DB_MAX_OVERFLOW
+    assert body["checked_out"] == 0
+    assert body["saturation"] == 0.0
@@ -0,0 +1,51 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from app.models import Bounty, BountyStatus
+from app.services.scheduler import PeriodicJob, Scheduler
+
+
+def _job(*results):
+    outcomes = list(results)
+
+    async def func():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return PeriodicJob("test", 60, func)
+
+
+def test_run_once_tracks_rows_skips_and_failures():
+    job = _job(3, None, RuntimeError("db down"), 2)
+    for _ in range(4):
+        asyncio.run(job.run_once())
+
+    stats = job.snapshot()
+    assert stats["runs"] == 4
+    assert stats["skipped"] == 1
+    assert stats["failures"] == 1
+    assert stats["total_rows"] == 5
+    assert stats["last_rows"] == 2
+    assert stats["last_error"] is None
+    assert stats["last_duration_seconds"] >= 0
+
+
+def test_disabled_jobs_are_not_scheduled():
+    scheduler = Scheduler()
+    assert scheduler.add_job("off", 0, _job()._func) is None
+    assert scheduler.add_job("on", 30, _job()._func) is not None
+    assert list(scheduler.stats()) == ["on"]
+
+
+def test_expiry_index_matches_persisted_status():
+    index = next(ix for ix in Bounty.__table__.indexes if ix.name == "ix_bounty_open_expires_at")
+    predicate = str(index.dialect_options["postgresql"]["where"])
+    persisted = str(
+        (Bounty.status == BountyStatus.OPEN).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert persisted == f"bounties.{predicate}"
@@ -0,0 +1,24 @@
+"""Composite index for keyset job pagination
+
+Revision ID: 202610170900
+Revises: 202403251200
+Create Date: 2026-10-17 09:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "202610170900"
+down_revision = "202403251200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_jobs_created_at_id", "jobs", ["created_at", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_created_at_id", table_name="jobs")
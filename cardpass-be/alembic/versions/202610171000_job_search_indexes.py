@@ -0,0 +1,40 @@
+"""Full-text and trigram search indexes for jobs
+
+Revision ID: 202610171000
+Revises: 202610170900
+Create Date: 2026-10-17 10:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "202610171000"
+down_revision = "202610170900"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "jobs",
+        sa.Column("search_vector", postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True),
+    )
+    op.create_index("ix_jobs_search_vector", "jobs", ["search_vector"], postgresql_using="gin")
+    op.create_index("ix_jobs_title_trgm", "jobs", [sa.text("lower(title) gin_trgm_ops")], postgresql_using="gin")
+    op.create_index("ix_jobs_description_trgm", "jobs", [sa.text("lower(description) gin_trgm_ops")], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_description_trgm", table_name="jobs")
+    op.drop_index("ix_jobs_title_trgm", table_name="jobs")
+    op.drop_index("ix_jobs_search_vector", table_name="jobs")
+    op.drop_column("jobs", "search_vector")
@@ -0,0 +1,24 @@
+"""Partial index of used nonces for the reaper
+
+Revision ID: 202610171100
+Revises: 202610171000
+Create Date: 2026-10-17 11:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "202610171100"
+down_revision = "202610171000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_nonces_used", "nonces", ["id"], unique=False, postgresql_where=sa.text("used"))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_nonces_used", table_name="nonces")
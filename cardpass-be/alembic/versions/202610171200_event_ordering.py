@@ -0,0 +1,60 @@
+"""Slot ordering, processing marks and per-program checkpoints for on-chain events
+
+Revision ID: 202610171200
+Revises: 202610171100
+Create Date: 2026-10-17 12:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "202610171200"
+down_revision = "202610171100"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("onchain_events", sa.Column("slot", sa.BigInteger(), nullable=True))
+    op.add_column("onchain_events", sa.Column("processed_at", sa.DateTime(timezone=True), nullable=True))
+    # Existing rows were applied inline when they arrived.
+    op.execute("UPDATE onchain_events SET slot = (payload->>'slot')::bigint, processed_at = created_at")
+    op.create_index(
+        "ix_onchain_events_program_slot", "onchain_events", ["program_id", "slot", "signature"], unique=False
+    )
+    op.create_index(
+        "ix_onchain_events_pending",
+        "onchain_events",
+        ["slot", "signature"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+
+    op.add_column("bounties", sa.Column("last_event_slot", sa.BigInteger(), nullable=True))
+    op.add_column("bounties", sa.Column("last_event_signature", sa.String(length=255), nullable=True))
+
+    op.create_table(
+        "program_checkpoints",
+        sa.Column("program_id", sa.String(length=255), primary_key=True, nullable=False),
+        sa.Column("last_slot", sa.BigInteger(), nullable=False),
+        sa.Column("last_signature", sa.String(length=255), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO program_checkpoints (program_id, last_slot, last_signature) "
+        "SELECT DISTINCT ON (program_id) program_id, slot, signature FROM onchain_events "
+        "WHERE slot IS NOT NULL ORDER BY program_id, slot DESC, signature DESC"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("program_checkpoints")
+    op.drop_column("bounties", "last_event_signature")
+    op.drop_column("bounties", "last_event_slot")
+    op.drop_index("ix_onchain_events_pending", table_name="onchain_events")
+    op.drop_index("ix_onchain_events_program_slot", table_name="onchain_events")
+    op.drop_column("onchain_events", "processed_at")
+    op.drop_column("onchain_events", "slot")
@@ -0,0 +1,51 @@
+"""Decoded Anchor program events
+
+Revision ID: 202610171300
+Revises: 202610171200
+Create Date: 2026-10-17 13:00:00.000000
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "202610171300"
+down_revision = "202610171200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "program_events",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("signature", sa.String(length=255), nullable=False),
+        sa.Column("log_index", sa.Integer(), nullable=False),
+        sa.Column("slot", sa.BigInteger(), nullable=False),
+        sa.Column("program_id", sa.String(length=64), nullable=True),
+        sa.Column("event_name", sa.String(length=120), nullable=False),
+        sa.Column("job", sa.String(length=64), nullable=True),
+        sa.Column("recruiter", sa.String(length=64), nullable=True),
+        sa.Column("applicant", sa.String(length=64), nullable=True),
+        sa.Column("application", sa.String(length=64), nullable=True),
+        sa.Column("referrer", sa.String(length=64), nullable=True),
+        sa.Column("status", sa.String(length=64), nullable=True),
+        sa.Column("title", sa.Text(), nullable=True),
+        sa.Column("amount", sa.Numeric(20, 0), nullable=True),
+        sa.Column("link_id", sa.Numeric(20, 0), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("fields", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    )
+    op.create_index("ix_program_events_signature_log", "program_events", ["signature", "log_index"], unique=True)
+    op.create_index("ix_program_events_name_occurred", "program_events", ["event_name", "occurred_at"], unique=False)
+    op.create_index("ix_program_events_job", "program_events", ["job", "occurred_at"], unique=False)
+    op.create_index("ix_program_events_applicant", "program_events", ["applicant", "occurred_at"], unique=False)
+    op.create_index("ix_program_events_application", "program_events", ["application", "occurred_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("program_events")
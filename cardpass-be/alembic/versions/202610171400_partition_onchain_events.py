@@ -0,0 +1,123 @@
+"""Monthly range partitions, BRIN index and signature registry for onchain_events
+
+Revision ID: 202610171400
+Revises: 202610171300
+Create Date: 2026-10-17 14:00:00.000000
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "202610171400"
+down_revision = "202610171300"
+branch_labels = None
+depends_on = None
+
+# Months created ahead of now; the partition job keeps extending this window.
+MONTHS_AHEAD = 3
+
+_LEGACY_INDEXES = (
+    "ix_onchain_events_signature",
+    "ix_onchain_events_program_id",
+    "ix_onchain_events_program_slot",
+    "ix_onchain_events_pending",
+)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_partitions(first: date, last: date) -> None:
+    month = first
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE onchain_events_p{month.year:04d}{month.month:02d} PARTITION OF onchain_events "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+        )
+        month = _add_months(month, 1)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "onchain_event_signatures",
+        sa.Column("signature", sa.String(length=255), primary_key=True, nullable=False),
+        sa.Column("seen_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_onchain_event_signatures_seen_at_brin",
+        "onchain_event_signatures",
+        ["seen_at"],
+        unique=False,
+        postgresql_using="brin",
+    )
+    op.execute(
+        "INSERT INTO onchain_event_signatures (signature, seen_at) "
+        "SELECT signature, seen_at FROM onchain_events ORDER BY seen_at"
+    )
+
+    # A plain table cannot be turned into a partitioned one, so rebuild it and copy the rows.
+    for name in _LEGACY_INDEXES:
+        op.drop_index(name, table_name="onchain_events")
+    op.rename_table("onchain_events", "onchain_events_legacy")
+    op.execute("ALTER TABLE onchain_events_legacy RENAME CONSTRAINT onchain_events_pkey TO onchain_events_legacy_pkey")
+    op.execute(
+        "CREATE TABLE onchain_events (LIKE onchain_events_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (seen_at)"
+    )
+    op.execute("ALTER TABLE onchain_events ADD PRIMARY KEY (id, seen_at)")
+
+    today = datetime.now(timezone.utc).date().replace(day=1)
+    oldest = op.get_bind().execute(sa.text("SELECT min(seen_at) FROM onchain_events_legacy")).scalar()
+    first = oldest.date().replace(day=1) if oldest else today
+    _create_partitions(min(first, today), _add_months(today, MONTHS_AHEAD))
+    op.execute("CREATE TABLE onchain_events_default PARTITION OF onchain_events DEFAULT")
+
+    op.create_index("ix_onchain_events_signature", "onchain_events", ["signature"], unique=False)
+    op.create_index(
+        "ix_onchain_events_program_slot", "onchain_events", ["program_id", "slot", "signature"], unique=False
+    )
+    op.create_index(
+        "ix_onchain_events_pending",
+        "onchain_events",
+        ["slot", "signature"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+    op.create_index(
+        "ix_onchain_events_seen_at_brin", "onchain_events", ["seen_at"], unique=False, postgresql_using="brin"
+    )
+
+    op.execute("INSERT INTO onchain_events SELECT * FROM onchain_events_legacy ORDER BY seen_at")
+    op.drop_table("onchain_events_legacy")
+
+
+def downgrade() -> None:
+    op.rename_table("onchain_events", "onchain_events_partitioned")
+    op.execute(
+        "ALTER TABLE onchain_events_partitioned RENAME CONSTRAINT onchain_events_pkey TO onchain_events_partitioned_pkey"
+    )
+    for name in ("ix_onchain_events_signature", "ix_onchain_events_program_slot", "ix_onchain_events_pending"):
+        op.drop_index(name, table_name="onchain_events_partitioned")
+    op.execute("CREATE TABLE onchain_events (LIKE onchain_events_partitioned INCLUDING DEFAULTS)")
+    op.execute("ALTER TABLE onchain_events ADD PRIMARY KEY (id)")
+    op.execute("INSERT INTO onchain_events SELECT * FROM onchain_events_partitioned ORDER BY seen_at")
+    op.drop_table("onchain_events_partitioned")
+
+    op.create_index("ix_onchain_events_signature", "onchain_events", ["signature"], unique=True)
+    op.create_index("ix_onchain_events_program_id", "onchain_events", ["program_id"], unique=False)
+    op.create_index(
+        "ix_onchain_events_program_slot", "onchain_events", ["program_id", "slot", "signature"], unique=False
+    )
+    op.create_index(
+        "ix_onchain_events_pending",
+        "onchain_events",
+        ["slot", "signature"],
+        unique=False,
+        postgresql_where=sa.text("processed_at IS NULL"),
+    )
+    op.drop_table("onchain_event_signatures")
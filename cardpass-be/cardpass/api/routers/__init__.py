@@ -1,11 +1,13 @@
-from cardpass.api.routers import applications, auth, bounties, health, jobs, me, webhooks
+from cardpass.api.routers import admin, applications, auth, bounties, health, jobs, me, metrics, webhooks
 
 __all__ = [
+    "admin",
     "applications",
     "auth",
     "bounties",
     "health",
     "jobs",
     "me",
+    "metrics",
     "webhooks",
 ]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cardpass.config.settings import settings
+from cardpass.core.security import require_admin_token
+from cardpass.db.session import get_session
+from cardpass.schemas.admin import (
+    EventDecodeRequest,
+    EventDecodeResponse,
+    EventReplayRequest,
+    EventReplayResponse,
+    RefreshTokenStatsResponse,
+)
+from cardpass.schemas.metrics import PeriodicJobStats
+from cardpass.services.event_decoding import decode_stored_events
+from cardpass.services.event_processor import replay_events
+from cardpass.services.maintenance import refresh_token_table_stats
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/refresh-tokens", response_model=RefreshTokenStatsResponse)
+async def refresh_token_stats(
+    request: Request,
+    session: AsyncSession = Depends(get_session),
+) -> RefreshTokenStatsResponse:
+    table_stats = await refresh_token_table_stats(session)
+    reaper = next((job for job in request.app.state.periodic_jobs if job.name == "refresh_token_reaper"), None)
+    return RefreshTokenStatsResponse(
+        **table_stats,
+        max_sessions_per_user=settings.max_sessions_per_user,
+        reaper=PeriodicJobStats(**reaper.stats()) if reaper else None,
+    )
+
+
+@router.post("/events/replay", response_model=EventReplayResponse)
+async def replay_onchain_events(
+    payload: EventReplayRequest,
+    session: AsyncSession = Depends(get_session),
+) -> EventReplayResponse:
+    after = (payload.after_slot, payload.after_signature or "") if payload.after_slot is not None else None
+    result = await replay_events(
+        session,
+        program_id=payload.program_id,
+        after=after,
+        batch_size=payload.batch_size,
+        max_batches=payload.max_batches,
+    )
+    return EventReplayResponse(**result._asdict())
+
+
+@router.post("/events/decode", response_model=EventDecodeResponse)
+async def decode_onchain_events(
+    payload: EventDecodeRequest,
+    session: AsyncSession = Depends(get_session),
+) -> EventDecodeResponse:
+    after = (payload.after_slot, payload.after_signature or "") if payload.after_slot is not None else None
+    decoded, position = await decode_stored_events(
+        session, after=after, batch_size=payload.batch_size, max_batches=payload.max_batches
+    )
+    last_slot, last_signature = position or (None, None)
+    return EventDecodeResponse(decoded=decoded, last_slot=last_slot, last_signature=last_signature)
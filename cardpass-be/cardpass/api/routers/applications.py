@@ -5,9 +5,9 @@ import uuid
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cardpass.core.security import get_current_user, require_roles
+from cardpass.core.security import Principal, get_current_user, require_roles
 from cardpass.db.session import get_session
-from cardpass.models.user import ApplicationStatus, RoleType, User
+from cardpass.models.user import ApplicationStatus, RoleType
 from cardpass.schemas.application import (
     ApplicationCreateRequest,
     ApplicationSummary,
@@ -31,7 +31,7 @@ ApplicationListResponse = PaginatedResponse[ApplicationSummary]
 async def apply_to_job(
     job_id: uuid.UUID,
     payload: ApplicationCreateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> ApplicationSummary:
     job = await get_job_or_404(session, job_id)
@@ -44,7 +44,7 @@ async def my_applications(
     status_filter: ApplicationStatus | None = Query(default=None, alias="status"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> ApplicationListResponse:
     records, total = await list_my_applications(session, user, status_filter, page, page_size)
@@ -59,7 +59,7 @@ async def job_applications(
     status_filter: ApplicationStatus | None = Query(default=None, alias="status"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    recruiter: User = Depends(require_roles(RoleType.recruiter)),
+    recruiter: Principal = Depends(require_roles(RoleType.recruiter)),
     session: AsyncSession = Depends(get_session),
 ) -> ApplicationListResponse:
     job = await get_job_or_404(session, job_id)
@@ -73,7 +73,7 @@ async def job_applications(
 async def update_application_status(
     application_id: uuid.UUID,
     payload: ApplicationUpdateRequest,
-    recruiter: User = Depends(require_roles(RoleType.recruiter)),
+    recruiter: Principal = Depends(require_roles(RoleType.recruiter)),
     session: AsyncSession = Depends(get_session),
 ) -> ApplicationSummary:
     application = await get_application_or_404(session, application_id)
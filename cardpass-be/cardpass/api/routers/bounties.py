@@ -5,9 +5,9 @@ import uuid
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cardpass.core.security import get_current_user, require_roles
+from cardpass.core.security import Principal, get_current_user, require_roles
 from cardpass.db.session import get_session
-from cardpass.models.user import RoleType, User
+from cardpass.models.user import RoleType
 from cardpass.schemas.bounty import BountyCreateRequest, BountySummary
 from cardpass.services.bounties import create_bounty, get_bounty_or_404
 from cardpass.services.jobs import get_job_or_404
@@ -19,7 +19,7 @@ router = APIRouter(prefix="/bounties", tags=["bounties"])
 async def create_bounty_endpoint(
     job_id: uuid.UUID,
     payload: BountyCreateRequest,
-    recruiter: User = Depends(require_roles(RoleType.recruiter)),
+    recruiter: Principal = Depends(require_roles(RoleType.recruiter)),
     session: AsyncSession = Depends(get_session),
 ) -> BountySummary:
     job = await get_job_or_404(session, job_id)
@@ -30,7 +30,7 @@ async def create_bounty_endpoint(
 @router.get("/{bounty_id}", response_model=BountySummary)
 async def get_bounty_endpoint(
     bounty_id: uuid.UUID,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> BountySummary:
     bounty = await get_bounty_or_404(session, bounty_id)
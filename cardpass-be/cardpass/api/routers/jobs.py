@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import uuid
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cardpass.core.security import get_optional_user, require_roles
+from cardpass.core.security import Principal, get_optional_user, require_roles
 from cardpass.db.session import get_session
-from cardpass.models.user import JobStatus, JobVisibility, RoleType, User
+from cardpass.models.user import JobStatus, JobVisibility, RoleType
 from cardpass.schemas.bounty import BountySummary
 from cardpass.schemas.common import PaginatedResponse, Pagination
 from cardpass.schemas.job import JobCreateRequest, JobDetail, JobListParams, JobSummary, JobUpdateRequest
@@ -21,7 +22,7 @@ JobListResponse = PaginatedResponse[JobSummary]
 @router.post("", response_model=JobDetail, status_code=status.HTTP_201_CREATED)
 async def create_job_endpoint(
     payload: JobCreateRequest,
-    user: User = Depends(require_roles(RoleType.recruiter)),
+    user: Principal = Depends(require_roles(RoleType.recruiter)),
     session: AsyncSession = Depends(get_session),
 ) -> JobDetail:
     job = await create_job(session, user, payload)
@@ -31,12 +32,15 @@ async def create_job_endpoint(
 @router.get("", response_model=JobListResponse)
 async def list_jobs_endpoint(
     q: str | None = Query(default=None),
+    search_mode: Literal["substring", "fulltext", "fuzzy"] = Query(default="substring"),
     tags: list[str] | None = Query(default=None),
     owner: str | None = Query(default=None),
     status_filter: str | None = Query(default=None, alias="status"),
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     sort: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    total_mode: Literal["exact", "estimated", "none"] = Query(default="exact"),
     session: AsyncSession = Depends(get_session),
 ) -> JobListResponse:
     try:
@@ -45,16 +49,25 @@ async def list_jobs_endpoint(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid status filter")
     params = JobListParams(
         q=q,
+        search_mode=search_mode,
         tags=tags,
         owner=owner,
         status=status_value,
         page=page,
         page_size=page_size,
         sort=sort,
+        cursor=cursor,
+        total_mode=total_mode,
     )
-    jobs, total = await list_jobs(session, params)
+    jobs, total, next_cursor = await list_jobs(session, params)
     items = [JobSummary.model_validate(job, from_attributes=True) for job in jobs]
-    pagination = Pagination(page=page, page_size=page_size, total=total)
+    pagination = Pagination(
+        page=page,
+        page_size=page_size,
+        total=total,
+        total_is_estimate=total_mode == "estimated",
+        next_cursor=next_cursor,
+    )
     return JobListResponse(items=items, pagination=pagination)
 
 
@@ -62,7 +75,7 @@ async def list_jobs_endpoint(
 async def get_job_endpoint(
     job_id: uuid.UUID,
     session: AsyncSession = Depends(get_session),
-    user: User | None = Depends(get_optional_user),
+    user: Principal | None = Depends(get_optional_user),
 ) -> JobDetail:
     job = await get_job_or_404(session, job_id)
     if job.visibility == JobVisibility.unlisted:
@@ -75,7 +88,7 @@ async def get_job_endpoint(
 async def update_job_endpoint(
     job_id: uuid.UUID,
     payload: JobUpdateRequest,
-    user: User = Depends(require_roles(RoleType.recruiter)),
+    user: Principal = Depends(require_roles(RoleType.recruiter)),
     session: AsyncSession = Depends(get_session),
 ) -> JobDetail:
     job = await get_job_or_404(session, job_id)
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends
 
-from cardpass.core.security import get_current_user
+from cardpass.core.security import Principal, get_current_user
 from cardpass.db.session import get_session
-from cardpass.models.user import User
 from cardpass.schemas.user import MeResponse, ProfileDetail, ProfileUpdateRequest
 from cardpass.services.profiles import update_profile
 
@@ -12,8 +11,22 @@ router = APIRouter(tags=["me"])
 
 
 @router.get("/me", response_model=MeResponse)
-async def read_me(user: User = Depends(get_current_user)) -> MeResponse:
-    profile_summary = ProfileDetail.model_validate(user.profile) if user.profile else None
+async def read_me(user: Principal = Depends(get_current_user)) -> MeResponse:
+    user = await user.loaded()
+    profile = user.profile
+    profile_summary = (
+        ProfileDetail(
+            id=str(profile.id),
+            display_name=profile.display_name,
+            links=profile.links,
+            skills=list(profile.skills) if profile.skills is not None else None,
+            resume_url=profile.resume_url,
+            created_at=profile.created_at,
+            updated_at=profile.updated_at,
+        )
+        if profile
+        else None
+    )
     return MeResponse(
         id=str(user.id),
         wallet_pubkey=user.wallet_pubkey,
@@ -27,8 +40,8 @@ async def read_me(user: User = Depends(get_current_user)) -> MeResponse:
 @router.put("/profiles/me", response_model=ProfileDetail)
 async def update_my_profile(
     payload: ProfileUpdateRequest,
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
     session=Depends(get_session),
 ) -> ProfileDetail:
-    profile = await update_profile(session, user, payload)
+    profile = await update_profile(session, await user.get_user(), payload)
     return ProfileDetail.model_validate(profile)
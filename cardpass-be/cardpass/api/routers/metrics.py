@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+
+from cardpass.core.security import principal_cache, require_admin_token
+from cardpass.db.session import engine, pool_metrics
+from cardpass.schemas.metrics import CacheMetricsResponse, CacheStats, PeriodicJobStats, PoolStats, WebhookQueueStats
+from cardpass.services.webhook_queue import webhook_queue
+
+router = APIRouter(prefix="/metrics", tags=["metrics"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/cache", response_model=CacheMetricsResponse)
+async def cache_metrics() -> CacheMetricsResponse:
+    return CacheMetricsResponse(principal=CacheStats(**principal_cache.stats()))
+
+
+@router.get("/jobs", response_model=list[PeriodicJobStats])
+async def periodic_job_metrics(request: Request) -> list[PeriodicJobStats]:
+    return [PeriodicJobStats(**job.stats()) for job in request.app.state.periodic_jobs]
+
+
+@router.get("/db-pool", response_model=PoolStats)
+async def db_pool_metrics() -> PoolStats:
+    return pool_metrics.stats(engine)
+
+
+@router.get("/webhooks", response_model=WebhookQueueStats)
+async def webhook_queue_metrics() -> WebhookQueueStats:
+    return WebhookQueueStats(**webhook_queue.stats())
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Request
+import asyncio
+import logging
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cardpass.config.settings import settings
 from cardpass.db.session import get_session
-from cardpass.schemas.webhook import SolanaWebhookEvent, WebhookResponse
+from cardpass.schemas.webhook import SolanaWebhookEvent, WebhookBatchResponse, WebhookResponse
+from cardpass.services.webhook_queue import QueueFull, webhook_queue
 from cardpass.services.webhooks import handle_solana_event, verify_webhook_secret
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
 
@@ -19,3 +26,35 @@ async def solana_webhook(
     verify_webhook_secret(request)
     await handle_solana_event(session, event)
     return WebhookResponse()
+
+
+@router.post("/solana/batch", response_model=WebhookBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def solana_webhook_batch(
+    request: Request,
+    events: list[SolanaWebhookEvent] = Body(...),
+) -> WebhookBatchResponse:
+    verify_webhook_secret(request)
+    if len(events) > settings.webhook_batch_max_events:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {settings.webhook_batch_max_events} events per request",
+        )
+    try:
+        stored = webhook_queue.submit(events)
+    except QueueFull as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook queue is full",
+            headers={"Retry-After": "5"},
+        ) from exc
+    try:
+        # Shielded so a timeout here leaves the batch to finish; a later redelivery is deduplicated.
+        await asyncio.wait_for(asyncio.shield(stored), timeout=settings.webhook_ack_timeout_seconds)
+    except Exception as exc:  # noqa: BLE001 - anything short of a commit means "deliver again"
+        logger.warning("Webhook delivery of %d events not stored: %r", len(events), exc)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook events were not stored",
+            headers={"Retry-After": "5"},
+        ) from exc
+    return WebhookBatchResponse(accepted=len(events))
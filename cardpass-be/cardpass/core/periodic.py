@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobRun(NamedTuple):
+    rows: int
+    lag_seconds: float | None = None
+
+
+class PeriodicJob:
+    """Runs an async maintenance task every ``interval_seconds`` and keeps run stats."""
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], Awaitable[JobRun]]) -> None:
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self._func = func
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.failures = 0
+        self.rows_total = 0
+        self.last_rows = 0
+        self.last_lag_seconds: float | None = None
+        self.last_duration_seconds: float | None = None
+        self.last_error: str | None = None
+
+    async def run_once(self) -> JobRun:
+        started = time.monotonic()
+        try:
+            result = await self._func()
+        except Exception as exc:  # noqa: BLE001 - keep the loop alive, surface via stats
+            self.failures += 1
+            self.last_error = repr(exc)
+            logger.exception("Periodic job %s failed", self.name)
+            raise
+        finally:
+            self.runs += 1
+            self.last_duration_seconds = time.monotonic() - started
+        self.rows_total += result.rows
+        self.last_rows = result.rows
+        self.last_lag_seconds = result.lag_seconds
+        self.last_error = None
+        return result
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:  # noqa: BLE001 - already recorded by run_once
+                pass
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._loop(), name=f"periodic:{self.name}")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval_seconds,
+            "runs": self.runs,
+            "failures": self.failures,
+            "rows_total": self.rows_total,
+            "last_rows": self.last_rows,
+            "last_lag_seconds": self.last_lag_seconds,
+            "last_duration_seconds": self.last_duration_seconds,
+            "last_error": self.last_error,
+        }
@@ -1,30 +1,143 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
-from typing import Deque, Dict
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import HTTPException, Request, status
 
 from cardpass.config.settings import settings
 
-_window = timedelta(minutes=1)
-_buckets: Dict[str, Deque[datetime]] = defaultdict(deque)
-_lock = asyncio.Lock()
+_WINDOW_SECONDS = 60.0
+
+
+class RateLimitBackend(ABC):
+    """Storage for GCRA theoretical arrival times (TAT), one per identifier.
+
+    ``hit`` admits a request when the stored TAT is no more than ``tolerance`` seconds
+    ahead of now, advancing it by ``emission_interval``. It returns 0.0 when admitted,
+    otherwise the number of seconds until the next request would be.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, emission_interval: float, tolerance: float) -> float:
+        ...
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process backend; updates never await, so no lock is required."""
+
+    def __init__(self, idle_seconds: float = _WINDOW_SECONDS) -> None:
+        self._idle_seconds = idle_seconds
+        # key -> (tat, last_update); ordered by last update so idle keys sit at the front
+        self._entries: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def hit(self, key: str, emission_interval: float, tolerance: float) -> float:
+        now = time.monotonic()
+        self._evict_idle(now)
+        entry = self._entries.get(key)
+        tat = max(entry[0], now) if entry else now
+        if tat - now > tolerance:
+            return tat - tolerance - now
+        self._entries[key] = (tat + emission_interval, now)
+        self._entries.move_to_end(key)
+        return 0.0
+
+    def _evict_idle(self, now: float) -> None:
+        # A key untouched for a full window has a TAT in the past, which is
+        # indistinguishable from a fresh key, so dropping it loses nothing.
+        cutoff = now - self._idle_seconds
+        while self._entries:
+            key, (tat, updated_at) = next(iter(self._entries.items()))
+            if updated_at > cutoff or tat > now:
+                break
+            del self._entries[key]
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """Host-local shared store so every uvicorn worker draws from the same buckets.
+
+    Uses wall-clock time because monotonic clocks are not comparable across processes.
+    """
+
+    def __init__(self, path: str, sweep_interval: float = _WINDOW_SECONDS) -> None:
+        self._path = path
+        self._sweep_interval = sweep_interval
+        self._next_sweep = 0.0
+        # One connection per executor thread; SQLite's file lock serialises writers.
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS rate_limits (key TEXT PRIMARY KEY, tat REAL NOT NULL)")
+            self._local.conn = conn
+        return conn
+
+    def _hit_sync(self, key: str, emission_interval: float, tolerance: float) -> float:
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if now >= self._next_sweep:
+                conn.execute("DELETE FROM rate_limits WHERE tat < ?", (now,))
+                self._next_sweep = now + self._sweep_interval
+            row = conn.execute("SELECT tat FROM rate_limits WHERE key = ?", (key,)).fetchone()
+            tat = max(row[0], now) if row else now
+            if tat - now > tolerance:
+                conn.execute("COMMIT")
+                return tat - tolerance - now
+            conn.execute(
+                "INSERT INTO rate_limits (key, tat) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                (key, tat + emission_interval),
+            )
+            conn.execute("COMMIT")
+            return 0.0
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    async def hit(self, key: str, emission_interval: float, tolerance: float) -> float:
+        return await asyncio.to_thread(self._hit_sync, key, emission_interval, tolerance)
+
+
+def _build_backend() -> RateLimitBackend:
+    if settings.rate_limit_backend == "sqlite":
+        return SQLiteRateLimitBackend(settings.rate_limit_sqlite_path)
+    return MemoryRateLimitBackend()
+
+
+_backend: RateLimitBackend = _build_backend()
+
+
+def set_rate_limit_backend(backend: RateLimitBackend) -> None:
+    global _backend
+    _backend = backend
 
 
 async def rate_limiter(request: Request, scope: str) -> None:
     identifier = f"{request.client.host if request.client else 'unknown'}:{scope}"
     limit = settings.rate_limit_per_minute
-    cutoff = datetime.utcnow() - _window
-    async with _lock:
-        bucket = _buckets[identifier]
-        while bucket and bucket[0] < cutoff:
-            bucket.popleft()
-        if len(bucket) >= limit:
-            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="Too many requests")
-        bucket.append(datetime.utcnow())
+    emission_interval = _WINDOW_SECONDS / limit
+    # Allow a burst of `limit` requests, refilling at one per emission interval.
+    tolerance = _WINDOW_SECONDS - emission_interval
+    retry_after = await _backend.hit(identifier, emission_interval, tolerance)
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
 
 
 def rate_limit_dependency(scope: str):
@@ -1,25 +1,174 @@
 from __future__ import annotations
 
+import hmac
 import uuid
 from datetime import datetime, timezone
+from typing import Any, NamedTuple
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cardpass.config.settings import settings
+from cardpass.core.cache import TTLCache
 from cardpass.db.session import get_session
 from cardpass.models.user import RoleType, User
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-async def _resolve_user(
+class ClaimRole(NamedTuple):
+    role: RoleType
+
+
+class ProfileSnapshot(NamedTuple):
+    id: uuid.UUID
+    display_name: str | None
+    links: dict | None
+    skills: tuple[str, ...] | None
+    resume_url: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class PrincipalSnapshot(NamedTuple):
+    wallet_pubkey: str
+    roles: tuple[RoleType, ...]
+    display_name: str | None
+    created_at: datetime | None = None
+    last_login_at: datetime | None = None
+    profile: ProfileSnapshot | None = None
+
+
+# Resolved users keyed by id; callers that change a user's roles or profile must
+# call invalidate_principal() so the next request reloads them.
+principal_cache: TTLCache[uuid.UUID, PrincipalSnapshot] = TTLCache(
+    settings.principal_cache_size, settings.principal_cache_ttl_seconds
+)
+
+
+def invalidate_principal(user_id: uuid.UUID) -> None:
+    principal_cache.invalidate(user_id)
+
+
+class Principal:
+    """Authenticated caller; exposes ``id``/``wallet_pubkey``/``roles`` like ``User``.
+
+    The ORM user is only loaded when a handler awaits :meth:`get_user`.
+    ``created_at``, ``last_login_at`` and ``profile`` are only set for principals
+    resolved from the database or the cache, not from token claims.
+    """
+
+    __slots__ = (
+        "id",
+        "wallet_pubkey",
+        "roles",
+        "display_name",
+        "created_at",
+        "last_login_at",
+        "profile",
+        "_session",
+        "_user",
+    )
+
+    def __init__(
+        self,
+        user_id: uuid.UUID,
+        wallet_pubkey: str,
+        roles: list[ClaimRole],
+        session: AsyncSession,
+        user: User | None = None,
+        display_name: str | None = None,
+        created_at: datetime | None = None,
+        last_login_at: datetime | None = None,
+        profile: ProfileSnapshot | None = None,
+    ) -> None:
+        self.id = user_id
+        self.wallet_pubkey = wallet_pubkey
+        self.roles = roles
+        self.display_name = display_name
+        self.created_at = created_at
+        self.last_login_at = last_login_at
+        self.profile = profile
+        self._session = session
+        self._user = user
+
+    @classmethod
+    def from_user(cls, user: User, session: AsyncSession) -> "Principal":
+        roles = [ClaimRole(role.role) for role in user.roles]
+        profile = None
+        if user.profile is not None:
+            profile = ProfileSnapshot(
+                user.profile.id,
+                user.profile.display_name,
+                user.profile.links,
+                tuple(user.profile.skills) if user.profile.skills is not None else None,
+                user.profile.resume_url,
+                user.profile.created_at,
+                user.profile.updated_at,
+            )
+        return cls(
+            user.id,
+            user.wallet_pubkey,
+            roles,
+            session,
+            user=user,
+            display_name=profile.display_name if profile else None,
+            created_at=user.created_at,
+            last_login_at=user.last_login_at,
+            profile=profile,
+        )
+
+    @classmethod
+    def from_snapshot(cls, user_id: uuid.UUID, snapshot: PrincipalSnapshot, session: AsyncSession) -> "Principal":
+        roles = [ClaimRole(role) for role in snapshot.roles]
+        return cls(
+            user_id,
+            snapshot.wallet_pubkey,
+            roles,
+            session,
+            display_name=snapshot.display_name,
+            created_at=snapshot.created_at,
+            last_login_at=snapshot.last_login_at,
+            profile=snapshot.profile,
+        )
+
+    def snapshot(self) -> PrincipalSnapshot:
+        return PrincipalSnapshot(
+            self.wallet_pubkey,
+            tuple(role.role for role in self.roles),
+            self.display_name,
+            self.created_at,
+            self.last_login_at,
+            self.profile,
+        )
+
+    async def loaded(self) -> "Principal":
+        """This caller with the database-backed fields set.
+
+        Principals built from token claims are completed through ``principal_cache``.
+        """
+        if self.created_at is not None:
+            return self
+        principal = await _cached_principal(self._session, self.id, optional=False)
+        assert principal is not None
+        return principal
+
+    async def get_user(self) -> User:
+        if self._user is None:
+            user = await self._session.get(User, self.id)
+            if user is None:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+            await self._session.refresh(user, attribute_names=["roles", "profile"])
+            self._user = user
+        return self._user
+
+
+def _decode_claims(
     credentials: HTTPAuthorizationCredentials | None,
-    session: AsyncSession,
-    optional: bool = False,
-) -> User | None:
+    optional: bool,
+) -> tuple[dict[str, Any], uuid.UUID] | None:
     if credentials is None or credentials.scheme.lower() != "bearer":
         if optional:
             return None
@@ -46,6 +195,10 @@ async def _resolve_user(
             return None
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid user identifier") from exc
 
+    return payload, user_uuid
+
+
+async def _load_user(session: AsyncSession, user_uuid: uuid.UUID, optional: bool) -> User | None:
     user = await session.get(User, user_uuid)
     if user is None:
         if optional:
@@ -56,17 +209,62 @@ async def _resolve_user(
     return user
 
 
+async def _cached_principal(session: AsyncSession, user_uuid: uuid.UUID, optional: bool) -> Principal | None:
+    snapshot = principal_cache.get(user_uuid)
+    if snapshot is not None:
+        return Principal.from_snapshot(user_uuid, snapshot, session)
+    user = await _load_user(session, user_uuid, optional)
+    if user is None:
+        return None
+    principal = Principal.from_user(user, session)
+    principal_cache.set(user_uuid, principal.snapshot())
+    return principal
+
+
+async def _resolve_principal(
+    credentials: HTTPAuthorizationCredentials | None,
+    session: AsyncSession,
+    optional: bool = False,
+) -> Principal | None:
+    """Resolve the caller as ``auth_mode`` says.
+
+    ``claims`` trusts the wallet and roles in the access token and never reads the
+    database; the other modes go through ``principal_cache``.
+    """
+    decoded = _decode_claims(credentials, optional)
+    if decoded is None:
+        return None
+    payload, user_uuid = decoded
+
+    if settings.auth_mode != "claims":
+        return await _cached_principal(session, user_uuid, optional)
+
+    wallet = payload.get("wallet")
+    try:
+        roles = [ClaimRole(RoleType(value)) for value in payload.get("roles") or []]
+    except (TypeError, ValueError) as exc:
+        if optional:
+            return None
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token roles") from exc
+    if not isinstance(wallet, str):
+        if optional:
+            return None
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token wallet")
+
+    return Principal(user_uuid, wallet, roles, session)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     session: AsyncSession = Depends(get_session),
-) -> User:
-    user = await _resolve_user(credentials, session, optional=False)
+) -> Principal:
+    user = await _resolve_principal(credentials, session, optional=False)
     assert user is not None
     return user
 
 
 def require_roles(*roles: RoleType):
-    async def dependency(user: User = Depends(get_current_user)) -> User:
+    async def dependency(user: Principal = Depends(get_current_user)) -> Principal:
         user_roles = {role.role for role in user.roles}
         if not user_roles.intersection(set(roles)):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Insufficient role")
@@ -78,5 +276,15 @@ def require_roles(*roles: RoleType):
 async def get_optional_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
     session: AsyncSession = Depends(get_session),
-) -> User | None:
-    return await _resolve_user(credentials, session, optional=True)
+) -> Principal | None:
+    return await _resolve_principal(credentials, session, optional=True)
+
+
+def require_admin_token(request: Request) -> None:
+    """Guard operational endpoints with the static ``CARDPASS_ADMIN_TOKEN``."""
+    expected = settings.admin_token
+    if not expected:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    provided = request.headers.get("x-admin-token")
+    if not provided or not hmac.compare_digest(provided, expected):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token")
@@ -1,3 +1,3 @@
-from cardpass.db.session import Base, SessionLocal, engine, get_session
+from cardpass.db.session import Base, SessionLocal, engine, get_session, pool_metrics
 
-__all__ = ["Base", "SessionLocal", "engine", "get_session"]
+__all__ = ["Base", "SessionLocal", "engine", "get_session", "pool_metrics"]
@@ -0,0 +1,109 @@
+"""Monthly ``onchain_events`` partitions, named ``onchain_events_pYYYYMM`` and ranged on ``seen_at``.
+
+Rows whose ``seen_at`` falls outside every monthly range land in
+``onchain_events_default``, which is never archived.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import os
+from datetime import date
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+PARENT = "onchain_events"
+# pg_try_advisory_xact_lock key held by the partition maintenance job.
+PARTITION_LOCK_KEY = 0x63705F7061727473  # "cp_parts"
+
+
+def add_months(value: date, months: int) -> date:
+    """First day of the month ``months`` after the month of ``value``."""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _name(month: date) -> str:
+    return f"{PARENT}_p{month:%Y%m}"
+
+
+async def try_partition_lock(session: AsyncSession) -> bool:
+    return bool(await session.scalar(select(func.pg_try_advisory_xact_lock(PARTITION_LOCK_KEY))))
+
+
+async def _monthly_partitions(session: AsyncSession) -> list[date]:
+    names = await session.scalars(
+        text(
+            "SELECT inhrelid::regclass::text FROM pg_inherits "
+            "WHERE inhparent = CAST(:parent AS regclass) ORDER BY 1"
+        ),
+        {"parent": PARENT},
+    )
+    prefix = f"{PARENT}_p"
+    return [
+        date(int(name[-6:-2]), int(name[-2:]), 1)
+        for name in names
+        if name.startswith(prefix) and name[len(prefix) :].isdigit()
+    ]
+
+
+async def ensure_monthly_partitions(session: AsyncSession, months_ahead: int, today: date) -> list[str]:
+    """Create any missing partition from ``today``'s month to ``months_ahead`` months later."""
+    existing = set(await _monthly_partitions(session))
+    created = []
+    for offset in range(months_ahead + 1):
+        month = add_months(today, offset)
+        if month in existing:
+            continue
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {_name(month)} PARTITION OF {PARENT} "
+                f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+            )
+        )
+        created.append(_name(month))
+    return created
+
+
+async def _export(session: AsyncSession, partition: str, path: str) -> int:
+    # asyncpg runs the writes to a file object in its executor; opening and the
+    # final gzip flush on close are moved off the loop here.
+    archive = await asyncio.to_thread(gzip.open, path, "wb")
+    try:
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        status = await raw.driver_connection.copy_from_table(partition, output=archive, format="csv", header=True)
+    finally:
+        await asyncio.to_thread(archive.close)
+    return int(status.split()[-1])
+
+
+async def archive_monthly_partitions(
+    session: AsyncSession, retention_months: int, directory: str, today: date
+) -> tuple[list[date], int]:
+    """Move months older than ``retention_months`` to ``<directory>/onchain_events_pYYYYMM.csv.gz``.
+
+    Each month is exported, detached and dropped in one transaction under the
+    maintenance lock, so a failed export leaves the partition attached for the
+    next run. Returns the archived months, oldest first, and the rows exported.
+    """
+    await asyncio.to_thread(os.makedirs, directory, exist_ok=True)
+    cutoff = add_months(today, -retention_months)
+    archived: list[date] = []
+    exported = 0
+    for month in await _monthly_partitions(session):
+        if add_months(month, 1) > cutoff or not await try_partition_lock(session):
+            break
+        partition = _name(month)
+        path = os.path.join(directory, f"{partition}.csv.gz")
+        exported += await _export(session, partition, path)
+        await session.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {partition}"))
+        await session.execute(text(f"DROP TABLE {partition}"))
+        await session.commit()
+        archived.append(month)
+        logger.info("Archived %s to %s", partition, path)
+    return archived, exported
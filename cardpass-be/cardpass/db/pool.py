@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from functools import partial
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from cardpass.schemas.metrics import PoolStats
+
+# Pool lifecycle events counted as-is, keyed by the PoolStats field they feed.
+_LIFECYCLE_EVENTS = {
+    "connect": "connections_opened",
+    "checkin": "checkins",
+    "close": "connections_closed",
+    "invalidate": "connections_invalidated",
+}
+
+
+class PoolMetrics:
+    """Connection pool counters for the engine in ``cardpass.db.session``.
+
+    Build the engine with :meth:`pool_class` so checkout waits are timed, then
+    call :meth:`attach` to count connection lifecycle events.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+
+    def _count(self, field: str, *_event_args) -> None:
+        self.counts[field] += 1
+
+    def _checked_out(self, seconds: float) -> None:
+        self.counts["checkouts"] += 1
+        self.wait_total_seconds += seconds
+        self.wait_max_seconds = max(self.wait_max_seconds, seconds)
+
+    def pool_class(self) -> type[AsyncAdaptedQueuePool]:
+        metrics = self
+
+        class TimedQueuePool(AsyncAdaptedQueuePool):
+            # connect() covers queue waits and pre-ping, i.e. what a request actually waits for.
+            def connect(self):
+                started = time.perf_counter()
+                try:
+                    connection = super().connect()
+                except exc.TimeoutError:
+                    metrics.counts["checkout_timeouts"] += 1
+                    raise
+                metrics._checked_out(time.perf_counter() - started)
+                return connection
+
+        return TimedQueuePool
+
+    def attach(self, engine: AsyncEngine) -> None:
+        for name, field in _LIFECYCLE_EVENTS.items():
+            event.listen(engine.sync_engine, name, partial(self._count, field))
+
+    def stats(self, engine: AsyncEngine) -> PoolStats:
+        pool = engine.pool
+        size = pool.size()
+        max_overflow = max(pool._max_overflow, 0)
+        checked_out = pool.checkedout()
+        checkouts = self.counts["checkouts"]
+        return PoolStats(
+            pool_size=size,
+            max_overflow=max_overflow,
+            checked_out=checked_out,
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            saturation=checked_out / (size + max_overflow) if size + max_overflow else 0.0,
+            checkouts=checkouts,
+            checkout_wait_avg_seconds=self.wait_total_seconds / checkouts if checkouts else 0.0,
+            checkout_wait_max_seconds=self.wait_max_seconds,
+            **{field: self.counts[field] for field in ("checkout_timeouts", *_LIFECYCLE_EVENTS.values())},
+        )
@@ -4,13 +4,36 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from sqlalchemy.orm import DeclarativeBase
 
 from cardpass.config.settings import settings
+from cardpass.db.pool import PoolMetrics
 
 
 class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(settings.database_url, echo=False, future=True)
+def _connect_args() -> dict:
+    if not settings.database_url.startswith("postgresql+asyncpg"):
+        return {}
+    connect_args: dict = {"statement_cache_size": settings.db_statement_cache_size}
+    if settings.db_statement_timeout_ms is not None:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.db_statement_timeout_ms)}
+    return connect_args
+
+
+pool_metrics = PoolMetrics()
+engine = create_async_engine(
+    settings.database_url,
+    echo=False,
+    future=True,
+    poolclass=pool_metrics.pool_class(),
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout_seconds,
+    pool_recycle=settings.db_pool_recycle_seconds,
+    pool_pre_ping=settings.db_pool_pre_ping,
+    connect_args=_connect_args(),
+)
+pool_metrics.attach(engine)
 SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
 
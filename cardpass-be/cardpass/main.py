@@ -1,14 +1,54 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from cardpass.api.routers import applications, auth, bounties, health, jobs, me, webhooks
+from cardpass.api.routers import admin, applications, auth, bounties, health, jobs, me, metrics, webhooks
 from cardpass.config.settings import settings
+from cardpass.core.periodic import PeriodicJob
+from cardpass.services.event_processor import run_event_processor
+from cardpass.services.event_sources import get_event_source, run_event_backfill
+from cardpass.services.maintenance import (
+    run_event_partition_maintenance,
+    run_nonce_reaper,
+    run_refresh_token_reaper,
+)
+from cardpass.services.webhook_queue import webhook_queue
+
+
+def _build_periodic_jobs() -> list[PeriodicJob]:
+    return [
+        PeriodicJob("nonce_reaper", settings.nonce_reaper_interval_seconds, run_nonce_reaper),
+        PeriodicJob("refresh_token_reaper", settings.refresh_token_reaper_interval_seconds, run_refresh_token_reaper),
+        PeriodicJob("event_processor", settings.event_processor_interval_seconds, run_event_processor),
+        PeriodicJob("event_backfill", settings.event_backfill_interval_seconds, run_event_backfill),
+        PeriodicJob("event_partitions", settings.event_partition_interval_seconds, run_event_partition_maintenance),
+    ]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    periodic_jobs = _build_periodic_jobs()
+    app.state.periodic_jobs = periodic_jobs
+    for job in periodic_jobs:
+        job.start()
+    webhook_queue.start()
+    try:
+        yield
+    finally:
+        await webhook_queue.stop(settings.webhook_drain_timeout_seconds)
+        for job in periodic_jobs:
+            await job.stop()
+        source = get_event_source()
+        if source is not None:
+            await source.aclose()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title=settings.project_name, root_path=settings.root_path)
+    app = FastAPI(title=settings.project_name, root_path=settings.root_path, lifespan=lifespan)
+    app.state.periodic_jobs = []
 
     if settings.cors_origins:
         app.add_middleware(
@@ -26,6 +66,8 @@ def create_app() -> FastAPI:
     app.include_router(applications.router)
     app.include_router(bounties.router)
     app.include_router(webhooks.router)
+    app.include_router(metrics.router)
+    app.include_router(admin.router)
 
     return app
 
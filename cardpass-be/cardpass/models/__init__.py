@@ -8,7 +8,10 @@ from cardpass.models.user import (
     JobVisibility,
     Nonce,
     OnChainEvent,
+    OnChainEventSignature,
     Profile,
+    ProgramCheckpoint,
+    ProgramEvent,
     RefreshToken,
     RoleType,
     User,
@@ -25,7 +28,10 @@ __all__ = [
     "JobVisibility",
     "Nonce",
     "OnChainEvent",
+    "OnChainEventSignature",
     "Profile",
+    "ProgramCheckpoint",
+    "ProgramEvent",
     "RefreshToken",
     "RoleType",
     "User",
@@ -5,8 +5,22 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, LargeBinary, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID, BIGINT
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR, UUID, BIGINT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from cardpass.db.session import Base
@@ -79,6 +93,11 @@ class Nonce(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
     used: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    __table_args__ = (
+        # Only consumed nonces are indexed here; the reaper finds them without a scan.
+        Index("ix_nonces_used", "id", postgresql_where=text("used")),
+    )
+
 
 class Profile(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "profiles"
@@ -92,6 +111,13 @@ class Profile(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     user: Mapped[User] = relationship(back_populates="profile")
 
 
+JOB_SEARCH_CONFIG = "english"
+JOB_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+
 class Job(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "jobs"
 
@@ -101,6 +127,7 @@ class Job(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     tags: Mapped[Optional[list[str]]] = mapped_column(ARRAY(String(64)))
     status: Mapped[JobStatus] = mapped_column(Enum(JobStatus, name="job_status_enum"), default=JobStatus.draft, nullable=False, index=True)
     visibility: Mapped[JobVisibility] = mapped_column(Enum(JobVisibility, name="job_visibility_enum"), default=JobVisibility.public, nullable=False)
+    search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR, Computed(JOB_SEARCH_VECTOR_SQL, persisted=True), deferred=True)
 
     owner: Mapped[User] = relationship(back_populates="jobs")
     applications: Mapped[List["Application"]] = relationship(back_populates="job")
@@ -109,6 +136,10 @@ class Job(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __table_args__ = (
         Index("ix_jobs_status_visibility", "status", "visibility"),
         Index("ix_jobs_tags", "tags", postgresql_using="gin"),
+        Index("ix_jobs_created_at_id", "created_at", "id"),
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_jobs_title_trgm", text("lower(title) gin_trgm_ops"), postgresql_using="gin"),
+        Index("ix_jobs_description_trgm", text("lower(description) gin_trgm_ops"), postgresql_using="gin"),
     )
 
 
@@ -139,19 +170,96 @@ class Bounty(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     vault_address: Mapped[Optional[str]] = mapped_column(String(255))
     status: Mapped[BountyStatus] = mapped_column(Enum(BountyStatus, name="bounty_status_enum"), default=BountyStatus.pending_funding, nullable=False, index=True)
     last_tx_sig: Mapped[Optional[str]] = mapped_column(String(255))
+    # (slot, signature) of the on-chain event that set ``status``; older events never overwrite it
+    last_event_slot: Mapped[Optional[int]] = mapped_column(BIGINT)
+    last_event_signature: Mapped[Optional[str]] = mapped_column(String(255))
 
     job: Mapped[Job] = relationship(back_populates="bounties")
 
 
 class OnChainEvent(UUIDPrimaryKeyMixin, TimestampMixin, Base):
+    """Append-only log of program events, range-partitioned by month on ``seen_at``.
+
+    Postgres cannot enforce a unique signature across partitions, so
+    ``OnChainEventSignature`` is the dedup key and this index is only for lookups.
+    """
+
     __tablename__ = "onchain_events"
 
-    signature: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
-    program_id: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    signature: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    program_id: Mapped[str] = mapped_column(String(255), nullable=False)
     type: Mapped[str] = mapped_column(String(120), nullable=False)
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    slot: Mapped[Optional[int]] = mapped_column(BIGINT)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "seen_at"),
+        Index("ix_onchain_events_program_slot", "program_id", "slot", "signature"),
+        Index("ix_onchain_events_pending", "slot", "signature", postgresql_where=text("processed_at IS NULL")),
+        Index("ix_onchain_events_seen_at_brin", "seen_at", postgresql_using="brin"),
+        {"postgresql_partition_by": "RANGE (seen_at)"},
+    )
+
+
+class OnChainEventSignature(Base):
+    """Every ingested signature once; inserting here first is what deduplicates deliveries."""
+
+    __tablename__ = "onchain_event_signatures"
+
+    signature: Mapped[str] = mapped_column(String(255), primary_key=True)
     seen_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
+    __table_args__ = (
+        Index("ix_onchain_event_signatures_seen_at_brin", "seen_at", postgresql_using="brin"),
+    )
+
+
+class ProgramCheckpoint(TimestampMixin, Base):
+    """Highest (slot, signature) applied per program; where gap backfill resumes."""
+
+    __tablename__ = "program_checkpoints"
+
+    program_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    last_slot: Mapped[int] = mapped_column(BIGINT, nullable=False)
+    last_signature: Mapped[str] = mapped_column(String(255), nullable=False)
+
+
+class ProgramEvent(UUIDPrimaryKeyMixin, TimestampMixin, Base):
+    """An Anchor event decoded from a transaction's ``Program data:`` logs.
+
+    The fields the API filters on get their own columns; ``fields`` keeps the full decoded event.
+    """
+
+    __tablename__ = "program_events"
+
+    signature: Mapped[str] = mapped_column(String(255), nullable=False)
+    log_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    slot: Mapped[int] = mapped_column(BIGINT, nullable=False)
+    program_id: Mapped[Optional[str]] = mapped_column(String(64))
+    event_name: Mapped[str] = mapped_column(String(120), nullable=False)
+    job: Mapped[Optional[str]] = mapped_column(String(64))
+    recruiter: Mapped[Optional[str]] = mapped_column(String(64))
+    applicant: Mapped[Optional[str]] = mapped_column(String(64))
+    application: Mapped[Optional[str]] = mapped_column(String(64))
+    referrer: Mapped[Optional[str]] = mapped_column(String(64))
+    status: Mapped[Optional[str]] = mapped_column(String(64))
+    title: Mapped[Optional[str]] = mapped_column(Text)
+    # u64 amounts do not fit a signed BIGINT
+    amount: Mapped[Optional[int]] = mapped_column(Numeric(20, 0))
+    link_id: Mapped[Optional[int]] = mapped_column(Numeric(20, 0))
+    occurred_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    fields: Mapped[dict] = mapped_column(JSONB, nullable=False)
+
+    __table_args__ = (
+        Index("ix_program_events_signature_log", "signature", "log_index", unique=True),
+        Index("ix_program_events_name_occurred", "event_name", "occurred_at"),
+        Index("ix_program_events_job", "job", "occurred_at"),
+        Index("ix_program_events_applicant", "applicant", "occurred_at"),
+        Index("ix_program_events_application", "application", "occurred_at"),
+    )
+
 
 class RefreshToken(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     __tablename__ = "refresh_tokens"
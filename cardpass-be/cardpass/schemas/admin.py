@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from cardpass.schemas.metrics import PeriodicJobStats
+
+
+class RefreshTokenStatsResponse(BaseModel):
+    estimated_rows: int = Field(ge=0)
+    total_bytes: int = Field(ge=0)
+    index_bytes: int = Field(ge=0)
+    max_sessions_per_user: int
+    reaper: Optional[PeriodicJobStats] = None
+
+
+class EventReplayRequest(BaseModel):
+    program_id: Optional[str] = None
+    after_slot: Optional[int] = Field(default=None, ge=0)
+    after_signature: Optional[str] = None
+    batch_size: int = Field(default=5000, ge=1, le=5000)
+    max_batches: Optional[int] = Field(default=None, ge=1)
+
+
+class EventReplayResponse(BaseModel):
+    events: int
+    last_slot: Optional[int] = None
+    last_signature: Optional[str] = None
+
+
+class EventDecodeRequest(BaseModel):
+    after_slot: Optional[int] = Field(default=None, ge=0)
+    after_signature: Optional[str] = None
+    batch_size: int = Field(default=1000, ge=1, le=5000)
+    max_batches: Optional[int] = Field(default=None, ge=1)
+
+
+class EventDecodeResponse(BaseModel):
+    decoded: int
+    last_slot: Optional[int] = None
+    last_signature: Optional[str] = None
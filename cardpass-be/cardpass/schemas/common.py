@@ -11,7 +11,9 @@ T = TypeVar("T")
 class Pagination(BaseModel):
     page: int = Field(ge=1)
     page_size: int = Field(ge=1)
-    total: int = Field(ge=0)
+    total: Optional[int] = Field(default=None, ge=0)
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -51,3 +51,6 @@ class JobListParams(BaseModel):
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=100)
     sort: Optional[str] = Field(default=None, description="comma separated sort keys e.g. -created_at")
+    search_mode: Literal["substring", "fulltext", "fuzzy"] = Field(default="substring")
+    cursor: Optional[str] = Field(default=None, description="opaque keyset cursor returned as next_cursor")
+    total_mode: Literal["exact", "estimated", "none"] = Field(default="exact")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CacheStats(BaseModel):
+    size: int = Field(ge=0)
+    maxsize: int = Field(ge=0)
+    hits: int = Field(ge=0)
+    misses: int = Field(ge=0)
+    hit_rate: float = Field(ge=0, le=1)
+
+
+class CacheMetricsResponse(BaseModel):
+    principal: CacheStats
+
+
+class PeriodicJobStats(BaseModel):
+    name: str
+    interval_seconds: float
+    runs: int
+    failures: int
+    rows_total: int
+    last_rows: int
+    last_lag_seconds: Optional[float] = None
+    last_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class WebhookQueueStats(BaseModel):
+    queued: int
+    maxsize: int
+    workers: int
+    accepted: int
+    rejected: int
+    batches: int
+    processed: int
+    inserted: int
+    duplicates: int
+    retries: int
+    failed: int
+    last_batch_size: int
+    last_batch_duration_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class PoolStats(BaseModel):
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    saturation: float
+    checkouts: int
+    checkins: int
+    checkout_timeouts: int
+    checkout_wait_avg_seconds: float
+    checkout_wait_max_seconds: float
+    connections_opened: int
+    connections_closed: int
+    connections_invalidated: int
@@ -21,3 +21,8 @@ class SolanaWebhookEvent(BaseModel):
 
 class WebhookResponse(BaseModel):
     ok: bool = True
+
+
+class WebhookBatchResponse(BaseModel):
+    ok: bool = True
+    accepted: int
@@ -6,15 +6,16 @@ from fastapi import HTTPException, status
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cardpass.models.user import Application, ApplicationStatus, Job, JobStatus, RoleType, User
+from cardpass.core.security import Principal
+from cardpass.models.user import Application, ApplicationStatus, Job, JobStatus, RoleType
 from cardpass.schemas.application import ApplicationCreateRequest, ApplicationUpdateRequest
 
 
-def _has_role(user: User, role: RoleType) -> bool:
+def _has_role(user: Principal, role: RoleType) -> bool:
     return any(r.role == role for r in user.roles)
 
 
-async def create_application(session: AsyncSession, job: Job, applicant: User, payload: ApplicationCreateRequest) -> Application:
+async def create_application(session: AsyncSession, job: Job, applicant: Principal, payload: ApplicationCreateRequest) -> Application:
     if not _has_role(applicant, RoleType.applicant):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Applicant role required")
     if job.status != JobStatus.open:
@@ -39,7 +40,7 @@ async def create_application(session: AsyncSession, job: Job, applicant: User, p
     return application
 
 
-async def list_my_applications(session: AsyncSession, user: User, status_filter: ApplicationStatus | None, page: int, page_size: int):
+async def list_my_applications(session: AsyncSession, user: Principal, status_filter: ApplicationStatus | None, page: int, page_size: int):
     stmt = select(Application).where(Application.applicant_id == user.id)
     count_stmt = select(func.count()).select_from(Application).where(Application.applicant_id == user.id)
     if status_filter:
@@ -53,7 +54,7 @@ async def list_my_applications(session: AsyncSession, user: User, status_filter:
     return records, total
 
 
-async def list_job_applications(session: AsyncSession, job: Job, recruiter: User, status_filter: ApplicationStatus | None, page: int, page_size: int):
+async def list_job_applications(session: AsyncSession, job: Job, recruiter: Principal, status_filter: ApplicationStatus | None, page: int, page_size: int):
     if job.user_id != recruiter.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not job owner")
     if not _has_role(recruiter, RoleType.recruiter):
@@ -80,7 +81,7 @@ async def get_application_or_404(session: AsyncSession, application_id: uuid.UUI
     return record
 
 
-async def update_application(session: AsyncSession, application: Application, recruiter: User, payload: ApplicationUpdateRequest) -> Application:
+async def update_application(session: AsyncSession, application: Application, recruiter: Principal, payload: ApplicationUpdateRequest) -> Application:
     job = await session.get(Job, application.job_id)
     if job is None or job.user_id != recruiter.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not job owner")
@@ -9,11 +9,12 @@ from typing import Tuple
 
 from fastapi import HTTPException, status
 from jose import jwt
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cardpass.config.settings import settings
+from cardpass.core.security import invalidate_principal
 from cardpass.models.user import Nonce, RefreshToken, RoleType, User, UserRole
 from cardpass.schemas.auth import AuthVerifyRequest
 from cardpass.utils.solana import SignatureVerificationError, verify_signature
@@ -175,8 +176,11 @@ class AuthService:
         hashed = _hash_token(refresh_token_value)
         refresh = RefreshToken(user_id=user.id, token_hash=hashed, expires_at=refresh_expires)
         self.session.add(refresh)
+        await self.session.flush()
+        await self._enforce_session_cap(user)
         user.last_login_at = datetime.now(timezone.utc)
         await self.session.commit()
+        invalidate_principal(user.id)
         await self.session.refresh(user, attribute_names=["roles", "profile"])
 
         return access_token, refresh_token_value, refresh_expires, user
@@ -200,6 +204,21 @@ class AuthService:
         refresh_record.revoked = True
         await self.session.commit()
 
+    async def _enforce_session_cap(self, user: User) -> None:
+        """Drop the user's oldest live refresh tokens beyond ``max_sessions_per_user``."""
+        overflow = (
+            select(RefreshToken.id)
+            .where(
+                RefreshToken.user_id == user.id,
+                RefreshToken.revoked.is_(False),
+                RefreshToken.expires_at > datetime.now(timezone.utc),
+            )
+            .order_by(RefreshToken.created_at.desc(), RefreshToken.expires_at.desc())
+            .offset(settings.max_sessions_per_user)
+            .scalar_subquery()
+        )
+        await self.session.execute(delete(RefreshToken).where(RefreshToken.id.in_(overflow)))
+
     async def _ensure_profile(self, user: User) -> None:
         if user.profile is not None:
             return
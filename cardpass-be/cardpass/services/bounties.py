@@ -5,12 +5,13 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from cardpass.models.user import Bounty, BountyStatus, Job, RoleType, User
+from cardpass.core.security import Principal
+from cardpass.models.user import Bounty, BountyStatus, Job, RoleType
 from cardpass.schemas.bounty import BountyCreateRequest
 from cardpass.services.jobs import ensure_recruiter
 
 
-async def create_bounty(session: AsyncSession, job: Job, recruiter: User, payload: BountyCreateRequest) -> Bounty:
+async def create_bounty(session: AsyncSession, job: Job, recruiter: Principal, payload: BountyCreateRequest) -> Bounty:
     if job.user_id != recruiter.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not job owner")
     await ensure_recruiter(recruiter)
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+import math
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Iterable, NamedTuple, Optional
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cardpass.config.settings import settings
+from cardpass.models.user import OnChainEvent, ProgramEvent
+from cardpass.utils.anchor import DecodedEvent, EventDecodeError, EventDecoder, load_idl
+from cardpass.utils.anchor_idls import BUILTIN_IDLS
+
+logger = logging.getLogger(__name__)
+
+# Decoded field name -> typed column; fields absent from an event leave the column NULL.
+_COLUMNS = {
+    "job_id": "job",
+    "job": "job",
+    "recruiter": "recruiter",
+    "applicant": "applicant",
+    "application": "application",
+    "referrer": "referrer",
+    "new_status": "status",
+    "title": "title",
+    "hiring_bounty": "amount",
+    "link_id": "link_id",
+}
+_TIMESTAMPS = ("created_at", "applied_at", "updated_at")
+# Keeps one multi-row INSERT well below asyncpg's 32767 bind parameter limit.
+_INSERT_CHUNK = 1000
+# Width of the short text columns; longer on-chain strings are cut to fit.
+_SHORT_COLUMN = 64
+
+
+class LoggedTransaction(NamedTuple):
+    signature: str
+    slot: int
+    logs: Optional[list[str]]
+
+
+def _build_decoder() -> EventDecoder:
+    return EventDecoder([*BUILTIN_IDLS, *(load_idl(path) for path in settings.event_idl_paths)])
+
+
+event_decoder = _build_decoder()
+
+
+def pg_safe(value: Any) -> Any:
+    """Make decoded or delivered values storable in ``text`` and JSONB columns.
+
+    Postgres rejects NUL characters and non-finite floats, and JSON has no
+    bytes. These values come from whoever sent the transaction, so one bad
+    value would otherwise fail the insert of the whole batch.
+    """
+    if isinstance(value, str):
+        return value.replace("\x00", "")
+    if isinstance(value, bytes):
+        return value.hex()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, dict):
+        return {pg_safe(key): pg_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [pg_safe(item) for item in value]
+    return value
+
+
+def _timestamp(value: int) -> Optional[datetime]:
+    try:
+        return datetime.fromtimestamp(value, tz=timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        return None
+
+
+def _row(tx: LoggedTransaction, event: DecodedEvent) -> dict[str, Any]:
+    fields = pg_safe(event.fields)
+    row: dict[str, Any] = {
+        "id": uuid.uuid4(),
+        "signature": tx.signature,
+        "log_index": event.log_index,
+        "slot": tx.slot,
+        "program_id": event.program_id,
+        "event_name": event.name,
+        "fields": fields,
+        "occurred_at": None,
+        **{column: None for column in _COLUMNS.values()},
+    }
+    for field, value in fields.items():
+        column = _COLUMNS.get(field)
+        if column is not None:
+            if isinstance(value, str) and column != "title":
+                value = value[:_SHORT_COLUMN]
+            row[column] = value
+        elif field in _TIMESTAMPS and isinstance(value, int):
+            row["occurred_at"] = _timestamp(value)
+    return row
+
+
+def decode_transactions(transactions: Iterable[LoggedTransaction]) -> list[dict[str, Any]]:
+    """Decode the logs of many transactions into ``program_events`` rows.
+
+    A transaction whose logs do not match its layout is skipped with a warning;
+    its raw logs remain in ``onchain_events`` for a later re-decode.
+    """
+    rows: list[dict[str, Any]] = []
+    for tx in transactions:
+        if not tx.logs:
+            continue
+        try:
+            decoded = event_decoder.decode_logs(tx.logs)
+        except EventDecodeError as exc:
+            logger.warning("Skipping undecodable logs in %s: %s", tx.signature, exc)
+            continue
+        rows.extend(_row(tx, event) for event in decoded)
+    return rows
+
+
+async def store_decoded_events(session: AsyncSession, transactions: Iterable[LoggedTransaction]) -> int:
+    """Insert the decoded events of ``transactions`` within the caller's transaction."""
+    rows = decode_transactions(transactions)
+    inserted = 0
+    for start in range(0, len(rows), _INSERT_CHUNK):
+        result = await session.execute(
+            pg_insert(ProgramEvent)
+            .values(rows[start : start + _INSERT_CHUNK])
+            .on_conflict_do_nothing(index_elements=[ProgramEvent.signature, ProgramEvent.log_index])
+        )
+        inserted += result.rowcount or 0
+    return inserted
+
+
+async def decode_stored_events(
+    session: AsyncSession,
+    after: Optional[tuple[int, str]] = None,
+    batch_size: int = 1000,
+    max_batches: Optional[int] = None,
+) -> tuple[int, Optional[tuple[int, str]]]:
+    """Decode logs already stored in ``onchain_events``, e.g. after registering a new IDL.
+
+    Walks the table by (slot, signature) keyset and returns the rows inserted and
+    the position reached, from which a later call can resume.
+    """
+    inserted = 0
+    position = after
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        stmt = select(OnChainEvent.signature, OnChainEvent.slot, OnChainEvent.payload["logs"]).where(
+            OnChainEvent.slot.is_not(None)
+        )
+        if position is not None:
+            stmt = stmt.where(tuple_(OnChainEvent.slot, OnChainEvent.signature) > tuple_(*position))
+        rows = (
+            await session.execute(stmt.order_by(OnChainEvent.slot, OnChainEvent.signature).limit(batch_size))
+        ).all()
+        if not rows:
+            break
+        inserted += await store_decoded_events(session, (LoggedTransaction(*row) for row in rows))
+        await session.commit()
+        position = (rows[-1][1], rows[-1][0])
+        batches += 1
+        if len(rows) < batch_size:
+            break
+    return inserted, position
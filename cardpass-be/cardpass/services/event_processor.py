@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional, Sequence
+
+from sqlalchemy import cast, column, func, or_, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cardpass.config.settings import settings
+from cardpass.core.periodic import JobRun
+from cardpass.db.session import SessionLocal
+from cardpass.models.user import Application, ApplicationStatus, Bounty, BountyStatus, OnChainEvent, ProgramCheckpoint
+
+
+class ChainEvent(NamedTuple):
+    """The fields of an on-chain event that drive state transitions."""
+
+    signature: str
+    slot: int
+    program_id: str
+    type: str
+    accounts: Optional[dict[str, str]]
+
+    @property
+    def position(self) -> tuple[int, str]:
+        # Total order over events: slot first, signature breaks ties within a slot.
+        return (self.slot, self.signature)
+
+
+class ReplayResult(NamedTuple):
+    events: int
+    last_slot: Optional[int]
+    last_signature: Optional[str]
+
+
+def _extract_uuid(data: Optional[dict], key: str) -> Optional[uuid.UUID]:
+    if not data:
+        return None
+    value = data.get(key) or data.get(key.replace("_", ""))
+    if not value:
+        return None
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        return None
+
+
+def _bounty_transition(event_type: str) -> Optional[BountyStatus]:
+    if event_type == "VAULT_FUNDED":
+        return BountyStatus.funded
+    if event_type in ("VAULT_RELEASED", "PAYOUT"):
+        return BountyStatus.released
+    # Anything else is kept as a stored event for manual review
+    return None
+
+
+def fold_events(events: Sequence[ChainEvent]) -> tuple[dict[uuid.UUID, ChainEvent], set[uuid.UUID]]:
+    """Buffer events per bounty, keeping the latest transition for each, plus applications to hire."""
+    latest: dict[uuid.UUID, ChainEvent] = {}
+    hired: set[uuid.UUID] = set()
+    for event in sorted(events, key=lambda item: item.position):
+        bounty_id = _extract_uuid(event.accounts, "bounty_id")
+        if bounty_id is None or _bounty_transition(event.type) is None:
+            continue
+        latest[bounty_id] = event
+        application_id = _extract_uuid(event.accounts, "application_id")
+        if event.type == "VAULT_RELEASED" and application_id:
+            hired.add(application_id)
+    return latest, hired
+
+
+async def _apply_bounty_transitions(session: AsyncSession, latest: dict[uuid.UUID, ChainEvent]) -> None:
+    # Rows are listed in id order so concurrent batches lock bounties in the same order.
+    changes = values(
+        column("id", Bounty.id.type),
+        column("status", Bounty.status.type),
+        column("slot", Bounty.last_event_slot.type),
+        column("signature", Bounty.last_event_signature.type),
+        name="changes",
+    ).data(
+        [
+            (bounty_id, _bounty_transition(event.type), event.slot, event.signature)
+            for bounty_id, event in sorted(latest.items())
+        ]
+    )
+    await session.execute(
+        update(Bounty)
+        .where(
+            Bounty.id == changes.c.id,
+            or_(
+                Bounty.last_event_slot.is_(None),
+                tuple_(Bounty.last_event_slot, Bounty.last_event_signature)
+                < tuple_(changes.c.slot, changes.c.signature),
+            ),
+        )
+        .values(
+            status=cast(changes.c.status, Bounty.status.type),
+            last_tx_sig=changes.c.signature,
+            last_event_slot=changes.c.slot,
+            last_event_signature=changes.c.signature,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def _advance_checkpoints(session: AsyncSession, events: Sequence[ChainEvent]) -> None:
+    highest: dict[str, ChainEvent] = {}
+    for event in events:
+        current = highest.get(event.program_id)
+        if current is None or event.position > current.position:
+            highest[event.program_id] = event
+    stmt = pg_insert(ProgramCheckpoint).values(
+        [
+            {"program_id": program_id, "last_slot": event.slot, "last_signature": event.signature}
+            for program_id, event in sorted(highest.items())
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProgramCheckpoint.program_id],
+        set_={
+            "last_slot": stmt.excluded.last_slot,
+            "last_signature": stmt.excluded.last_signature,
+            "updated_at": func.now(),
+        },
+        where=tuple_(ProgramCheckpoint.last_slot, ProgramCheckpoint.last_signature)
+        < tuple_(stmt.excluded.last_slot, stmt.excluded.last_signature),
+    )
+    await session.execute(stmt)
+
+
+async def apply_events(session: AsyncSession, events: Sequence[ChainEvent]) -> int:
+    """Apply the events' state changes and mark them processed within the caller's transaction.
+
+    A bounty only moves to the state of an event positioned after the one that
+    last set it, so delivery order does not matter and re-applying is a no-op.
+    Events naming unknown bounties or applications stay stored for manual review.
+    """
+    if not events:
+        return 0
+    latest, hired = fold_events(events)
+    if latest:
+        await _apply_bounty_transitions(session, latest)
+    if hired:
+        await session.execute(
+            update(Application)
+            .where(Application.id.in_(sorted(hired)))
+            .values(status=ApplicationStatus.hired)
+            .execution_options(synchronize_session=False)
+        )
+    await session.execute(
+        update(OnChainEvent)
+        .where(OnChainEvent.signature.in_([event.signature for event in events]))
+        .values(processed_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    await _advance_checkpoints(session, events)
+    return len(events)
+
+
+_EVENT_COLUMNS = (
+    OnChainEvent.signature,
+    OnChainEvent.slot,
+    OnChainEvent.program_id,
+    OnChainEvent.type,
+    OnChainEvent.payload["accounts"],
+)
+
+
+def _chain_event(row) -> ChainEvent:
+    return ChainEvent(row[0], row[1], row[2], row[3], row[4])
+
+
+async def process_pending_events(session: AsyncSession, batch_size: int, max_batches: int) -> int:
+    """Apply stored events that have not been processed yet, oldest slot first.
+
+    SKIP LOCKED lets several workers share the backlog without applying an event twice.
+    """
+    processed = 0
+    for _ in range(max_batches):
+        rows = (
+            await session.execute(
+                select(*_EVENT_COLUMNS)
+                .where(OnChainEvent.processed_at.is_(None), OnChainEvent.slot.is_not(None))
+                .order_by(OnChainEvent.slot, OnChainEvent.signature)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            )
+        ).all()
+        applied = await apply_events(session, [_chain_event(row) for row in rows])
+        await session.commit()
+        processed += applied
+        if applied < batch_size:
+            break
+    return processed
+
+
+async def replay_events(
+    session: AsyncSession,
+    program_id: Optional[str] = None,
+    after: Optional[tuple[int, str]] = None,
+    batch_size: int = 5000,
+    max_batches: Optional[int] = None,
+) -> ReplayResult:
+    """Re-apply stored events in (slot, signature) order, resuming after ``after``.
+
+    Pages are read by keyset over ``ix_onchain_events_program_slot`` and folded
+    a page at a time, so a replay over the same rows always ends in the same
+    state and stopping part way is safe: resume from the returned position.
+    """
+    replayed = 0
+    position = after
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        stmt = select(*_EVENT_COLUMNS).where(OnChainEvent.slot.is_not(None))
+        if program_id is not None:
+            stmt = stmt.where(OnChainEvent.program_id == program_id)
+        if position is not None:
+            stmt = stmt.where(tuple_(OnChainEvent.slot, OnChainEvent.signature) > tuple_(*position))
+        rows = (
+            await session.execute(stmt.order_by(OnChainEvent.slot, OnChainEvent.signature).limit(batch_size))
+        ).all()
+        if not rows:
+            break
+        events = [_chain_event(row) for row in rows]
+        replayed += await apply_events(session, events)
+        await session.commit()
+        position = events[-1].position
+        batches += 1
+        if len(rows) < batch_size:
+            break
+    return ReplayResult(replayed, *(position or (None, None)))
+
+
+async def _pending_lag(session: AsyncSession) -> float:
+    """Seconds since the oldest stored event that has not been applied yet."""
+    oldest = await session.scalar(select(func.min(OnChainEvent.seen_at)).where(OnChainEvent.processed_at.is_(None)))
+    return (datetime.now(timezone.utc) - oldest).total_seconds() if oldest else 0.0
+
+
+async def run_event_processor() -> JobRun:
+    async with SessionLocal() as session:
+        processed = await process_pending_events(session, settings.event_batch_size, settings.event_max_batches)
+        return JobRun(rows=processed, lag_seconds=await _pending_lag(session))
+
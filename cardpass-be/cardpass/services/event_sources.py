@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from typing import Optional
+
+import base58
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cardpass.config.settings import settings
+from cardpass.core.periodic import JobRun
+from cardpass.db.session import SessionLocal
+from cardpass.models.user import Bounty, OnChainEventSignature, ProgramCheckpoint
+from cardpass.schemas.webhook import SolanaWebhookEvent
+from cardpass.services.webhooks import ingest_solana_events
+from cardpass.utils.anchor import DISCRIMINATOR_SIZE, instruction_discriminator
+
+# Helius' label for transactions it does not classify; the processor leaves them for review.
+BACKFILL_EVENT_TYPE = "UNKNOWN"
+
+# hiring-rewards instructions that move a bounty's vault. ``reward_vault`` is the
+# third account of both (programs/hiring-rewards/src/instructions).
+_VAULT_INSTRUCTIONS = {
+    instruction_discriminator("deposit_to_pool"): "VAULT_FUNDED",
+    instruction_discriminator("distribute_reward"): "VAULT_RELEASED",
+}
+_REWARD_VAULT_ACCOUNT = 2
+
+
+def classify_transaction(tx: dict, program_id: str) -> tuple[str, Optional[dict[str, str]]]:
+    """Event type and accounts of a ``getTransaction`` result, from its instructions to ``program_id``.
+
+    The first top-level vault instruction wins. Anything else keeps
+    ``BACKFILL_EVENT_TYPE`` and is stored for review like unclassified webhook events.
+    """
+    message = (tx.get("transaction") or {}).get("message") or {}
+    loaded = (tx.get("meta") or {}).get("loadedAddresses") or {}
+    keys = [*message.get("accountKeys", []), *loaded.get("writable", []), *loaded.get("readonly", [])]
+    for instruction in message.get("instructions", []):
+        index = instruction.get("programIdIndex")
+        if index is None or index >= len(keys) or keys[index] != program_id:
+            continue
+        try:
+            data = base58.b58decode(instruction.get("data") or "")
+        except ValueError:
+            continue
+        event_type = _VAULT_INSTRUCTIONS.get(data[:DISCRIMINATOR_SIZE])
+        accounts = instruction.get("accounts") or []
+        if event_type and len(accounts) > _REWARD_VAULT_ACCOUNT and accounts[_REWARD_VAULT_ACCOUNT] < len(keys):
+            return event_type, {"vault_address": keys[accounts[_REWARD_VAULT_ACCOUNT]]}
+    return BACKFILL_EVENT_TYPE, None
+
+
+class EventSource(ABC):
+    """Where missed program transactions are fetched from when webhook deliveries have gaps."""
+
+    @abstractmethod
+    async def signatures(self, program_id: str, from_slot: int, limit: int) -> list[tuple[str, int]]:
+        """Up to ``limit`` successful (signature, slot) pairs at or after ``from_slot``, oldest first."""
+
+    @abstractmethod
+    async def fetch(self, program_id: str, signatures: list[str]) -> list[SolanaWebhookEvent]:
+        ...
+
+    async def aclose(self) -> None:
+        return None
+
+
+class MemoryEventSource(EventSource):
+    """In-process source for local runs and tests; seed it with ``add``."""
+
+    def __init__(self, events: Optional[list[SolanaWebhookEvent]] = None) -> None:
+        self._events: dict[str, SolanaWebhookEvent] = {}
+        self.add(events or [])
+
+    def add(self, events: list[SolanaWebhookEvent]) -> None:
+        for event in events:
+            self._events[event.signature] = event
+
+    async def signatures(self, program_id: str, from_slot: int, limit: int) -> list[tuple[str, int]]:
+        listed = sorted(
+            (event.slot, event.signature)
+            for event in self._events.values()
+            if event.programId == program_id and event.slot >= from_slot
+        )
+        return [(signature, slot) for slot, signature in listed[:limit]]
+
+    async def fetch(self, program_id: str, signatures: list[str]) -> list[SolanaWebhookEvent]:
+        return [self._events[signature] for signature in signatures if signature in self._events]
+
+
+class RpcEventSource(EventSource):
+    """Solana JSON-RPC source using ``getSignaturesForAddress`` and ``getTransaction``."""
+
+    _PAGE_SIZE = 1000
+
+    def __init__(self, endpoint: str, concurrency: int, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self._client = httpx.AsyncClient(base_url=endpoint, timeout=30.0, transport=transport)
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _call(self, method: str, params: list) -> object:
+        async with self._semaphore:
+            response = await self._client.post("", json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+        response.raise_for_status()
+        body = response.json()
+        if body.get("error"):
+            raise RuntimeError(f"{method} failed: {body['error']}")
+        return body["result"]
+
+    async def signatures(self, program_id: str, from_slot: int, limit: int) -> list[tuple[str, int]]:
+        # The RPC pages newest first, so the whole window down to from_slot is
+        # walked; only the ``limit`` oldest entries, the ones nearest the
+        # checkpoint, are kept. Newer gaps are picked up by later runs.
+        oldest: deque[tuple[str, int]] = deque(maxlen=limit)
+        before: Optional[str] = None
+        while True:
+            options: dict = {"limit": self._PAGE_SIZE}
+            if before:
+                options["before"] = before
+            page = await self._call("getSignaturesForAddress", [program_id, options])
+            for entry in page:
+                if entry["slot"] < from_slot:
+                    return list(reversed(oldest))
+                if entry.get("err") is None:
+                    oldest.append((entry["signature"], entry["slot"]))
+            if len(page) < self._PAGE_SIZE:
+                return list(reversed(oldest))
+            before = page[-1]["signature"]
+
+    async def _fetch_one(self, program_id: str, signature: str) -> Optional[SolanaWebhookEvent]:
+        tx = await self._call(
+            "getTransaction", [signature, {"encoding": "json", "maxSupportedTransactionVersion": 0}]
+        )
+        if not tx:
+            return None
+        event_type, accounts = classify_transaction(tx, program_id)
+        return SolanaWebhookEvent(
+            signature=signature,
+            slot=tx["slot"],
+            programId=program_id,
+            type=event_type,
+            accounts=accounts,
+            logs=(tx.get("meta") or {}).get("logMessages"),
+            blockTime=tx.get("blockTime"),
+        )
+
+    async def fetch(self, program_id: str, signatures: list[str]) -> list[SolanaWebhookEvent]:
+        fetched = await asyncio.gather(*(self._fetch_one(program_id, signature) for signature in signatures))
+        return [event for event in fetched if event is not None]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def _build_event_source() -> Optional[EventSource]:
+    if settings.event_source == "rpc" and settings.rpc_endpoint:
+        return RpcEventSource(settings.rpc_endpoint, settings.event_rpc_concurrency)
+    return None
+
+
+_source: Optional[EventSource] = _build_event_source()
+
+
+def get_event_source() -> Optional[EventSource]:
+    return _source
+
+
+def set_event_source(source: Optional[EventSource]) -> None:
+    global _source
+    _source = source
+
+
+async def find_missing_signatures(session: AsyncSession, source: EventSource, program_id: str) -> list[str]:
+    """Signatures the source knows about near the program's checkpoint that were never stored.
+
+    The window starts ``event_backfill_lookback_slots`` below the high-water mark
+    so late deliveries behind it are still compared.
+    """
+    checkpoint = await session.get(ProgramCheckpoint, program_id)
+    from_slot = max(checkpoint.last_slot - settings.event_backfill_lookback_slots, 0) if checkpoint else 0
+    listed = await source.signatures(program_id, from_slot, settings.event_backfill_max_signatures)
+    if not listed:
+        return []
+    known = set(
+        (
+            await session.scalars(
+                select(OnChainEventSignature.signature).where(
+                    OnChainEventSignature.signature.in_([signature for signature, _ in listed])
+                )
+            )
+        ).all()
+    )
+    return [signature for signature, _ in listed if signature not in known]
+
+
+async def attach_bounties(session: AsyncSession, events: list[SolanaWebhookEvent]) -> list[SolanaWebhookEvent]:
+    """Add ``bounty_id`` to events whose ``vault_address`` belongs to exactly one bounty.
+
+    Webhook deliveries name the bounty themselves; fetched transactions only
+    know the vault, and a vault shared by several bounties stays ambiguous.
+    """
+    vaults = {(event.accounts or {}).get("vault_address") for event in events} - {None}
+    if not vaults:
+        return events
+    owners: dict[str, list[str]] = defaultdict(list)
+    for vault, bounty_id in (
+        await session.execute(select(Bounty.vault_address, Bounty.id).where(Bounty.vault_address.in_(vaults)))
+    ).all():
+        owners[vault].append(str(bounty_id))
+    attached = []
+    for event in events:
+        bounty_ids = owners.get((event.accounts or {}).get("vault_address"), [])
+        if len(bounty_ids) == 1:
+            event = event.model_copy(update={"accounts": {**event.accounts, "bounty_id": bounty_ids[0]}})
+        attached.append(event)
+    return attached
+
+
+async def backfill_program(session: AsyncSession, source: EventSource, program_id: str) -> int:
+    """Fetch and ingest the program's missing events; returns how many were stored."""
+    missing = await find_missing_signatures(session, source, program_id)
+    if not missing:
+        return 0
+    events = await attach_bounties(session, await source.fetch(program_id, missing))
+    return await ingest_solana_events(session, events)
+
+
+async def run_event_backfill() -> JobRun:
+    source = get_event_source()
+    if source is None:
+        return JobRun(rows=0)
+    async with SessionLocal() as session:
+        program_ids = settings.event_program_ids or list(
+            (await session.scalars(select(ProgramCheckpoint.program_id))).all()
+        )
+        backfilled = 0
+        for program_id in program_ids:
+            backfilled += await backfill_program(session, source, program_id)
+        return JobRun(rows=backfilled)
@@ -1,22 +1,28 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
 import uuid
+from datetime import datetime
+from typing import Any, Callable
 
 from fastapi import HTTPException, status
-from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy import Select, and_, func, literal, or_, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from cardpass.models.user import Job, JobStatus, RoleType, User
+from cardpass.core.security import Principal
+from cardpass.models.user import JOB_SEARCH_CONFIG, Job, JobStatus, JobVisibility, RoleType, User
 from cardpass.schemas.job import JobCreateRequest, JobListParams, JobUpdateRequest
 
 
-async def ensure_recruiter(user: User) -> None:
+async def ensure_recruiter(user: Principal) -> None:
     if not any(role.role == RoleType.recruiter for role in user.roles):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Recruiter role required")
 
 
-async def create_job(session: AsyncSession, owner: User, payload: JobCreateRequest) -> Job:
+async def create_job(session: AsyncSession, owner: Principal, payload: JobCreateRequest) -> Job:
     await ensure_recruiter(owner)
     job = Job(
         user_id=owner.id,
@@ -41,6 +47,35 @@ async def get_job_or_404(session: AsyncSession, job_id: uuid.UUID) -> Job:
     return job
 
 
+def _search_condition(params: JobListParams):
+    term = params.q.lower()
+    if params.search_mode == "fulltext":
+        return Job.search_vector.op("@@")(func.websearch_to_tsquery(JOB_SEARCH_CONFIG, params.q))
+    if params.search_mode == "fuzzy":
+        # "<%" is pg_trgm word similarity, served by the lower(...) trigram indexes
+        return or_(
+            literal(term).op("<%")(func.lower(Job.title)),
+            literal(term).op("<%")(func.lower(Job.description)),
+        )
+    like = f"%{term}%"
+    return or_(func.lower(Job.title).like(like), func.lower(Job.description).like(like))
+
+
+def _search_rank(params: JobListParams):
+    """Relevance expression for ranked search modes, or None when unranked."""
+    if not params.q:
+        return None
+    if params.search_mode == "fulltext":
+        return func.ts_rank_cd(Job.search_vector, func.websearch_to_tsquery(JOB_SEARCH_CONFIG, params.q))
+    if params.search_mode == "fuzzy":
+        term = params.q.lower()
+        return func.greatest(
+            func.word_similarity(term, func.lower(Job.title)),
+            func.word_similarity(term, func.lower(Job.description)),
+        )
+    return None
+
+
 def _apply_job_filters(stmt: Select, params: JobListParams) -> Select:
     conditions = []
     if params.status:
@@ -54,49 +89,152 @@ def _apply_job_filters(stmt: Select, params: JobListParams) -> Select:
     if params.tags:
         conditions.append(Job.tags.contains(params.tags))
     if params.q:
-        like = f"%{params.q.lower()}%"
-        conditions.append(or_(func.lower(Job.title).like(like), func.lower(Job.description).like(like)))
+        conditions.append(_search_condition(params))
 
     if conditions:
         stmt = stmt.where(and_(*conditions))
     return stmt
 
 
-def _apply_sort(stmt: Select, sort: str | None) -> Select:
-    if not sort:
-        return stmt.order_by(Job.created_at.desc())
-    orderings = []
-    for key in sort.split(","):
+# Non-nullable columns a keyset cursor can seek on, with the parser used to
+# turn the JSON-encoded cursor value back into a bind parameter.
+_CURSOR_FIELDS: dict[str, Callable[[Any], Any]] = {
+    "id": uuid.UUID,
+    "created_at": datetime.fromisoformat,
+    "updated_at": datetime.fromisoformat,
+    "title": str,
+    "status": JobStatus,
+    "visibility": JobVisibility,
+}
+
+# Upper bound for the filtered count used by total_mode="estimated".
+ESTIMATED_TOTAL_CAP = 10_000
+
+
+def _sort_keys(sort: str | None) -> list[tuple[str, bool]]:
+    keys: list[tuple[str, bool]] = []
+    for key in (sort or "").split(","):
         key = key.strip()
         if not key:
             continue
         desc = key.startswith("-")
         field = key[1:] if desc else key
-        column = getattr(Job, field, None)
-        if column is None:
+        if getattr(Job, field, None) is None:
             continue
+        keys.append((field, desc))
+    if not keys:
+        keys.append(("created_at", True))
+    # Tie-break on the primary key so page boundaries are deterministic.
+    if all(field != "id" for field, _ in keys):
+        keys.append(("id", keys[-1][1]))
+    return keys
+
+
+def _apply_sort(stmt: Select, sort: str | None) -> Select:
+    orderings = []
+    for field, desc in _sort_keys(sort):
+        column = getattr(Job, field)
         orderings.append(column.desc() if desc else column.asc())
-    if not orderings:
-        orderings.append(Job.created_at.desc())
     return stmt.order_by(*orderings)
 
 
+def _sort_signature(keys: list[tuple[str, bool]]) -> str:
+    return ",".join(f"-{field}" if desc else field for field, desc in keys)
+
+
+def _encode_cursor(keys: list[tuple[str, bool]], job: Job) -> str | None:
+    if any(field not in _CURSOR_FIELDS for field, _ in keys):
+        return None
+    values = []
+    for field, _ in keys:
+        value = getattr(job, field)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, (JobStatus, JobVisibility)):
+            value = value.value
+        elif isinstance(value, uuid.UUID):
+            value = str(value)
+        values.append(value)
+    raw = json.dumps({"s": _sort_signature(keys), "v": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(keys: list[tuple[str, bool]], cursor: str) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if data["s"] != _sort_signature(keys) or len(data["v"]) != len(keys):
+            raise ValueError("cursor does not match sort order")
+        return [_CURSOR_FIELDS[field](value) for (field, _), value in zip(keys, data["v"])]
+    except (binascii.Error, KeyError, TypeError, ValueError, UnicodeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+
+
+def _apply_keyset(stmt: Select, keys: list[tuple[str, bool]], values: list[Any]) -> Select:
+    columns = [getattr(Job, field) for field, _ in keys]
+    directions = {desc for _, desc in keys}
+    if len(directions) == 1:
+        # Uniform direction: a row comparison lets Postgres seek the composite index.
+        row = tuple_(*columns)
+        bound = tuple_(*(literal(value, column.type) for value, column in zip(values, columns)))
+        return stmt.where(row < bound if directions.pop() else row > bound)
+
+    clauses = []
+    for i, (column, (_, desc)) in enumerate(zip(columns, keys)):
+        prefix = [columns[j] == values[j] for j in range(i)]
+        clauses.append(and_(*prefix, column < values[i] if desc else column > values[i]))
+    return stmt.where(or_(*clauses))
+
+
+async def _count_jobs(session: AsyncSession, filtered_stmt: Select, total_mode: str) -> int | None:
+    if total_mode == "none":
+        return None
+    if total_mode == "estimated":
+        if filtered_stmt.whereclause is None:
+            estimate = await session.scalar(text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'jobs'::regclass"))
+            # reltuples is -1 until the table has been vacuumed or analyzed
+            if estimate is not None and estimate >= 0:
+                return int(estimate)
+        capped_stmt = select(func.count()).select_from(filtered_stmt.limit(ESTIMATED_TOTAL_CAP).subquery())
+        return await session.scalar(capped_stmt) or 0
+    total_stmt = select(func.count()).select_from(filtered_stmt.subquery())
+    return await session.scalar(total_stmt) or 0
+
+
 async def list_jobs(session: AsyncSession, params: JobListParams):
     base_stmt = select(Job)
     filtered_stmt = _apply_job_filters(base_stmt, params)
-    total_stmt = select(func.count()).select_from(filtered_stmt.subquery())
 
-    list_stmt = _apply_sort(filtered_stmt, params.sort)
-    list_stmt = list_stmt.offset((params.page - 1) * params.page_size).limit(params.page_size)
+    keys = _sort_keys(params.sort)
+    rank = _search_rank(params)
+    if rank is not None and not params.sort:
+        # Relevance ordering has no stable seek key, so it pages by offset only.
+        keys = [("rank", True)]
+        list_stmt = filtered_stmt.order_by(rank.desc(), Job.id.desc())
+    else:
+        list_stmt = _apply_sort(filtered_stmt, params.sort)
+    if params.cursor:
+        if any(field not in _CURSOR_FIELDS for field, _ in keys):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Sort order does not support cursors")
+        list_stmt = _apply_keyset(list_stmt, keys, _decode_cursor(keys, params.cursor))
+    else:
+        list_stmt = list_stmt.offset((params.page - 1) * params.page_size)
+    # Fetch one extra row to learn whether another page exists without counting.
+    list_stmt = list_stmt.limit(params.page_size + 1)
 
     result = await session.execute(list_stmt)
-    jobs = result.scalars().all()
+    jobs = list(result.scalars().all())
+
+    next_cursor = None
+    if len(jobs) > params.page_size:
+        jobs = jobs[: params.page_size]
+        next_cursor = _encode_cursor(keys, jobs[-1])
 
-    total = await session.scalar(total_stmt) or 0
-    return jobs, total
+    total = await _count_jobs(session, filtered_stmt, params.total_mode)
+    return jobs, total, next_cursor
 
 
-async def update_job(session: AsyncSession, owner: User, job: Job, payload: JobUpdateRequest) -> Job:
+async def update_job(session: AsyncSession, owner: Principal, job: Job, payload: JobUpdateRequest) -> Job:
     if job.user_id != owner.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only the owner may update the job")
     await ensure_recruiter(owner)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Any
+
+from sqlalchemy import delete, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cardpass.config.settings import settings
+from cardpass.core.periodic import JobRun
+from cardpass.db.session import SessionLocal
+from cardpass.db.partitions import (
+    add_months,
+    archive_monthly_partitions,
+    ensure_monthly_partitions,
+    try_partition_lock,
+)
+from cardpass.models.user import Nonce, OnChainEventSignature, RefreshToken
+
+
+async def _reap_in_batches(session: AsyncSession, model: Any, condition: Any, batch_size: int, max_batches: int) -> int:
+    """Delete rows matching ``condition`` in batches, committing after each one.
+
+    Each batch locks with SKIP LOCKED so several workers can reap concurrently.
+    """
+    reaped = 0
+    for _ in range(max_batches):
+        batch = select(model.id).where(condition).limit(batch_size).with_for_update(skip_locked=True).scalar_subquery()
+        result = await session.execute(delete(model).where(model.id.in_(batch)))
+        await session.commit()
+        deleted = result.rowcount or 0
+        reaped += deleted
+        if deleted < batch_size:
+            break
+    return reaped
+
+
+async def _expiry_lag(session: AsyncSession, column: Any) -> float:
+    """Seconds since the oldest row that is already expired but not yet reaped."""
+    now = datetime.now(timezone.utc)
+    oldest_expired = await session.scalar(select(func.min(column)).where(column < now))
+    return (now - oldest_expired).total_seconds() if oldest_expired else 0.0
+
+
+async def reap_nonces(session: AsyncSession, batch_size: int, max_batches: int) -> JobRun:
+    """Delete used or expired nonces in bounded batches."""
+    now = datetime.now(timezone.utc)
+    condition = or_(Nonce.used, Nonce.expires_at < now)
+    reaped = await _reap_in_batches(session, Nonce, condition, batch_size, max_batches)
+    return JobRun(rows=reaped, lag_seconds=await _expiry_lag(session, Nonce.expires_at))
+
+
+async def reap_refresh_tokens(session: AsyncSession, batch_size: int, max_batches: int) -> JobRun:
+    """Delete revoked or expired refresh tokens in bounded batches."""
+    now = datetime.now(timezone.utc)
+    condition = or_(RefreshToken.revoked, RefreshToken.expires_at < now)
+    reaped = await _reap_in_batches(session, RefreshToken, condition, batch_size, max_batches)
+    return JobRun(rows=reaped, lag_seconds=await _expiry_lag(session, RefreshToken.expires_at))
+
+
+async def refresh_token_table_stats(session: AsyncSession) -> dict[str, int]:
+    """Planner row estimate and on-disk sizes; avoids a full count over the table."""
+    row = (
+        await session.execute(
+            text(
+                "SELECT greatest(reltuples, 0)::bigint AS estimated_rows, "
+                "pg_total_relation_size(oid) AS total_bytes, "
+                "pg_indexes_size(oid) AS index_bytes "
+                "FROM pg_class WHERE oid = 'refresh_tokens'::regclass"
+            )
+        )
+    ).mappings().one()
+    return dict(row)
+
+
+async def run_nonce_reaper() -> JobRun:
+    async with SessionLocal() as session:
+        return await reap_nonces(session, settings.reaper_batch_size, settings.reaper_max_batches)
+
+
+async def run_refresh_token_reaper() -> JobRun:
+    async with SessionLocal() as session:
+        return await reap_refresh_tokens(session, settings.reaper_batch_size, settings.reaper_max_batches)
+
+
+async def _prune_signatures(session: AsyncSession, before: date, batch_size: int, max_batches: int) -> int:
+    """Drop dedup entries for archived months; a re-delivery that old is re-stored but applies nothing."""
+    pruned = 0
+    cutoff = datetime(before.year, before.month, 1, tzinfo=timezone.utc)
+    for _ in range(max_batches):
+        batch = (
+            select(OnChainEventSignature.signature)
+            .where(OnChainEventSignature.seen_at < cutoff)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await session.execute(
+            delete(OnChainEventSignature).where(OnChainEventSignature.signature.in_(batch))
+        )
+        await session.commit()
+        deleted = result.rowcount or 0
+        pruned += deleted
+        if deleted < batch_size:
+            break
+    return pruned
+
+
+async def maintain_event_partitions(session: AsyncSession) -> JobRun:
+    """Create upcoming ``onchain_events`` partitions and archive the ones past retention."""
+    if not await try_partition_lock(session):
+        await session.rollback()
+        return JobRun(rows=0)
+    today = datetime.now(timezone.utc).date()
+    created = await ensure_monthly_partitions(session, settings.event_partition_months_ahead, today)
+    await session.commit()
+    rows = len(created)
+    if settings.event_retention_months > 0:
+        archived, exported = await archive_monthly_partitions(
+            session, settings.event_retention_months, settings.event_archive_dir, today
+        )
+        rows += exported
+        if archived:
+            rows += await _prune_signatures(
+                session, add_months(archived[-1], 1), settings.reaper_batch_size, settings.reaper_max_batches
+            )
+    return JobRun(rows=rows)
+
+
+async def run_event_partition_maintenance() -> JobRun:
+    async with SessionLocal() as session:
+        return await maintain_event_partitions(session)
@@ -4,6 +4,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from cardpass.core.security import invalidate_principal
 from cardpass.models.user import Profile, User
 from cardpass.schemas.user import ProfileUpdateRequest
 
@@ -27,5 +28,6 @@ async def update_profile(session: AsyncSession, user: User, data: ProfileUpdateR
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(profile, field, value)
     await session.commit()
+    invalidate_principal(user.id)
     await session.refresh(profile)
     return profile
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, NamedTuple
+
+from cardpass.config.settings import settings
+from cardpass.db.session import SessionLocal
+from cardpass.schemas.webhook import SolanaWebhookEvent
+from cardpass.services.webhooks import ingest_solana_events
+
+logger = logging.getLogger(__name__)
+
+BatchHandler = Callable[[list[SolanaWebhookEvent]], Awaitable[int]]
+
+
+def _settle(stored: asyncio.Future, error: BaseException | None) -> bool:
+    """Resolve a delivery's future unless it already is; returns whether this call did."""
+    if stored.done():
+        return False
+    if error is None:
+        stored.set_result(None)
+    else:
+        stored.set_exception(error)
+    return True
+
+
+class QueueFull(Exception):
+    """Raised when accepting events would exceed the queue bound."""
+
+
+class QueueStopped(Exception):
+    """Raised for deliveries that were still queued when the queue shut down."""
+
+
+class _Delivery(NamedTuple):
+    events: list[SolanaWebhookEvent]
+    stored: asyncio.Future
+
+
+async def _ingest_batch(events: list[SolanaWebhookEvent]) -> int:
+    async with SessionLocal() as session:
+        return await ingest_solana_events(session, events)
+
+
+class WebhookQueue:
+    """Group commit between the webhook endpoint and batch ingestion workers.
+
+    ``submit`` either takes a whole delivery or rejects it, and returns a future
+    that resolves once the delivery's events are committed. Workers coalesce
+    queued deliveries into batches of about ``batch_size`` events and hand each
+    batch to ``handler`` in one call. A batch that still fails after
+    ``max_attempts`` is split and each delivery is tried once on its own, so
+    only a delivery that fails by itself, or one still queued at shutdown, has
+    its future failed; the endpoint then answers 503 and the provider
+    redelivers. Nothing is acknowledged before it is stored.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        batch_size: int,
+        workers: int,
+        max_attempts: int = 3,
+        handler: BatchHandler = _ingest_batch,
+    ) -> None:
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self._handler = handler
+        self._queue: asyncio.Queue[_Delivery] = asyncio.Queue()
+        self._queued_events = 0
+        self._tasks: list[asyncio.Task] = []
+        self.accepted = 0
+        self.rejected = 0
+        self.batches = 0
+        self.processed = 0
+        self.inserted = 0
+        self.duplicates = 0
+        self.retries = 0
+        self.failed = 0
+        self.last_batch_size = 0
+        self.last_batch_duration_seconds: float | None = None
+        self.last_error: str | None = None
+
+    def submit(self, events: list[SolanaWebhookEvent]) -> asyncio.Future:
+        room = self.maxsize - self._queued_events
+        if room < len(events):
+            self.rejected += len(events)
+            raise QueueFull(f"webhook queue has room for {room} events")
+        stored = asyncio.get_running_loop().create_future()
+        # The endpoint may have given up waiting; mark the outcome as seen either way.
+        stored.add_done_callback(lambda future: future.cancelled() or future.exception())
+        self._queue.put_nowait(_Delivery(events, stored))
+        self._queued_events += len(events)
+        self.accepted += len(events)
+        return stored
+
+    async def _next_batch(self) -> list[_Delivery]:
+        deliveries = [await self._queue.get()]
+        size = len(deliveries[0].events)
+        while size < self.batch_size and not self._queue.empty():
+            delivery = self._queue.get_nowait()
+            deliveries.append(delivery)
+            size += len(delivery.events)
+        return deliveries
+
+    async def _ingest(self, events: list[SolanaWebhookEvent], attempts: int) -> BaseException | None:
+        """Hand ``events`` to the handler, retrying with backoff; returns the last error if all tries fail."""
+        for attempt in range(1, attempts + 1):
+            try:
+                inserted = await self._handler(events)
+            except Exception as exc:  # noqa: BLE001 - retry, then report to the caller
+                self.last_error = repr(exc)
+                if attempt == attempts:
+                    return exc
+                self.retries += 1
+                await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+            else:
+                self.inserted += inserted
+                self.duplicates += len(events) - inserted
+                self.last_error = None
+                return None
+        return None
+
+    async def _process(self, deliveries: list[_Delivery]) -> None:
+        started = time.monotonic()
+        batch = [event for delivery in deliveries for event in delivery.events]
+        error = await self._ingest(batch, self.max_attempts)
+        if error is None:
+            for delivery in deliveries:
+                _settle(delivery.stored, None)
+        elif len(deliveries) == 1:
+            self._fail(deliveries[0], error)
+        else:
+            # One poison delivery must not fail the others it was merged with:
+            # give each its own transaction so only the bad one gets a 503.
+            logger.warning("Batch of %d deliveries failed (%r); retrying them one by one", len(deliveries), error)
+            for delivery in deliveries:
+                error = await self._ingest(delivery.events, 1)
+                if error is None:
+                    _settle(delivery.stored, None)
+                else:
+                    self._fail(delivery, error)
+        self.batches += 1
+        self.processed += len(batch)
+        self.last_batch_size = len(batch)
+        self.last_batch_duration_seconds = time.monotonic() - started
+
+    def _fail(self, delivery: _Delivery, error: BaseException) -> None:
+        self.failed += len(delivery.events)
+        logger.error("Failing webhook delivery of %d events: %r", len(delivery.events), error)
+        _settle(delivery.stored, error)
+
+    async def _worker(self) -> None:
+        while True:
+            deliveries = await self._next_batch()
+            try:
+                await self._process(deliveries)
+            finally:
+                for delivery in deliveries:
+                    # Cancelled mid-batch: the commit may or may not have happened, so the
+                    # provider has to redeliver; duplicates are dropped on insert.
+                    if _settle(delivery.stored, QueueStopped("webhook ingestion stopped")):
+                        self.failed += len(delivery.events)
+                    self._queued_events -= len(delivery.events)
+                    self._queue.task_done()
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"webhook-worker:{index}") for index in range(self.workers)
+        ]
+
+    async def stop(self, drain_timeout: float) -> None:
+        """Give queued events ``drain_timeout`` seconds to be ingested, then stop the workers.
+
+        Deliveries still queued after that are failed rather than acknowledged.
+        """
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Stopping with %d webhook events still queued; failing them", self._queued_events)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while not self._queue.empty():
+            delivery = self._queue.get_nowait()
+            _settle(delivery.stored, QueueStopped("webhook ingestion stopped"))
+            self.failed += len(delivery.events)
+            self._queued_events -= len(delivery.events)
+            self._queue.task_done()
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "queued": self._queued_events,
+            "maxsize": self.maxsize,
+            "workers": self.workers,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "retries": self.retries,
+            "failed": self.failed,
+            "last_batch_size": self.last_batch_size,
+            "last_batch_duration_seconds": self.last_batch_duration_seconds,
+            "last_error": self.last_error,
+        }
+
+
+webhook_queue = WebhookQueue(
+    maxsize=settings.webhook_queue_max_events,
+    batch_size=settings.webhook_batch_size,
+    workers=settings.webhook_workers,
+    max_attempts=settings.webhook_max_attempts,
+)
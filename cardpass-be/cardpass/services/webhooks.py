@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import hmac
+import logging
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
 
 from fastapi import HTTPException, Request, status
-from sqlalchemy import select
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cardpass.config.settings import settings
-from cardpass.models.user import Application, ApplicationStatus, Bounty, BountyStatus, OnChainEvent
+from cardpass.models.user import OnChainEvent, OnChainEventSignature
 from cardpass.schemas.webhook import SolanaWebhookEvent
-from cardpass.services.applications import get_application_or_404
-from cardpass.services.bounties import get_bounty_or_404, update_bounty_state
+from cardpass.services.event_decoding import LoggedTransaction, store_decoded_events, pg_safe
+
+logger = logging.getLogger(__name__)
 
 
 def verify_webhook_secret(request: Request) -> None:
@@ -25,59 +27,76 @@ def verify_webhook_secret(request: Request) -> None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook secret")
 
 
-async def _store_event(session: AsyncSession, event: SolanaWebhookEvent) -> tuple[OnChainEvent, bool]:
-    existing_stmt = select(OnChainEvent).where(OnChainEvent.signature == event.signature)
-    existing = (await session.execute(existing_stmt)).scalar_one_or_none()
-    if existing:
-        return existing, False
-
-    seen_at = datetime.now(timezone.utc)
-    block_time = datetime.fromtimestamp(event.blockTime, tz=timezone.utc) if event.blockTime else seen_at
-    record = OnChainEvent(
-        signature=event.signature,
-        program_id=event.programId,
-        type=event.type,
-        payload=event.model_dump(by_alias=True),
-        seen_at=block_time,
+def _event_row(event: SolanaWebhookEvent) -> dict:
+    block_time = (
+        datetime.fromtimestamp(event.blockTime, tz=timezone.utc) if event.blockTime else datetime.now(timezone.utc)
     )
-    session.add(record)
-    await session.commit()
-    await session.refresh(record)
-    return record, True
+    return {
+        "id": uuid.uuid4(),
+        "signature": event.signature,
+        "program_id": event.programId,
+        "type": event.type,
+        "payload": pg_safe(event.model_dump(by_alias=True)),
+        "seen_at": block_time,
+        "slot": event.slot,
+        # Left NULL: the event processor applies stored events in slot order.
+        "processed_at": None,
+    }
 
 
-async def handle_solana_event(session: AsyncSession, event: SolanaWebhookEvent) -> None:
-    record, is_new = await _store_event(session, event)
-    if not is_new:
-        # Already processed
-        return
-
-    bounty_id = _extract_uuid(event.accounts, "bounty_id") if event.accounts else None
-    application_id = _extract_uuid(event.accounts, "application_id") if event.accounts else None
-
-    if event.type == "VAULT_FUNDED" and bounty_id:
-        bounty = await get_bounty_or_404(session, bounty_id)
-        await update_bounty_state(session, bounty, BountyStatus.funded, event.signature)
-    elif event.type == "VAULT_RELEASED" and bounty_id:
-        bounty = await get_bounty_or_404(session, bounty_id)
-        await update_bounty_state(session, bounty, BountyStatus.released, event.signature)
-        if application_id:
-            application = await get_application_or_404(session, application_id)
-            application.status = ApplicationStatus.hired
-            await session.commit()
-    elif event.type == "PAYOUT" and bounty_id:
-        bounty = await get_bounty_or_404(session, bounty_id)
-        await update_bounty_state(session, bounty, BountyStatus.released, event.signature)
-    # If we reach here without specific handling we keep the stored event for manual review
-
-
-def _extract_uuid(data: Optional[dict], key: str) -> Optional[uuid.UUID]:
-    if not data:
-        return None
-    value = data.get(key) or data.get(key.replace("_", ""))
-    if not value:
-        return None
+async def _store_new_events(session: AsyncSession, events: list[SolanaWebhookEvent]) -> list[SolanaWebhookEvent]:
+    """Insert events whose signature was not seen before and return them.
+
+    The signature registry takes the dedup conflict in one statement; only the
+    winners are then appended to the partitioned event log.
+    """
+    by_signature: dict[str, SolanaWebhookEvent] = {}
+    for event in events:
+        by_signature.setdefault(event.signature, event)
+    rows = [_event_row(event) for event in by_signature.values()]
+    registered = set(
+        (
+            await session.scalars(
+                pg_insert(OnChainEventSignature)
+                .values([{"signature": row["signature"], "seen_at": row["seen_at"]} for row in rows])
+                .on_conflict_do_nothing(index_elements=[OnChainEventSignature.signature])
+                .returning(OnChainEventSignature.signature)
+            )
+        ).all()
+    )
+    new_rows = [row for row in rows if row["signature"] in registered]
+    if new_rows:
+        await session.execute(insert(OnChainEvent).values(new_rows))
+    return [event for signature, event in by_signature.items() if signature in registered]
+
+
+async def ingest_solana_events(session: AsyncSession, events: list[SolanaWebhookEvent]) -> int:
+    """Store a batch of events in a single transaction and return how many were new.
+
+    Redelivered signatures are dropped by the insert, so replays are no-ops.
+    State changes are left to ``process_pending_events``, which applies stored
+    events in (slot, signature) order whatever order they were delivered in.
+    Anchor events in the logs are decoded into ``program_events`` in a savepoint
+    of the same transaction: if decoding fails, the raw events are still stored
+    and can be decoded again later through ``/admin/events/decode``.
+    """
+    if not events:
+        return 0
     try:
-        return uuid.UUID(value)
-    except ValueError:
-        return None
+        new_events = await _store_new_events(session, events)
+        try:
+            async with session.begin_nested():
+                await store_decoded_events(
+                    session, [LoggedTransaction(event.signature, event.slot, event.logs) for event in new_events]
+                )
+        except Exception:  # noqa: BLE001 - raw ingestion must not depend on decoding
+            logger.exception("Decoding %d new events failed; stored them undecoded", len(new_events))
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    return len(new_events)
+
+
+async def handle_solana_event(session: AsyncSession, event: SolanaWebhookEvent) -> None:
+    await ingest_solana_events(session, [event])
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import re
+import struct
+from typing import Any, Callable, Iterable, NamedTuple, Optional
+
+import base58
+
+DISCRIMINATOR_SIZE = 8
+
+# Borsh primitives with a fixed width; consecutive ones are unpacked by a single struct call.
+_FIXED = {
+    "u8": "B",
+    "i8": "b",
+    "u16": "H",
+    "i16": "h",
+    "u32": "I",
+    "i32": "i",
+    "u64": "Q",
+    "i64": "q",
+    "f32": "f",
+    "f64": "d",
+    "bool": "?",
+    "pubkey": "32s",
+    "publicKey": "32s",
+}
+_WIDE = {"u128": False, "i128": True}
+
+_U32 = struct.Struct("<I")
+
+Reader = Callable[[bytes, int], tuple[Any, int]]
+
+
+class EventDecodeError(ValueError):
+    pass
+
+
+class DecodedEvent(NamedTuple):
+    program_id: Optional[str]
+    name: str
+    fields: dict[str, Any]
+    log_index: int
+
+
+def event_discriminator(name: str) -> bytes:
+    return hashlib.sha256(f"event:{name}".encode()).digest()[:DISCRIMINATOR_SIZE]
+
+
+def instruction_discriminator(name: str) -> bytes:
+    """Leading bytes of instruction data for the snake_case instruction ``name``."""
+    return hashlib.sha256(f"global:{name}".encode()).digest()[:DISCRIMINATOR_SIZE]
+
+
+def snake_case(name: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+
+
+def _defined_name(spec: Any) -> str:
+    # Anchor >= 0.30 wraps the name in an object, older IDLs use the bare string.
+    return spec["name"] if isinstance(spec, dict) else spec
+
+
+class _Compiler:
+    """Turns IDL type specs into readers, merging fixed-width runs into one ``struct.Struct``."""
+
+    def __init__(self, types: dict[str, dict]) -> None:
+        self._types = types
+        self._structs: dict[str, Reader] = {}
+
+    def fields(self, fields: list[dict]) -> Reader:
+        names = [snake_case(field["name"]) for field in fields]
+        steps: list[tuple[list[str], Reader]] = []
+        run_names: list[str] = []
+        run_formats: list[str] = []
+
+        def flush() -> None:
+            if run_names:
+                steps.append((list(run_names), self._fixed_run(run_formats)))
+                run_names.clear()
+                run_formats.clear()
+
+        for name, field in zip(names, fields):
+            spec = field["type"]
+            if isinstance(spec, str) and spec in _FIXED:
+                run_names.append(name)
+                run_formats.append(_FIXED[spec])
+                continue
+            flush()
+            steps.append(([name], self._single(self.type(spec))))
+        flush()
+
+        def read(buf: bytes, offset: int) -> tuple[dict[str, Any], int]:
+            values: dict[str, Any] = {}
+            for step_names, reader in steps:
+                decoded, offset = reader(buf, offset)
+                values.update(zip(step_names, decoded))
+            return values, offset
+
+        return read
+
+    @staticmethod
+    def _fixed_run(formats: list[str]) -> Reader:
+        layout = struct.Struct("<" + "".join(formats))
+        pubkeys = [index for index, fmt in enumerate(formats) if fmt == "32s"]
+
+        def read(buf: bytes, offset: int) -> tuple[list[Any], int]:
+            values = list(layout.unpack_from(buf, offset))
+            for index in pubkeys:
+                values[index] = base58.b58encode(values[index]).decode()
+            return values, offset + layout.size
+
+        return read
+
+    @staticmethod
+    def _single(reader: Reader) -> Reader:
+        def read(buf: bytes, offset: int) -> tuple[list[Any], int]:
+            value, offset = reader(buf, offset)
+            return [value], offset
+
+        return read
+
+    def type(self, spec: Any) -> Reader:
+        if isinstance(spec, str):
+            if spec in _FIXED:
+                run = self._fixed_run([_FIXED[spec]])
+
+                def read_fixed(buf: bytes, offset: int) -> tuple[Any, int]:
+                    values, offset = run(buf, offset)
+                    return values[0], offset
+
+                return read_fixed
+            if spec in _WIDE:
+                signed = _WIDE[spec]
+
+                def read_wide(buf: bytes, offset: int) -> tuple[int, int]:
+                    if offset + 16 > len(buf):
+                        raise IndexError("128-bit integer runs past the payload")
+                    return int.from_bytes(buf[offset : offset + 16], "little", signed=signed), offset + 16
+
+                return read_wide
+            if spec == "string":
+                return self._string
+            if spec == "bytes":
+                return self._bytes
+            raise EventDecodeError(f"unsupported IDL type {spec!r}")
+        if "option" in spec:
+            inner = self.type(spec["option"])
+
+            def read_option(buf: bytes, offset: int) -> tuple[Any, int]:
+                if buf[offset] == 0:
+                    return None, offset + 1
+                return inner(buf, offset + 1)
+
+            return read_option
+        if "vec" in spec:
+            inner = self.type(spec["vec"])
+
+            def read_vec(buf: bytes, offset: int) -> tuple[list[Any], int]:
+                (count,) = _U32.unpack_from(buf, offset)
+                offset += 4
+                items = []
+                for _ in range(count):
+                    item, offset = inner(buf, offset)
+                    items.append(item)
+                return items, offset
+
+            return read_vec
+        if "array" in spec:
+            element, length = spec["array"]
+            inner = self.type(element)
+
+            def read_array(buf: bytes, offset: int) -> tuple[list[Any], int]:
+                items = []
+                for _ in range(length):
+                    item, offset = inner(buf, offset)
+                    items.append(item)
+                return items, offset
+
+            return read_array
+        if "defined" in spec:
+            return self.defined(_defined_name(spec["defined"]))
+        raise EventDecodeError(f"unsupported IDL type {spec!r}")
+
+    def defined(self, name: str) -> Reader:
+        reader = self._structs.get(name)
+        if reader is None:
+            definition = self._types.get(name)
+            if definition is None or definition["type"].get("kind") != "struct":
+                raise EventDecodeError(f"IDL type {name!r} is not a struct")
+            reader = self.fields(definition["type"]["fields"])
+            self._structs[name] = reader
+        return reader
+
+    @staticmethod
+    def _string(buf: bytes, offset: int) -> tuple[str, int]:
+        (length,) = _U32.unpack_from(buf, offset)
+        start = offset + 4
+        if start + length > len(buf):
+            raise IndexError("string runs past the payload")
+        return buf[start : start + length].decode("utf-8"), start + length
+
+    @staticmethod
+    def _bytes(buf: bytes, offset: int) -> tuple[bytes, int]:
+        (length,) = _U32.unpack_from(buf, offset)
+        start = offset + 4
+        if start + length > len(buf):
+            raise IndexError("bytes run past the payload")
+        return bytes(buf[start : start + length]), start + length
+
+
+class _EventLayout(NamedTuple):
+    program_id: Optional[str]
+    name: str
+    read: Reader
+
+
+class EventDecoder:
+    """Decodes Anchor ``Program data:`` logs using layouts compiled once from IDLs.
+
+    Layouts are keyed by the 8-byte event discriminator, so each log costs one
+    dict lookup plus the precompiled unpacking.
+    """
+
+    def __init__(self, idls: Iterable[dict] = ()) -> None:
+        self._layouts: dict[bytes, _EventLayout] = {}
+        for idl in idls:
+            self.register_idl(idl)
+
+    def __len__(self) -> int:
+        return len(self._layouts)
+
+    def register_idl(self, idl: dict) -> None:
+        program_id = idl.get("address") or (idl.get("metadata") or {}).get("address")
+        types = {definition["name"]: definition for definition in idl.get("types", [])}
+        compiler = _Compiler(types)
+        for event in idl.get("events", []):
+            name = event["name"]
+            if "fields" in event:
+                read = compiler.fields(event["fields"])
+            else:
+                read = compiler.defined(name)
+            discriminator = bytes(event["discriminator"]) if "discriminator" in event else event_discriminator(name)
+            self._layouts[discriminator] = _EventLayout(program_id, name, read)
+
+    def decode(self, data: bytes, log_index: int = 0, program_id: Optional[str] = None) -> Optional[DecodedEvent]:
+        """Decode one event payload; None if its discriminator is not registered."""
+        layout = self._layouts.get(bytes(data[:DISCRIMINATOR_SIZE]))
+        if layout is None or (layout.program_id and program_id and layout.program_id != program_id):
+            return None
+        try:
+            fields, _ = layout.read(data, DISCRIMINATOR_SIZE)
+        except (struct.error, IndexError, UnicodeDecodeError) as exc:
+            raise EventDecodeError(f"malformed {layout.name} payload") from exc
+        return DecodedEvent(program_id or layout.program_id, layout.name, fields, log_index)
+
+    def decode_logs(self, logs: Optional[list[str]]) -> list[DecodedEvent]:
+        """Decode every registered event in a transaction's log messages.
+
+        The invoke/success lines are tracked so each event is attributed to the
+        program that emitted it, including events from CPI callees.
+        """
+        decoded: list[DecodedEvent] = []
+        stack: list[str] = []
+        for index, line in enumerate(logs or ()):
+            if line.startswith("Program data: "):
+                try:
+                    data = base64.b64decode(line[14:], validate=True)
+                except (binascii.Error, ValueError):
+                    continue
+                event = self.decode(data, index, stack[-1] if stack else None)
+                if event is not None:
+                    decoded.append(event)
+            elif line.startswith("Program "):
+                parts = line.split(" ")
+                if len(parts) >= 3 and parts[2] == "invoke":
+                    stack.append(parts[1])
+                elif len(parts) >= 3 and (parts[2] == "success" or parts[2].startswith("failed")) and stack:
+                    stack.pop()
+        return decoded
+
+    def decode_batch(self, log_batches: Iterable[Optional[list[str]]]) -> list[list[DecodedEvent]]:
+        return [self.decode_logs(logs) for logs in log_batches]
+
+
+def load_idl(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
@@ -0,0 +1,70 @@
+"""Event sections of the IDLs for the programs in Program_sequence.
+
+Kept in the Anchor >= 0.30 IDL shape so ``anchor build`` output for other
+programs can be loaded next to them via ``event_idl_paths``.
+"""
+from __future__ import annotations
+
+# programs/job-application/src/events.rs
+JOB_APPLICATION_IDL: dict = {
+    "address": "2qABiq2mqKPrp8H2eFqshFZ4EjTYMHPcmepnHD4TuwgN",
+    "metadata": {"name": "job_application"},
+    "events": [
+        {"name": "JobCreated"},
+        {"name": "ApplicationSubmitted"},
+        {"name": "ApplicationStatusUpdated"},
+        {"name": "ReferralLinkCreated"},
+    ],
+    "types": [
+        {
+            "name": "JobCreated",
+            "type": {
+                "kind": "struct",
+                "fields": [
+                    {"name": "job_id", "type": "pubkey"},
+                    {"name": "recruiter", "type": "pubkey"},
+                    {"name": "title", "type": "string"},
+                    {"name": "hiring_bounty", "type": "u64"},
+                    {"name": "created_at", "type": "i64"},
+                ],
+            },
+        },
+        {
+            "name": "ApplicationSubmitted",
+            "type": {
+                "kind": "struct",
+                "fields": [
+                    {"name": "applicant", "type": "pubkey"},
+                    {"name": "job", "type": "pubkey"},
+                    {"name": "referrer", "type": {"option": "pubkey"}},
+                    {"name": "applied_at", "type": "i64"},
+                ],
+            },
+        },
+        {
+            "name": "ApplicationStatusUpdated",
+            "type": {
+                "kind": "struct",
+                "fields": [
+                    {"name": "application", "type": "pubkey"},
+                    {"name": "new_status", "type": "string"},
+                    {"name": "updated_at", "type": "i64"},
+                ],
+            },
+        },
+        {
+            "name": "ReferralLinkCreated",
+            "type": {
+                "kind": "struct",
+                "fields": [
+                    {"name": "job", "type": "pubkey"},
+                    {"name": "referrer", "type": "pubkey"},
+                    {"name": "link_id", "type": "u64"},
+                    {"name": "created_at", "type": "i64"},
+                ],
+            },
+        },
+    ],
+}
+
+BUILTIN_IDLS = [JOB_APPLICATION_IDL]
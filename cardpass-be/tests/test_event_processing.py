@@ -0,0 +1,138 @@
+import asyncio
+import json
+import uuid
+
+import httpx
+from sqlalchemy.dialects import postgresql
+
+from cardpass.config.settings import settings
+from cardpass.models.user import ProgramCheckpoint
+from cardpass.schemas.webhook import SolanaWebhookEvent
+from cardpass.services import event_sources
+from cardpass.services.event_processor import ChainEvent, apply_events, fold_events
+from cardpass.services.event_sources import MemoryEventSource, RpcEventSource, backfill_program
+
+PROGRAM = "HQAgXyTzVkb7nPcULH8BbigDFR1Wc8mQWrG2Su3UeD9b"
+BOUNTY = uuid.UUID("00000000-0000-0000-0000-0000000000b1")
+APPLICATION = uuid.UUID("00000000-0000-0000-0000-0000000000a1")
+
+
+def _event(signature: str, slot: int, event_type: str, **accounts: str) -> ChainEvent:
+    return ChainEvent(signature, slot, PROGRAM, event_type, accounts or None)
+
+
+class _Result:
+    def __init__(self, rows=()) -> None:
+        self._rows = list(rows)
+
+    def all(self):
+        return self._rows
+
+
+class RecordingSession:
+    def __init__(self, checkpoint=None, known=(), vaults=()) -> None:
+        self.statements: list = []
+        self.checkpoint = checkpoint
+        self.known = list(known)
+        self.vaults = list(vaults)
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self.vaults)
+
+    async def scalars(self, statement):
+        self.statements.append(statement)
+        return _Result(self.known)
+
+    async def get(self, model, key):
+        return self.checkpoint
+
+    def sql(self) -> list[str]:
+        return [str(statement.compile(dialect=postgresql.dialect())) for statement in self.statements]
+
+
+def test_fold_events_keeps_the_latest_transition_per_bounty_whatever_the_delivery_order():
+    released = _event("sig-b", 20, "VAULT_RELEASED", bounty_id=str(BOUNTY), application_id=str(APPLICATION))
+    funded = _event("sig-a", 10, "VAULT_FUNDED", bounty_id=str(BOUNTY))
+    same_slot_earlier = _event("sig-0", 20, "VAULT_FUNDED", bounty_id=str(BOUNTY))
+    unknown = _event("sig-z", 30, "UNKNOWN", bounty_id=str(BOUNTY))
+
+    latest, hired = fold_events([unknown, released, same_slot_earlier, funded])
+
+    assert latest == {BOUNTY: released}
+    assert hired == {APPLICATION}
+
+
+def test_apply_events_updates_bounties_marks_processed_and_advances_the_checkpoint():
+    session = RecordingSession()
+    events = [
+        _event("sig-b", 20, "VAULT_RELEASED", bounty_id=str(BOUNTY)),
+        _event("sig-a", 10, "VAULT_FUNDED", bounty_id=str(BOUNTY)),
+    ]
+
+    assert asyncio.run(apply_events(session, events)) == 2
+
+    bounty_update, processed, checkpoint = session.sql()
+    assert bounty_update.startswith("UPDATE bounties")
+    # Only an event positioned after the one that last set the bounty may change it.
+    assert "(bounties.last_event_slot, bounties.last_event_signature) < (changes.slot, changes.signature)" in (
+        bounty_update
+    )
+    assert processed.startswith("UPDATE onchain_events SET processed_at=now()")
+    assert checkpoint.startswith("INSERT INTO program_checkpoints")
+    params = session.statements[2].compile(dialect=postgresql.dialect()).params
+    assert (params["last_slot_m0"], params["last_signature_m0"]) == (20, "sig-b")
+
+
+def test_backfill_fetches_the_oldest_missing_signatures_and_attaches_bounties(monkeypatch):
+    monkeypatch.setattr(settings, "event_backfill_lookback_slots", 10)
+    monkeypatch.setattr(settings, "event_backfill_max_signatures", 3)
+    source = MemoryEventSource(
+        [
+            SolanaWebhookEvent(
+                signature=f"sig-{slot}",
+                slot=slot,
+                programId=PROGRAM,
+                type="VAULT_FUNDED",
+                accounts={"vault_address": "vault-1"},
+            )
+            for slot in range(85, 110, 5)
+        ]
+    )
+    ingested: list = []
+
+    async def ingest(session, events):
+        ingested.extend(events)
+        return len(events)
+
+    monkeypatch.setattr(event_sources, "ingest_solana_events", ingest)
+    session = RecordingSession(
+        checkpoint=ProgramCheckpoint(program_id=PROGRAM, last_slot=100, last_signature="sig-100"),
+        known=["sig-90"],
+        vaults=[("vault-1", BOUNTY)],
+    )
+
+    assert asyncio.run(backfill_program(session, source, PROGRAM)) == 2
+
+    # Window starts at slot 90: the oldest three are 90, 95 and 100, of which 90 is already stored.
+    assert [event.signature for event in ingested] == ["sig-95", "sig-100"]
+    assert all(event.accounts["bounty_id"] == str(BOUNTY) for event in ingested)
+
+
+def test_rpc_source_pages_back_to_from_slot_and_keeps_the_oldest(monkeypatch):
+    monkeypatch.setattr(RpcEventSource, "_PAGE_SIZE", 2)
+    history = [{"signature": f"sig-{slot}", "slot": slot, "err": None} for slot in range(110, 80, -5)]
+    history[1]["err"] = {"InstructionError": [0, "Custom"]}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = json.loads(request.content)["params"][1]
+        start = 0
+        if "before" in params:
+            start = next(i for i, entry in enumerate(history) if entry["signature"] == params["before"]) + 1
+        return httpx.Response(200, json={"result": history[start : start + params["limit"]]})
+
+    source = RpcEventSource("http://rpc.local", concurrency=1, transport=httpx.MockTransport(handler))
+
+    listed = asyncio.run(source.signatures(PROGRAM, from_slot=90, limit=3))
+
+    assert listed == [("sig-90", 90), ("sig-95", 95), ("sig-100", 100)]